@@ -1,27 +1,86 @@
 """
-Benchmark : fait jouer les 4 stratégies IA entre elles.
+Benchmark : fait jouer les 5 stratégies IA entre elles.
 Collecte les résultats pour le tableau du rapport.
 """
+import argparse
+import random
+import re
 import time
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from othello import (
     TAILLE, VIDE, NOIR, BLANC,
-    creer_plateau, coups_valides, est_partie_finie,
+    creer_plateau, coups_valides, jouer_coup, est_partie_finie,
     compter_pions, gagnant, adversaire
 )
 from ia import (
-    IAOthello, jouer_coup_rapide, coups_valides_rapide,
-    STRAT_POSITIONNEL, STRAT_ABSOLU, STRAT_MOBILITE, STRAT_MIXTE, STRATEGIES
+    IAOthello, INF, jouer_coup_rapide, coups_valides_rapide,
+    STRAT_POSITIONNEL, STRAT_ABSOLU, STRAT_MOBILITE, STRAT_MIXTE, STRAT_MOTIFS, STRATEGIES,
+    PARALLELE_SMP, PARALLELE_RACINE, PARALLELE_FEUILLES, PARALLELISMES, ALGO_MCTS
 )
 
 
-def jouer_partie(strat_blanc, strat_noir, profondeur=6, temps_max=2.0, verbose=False):
-    """Joue une partie complète entre deux IA. Retourne (gagnant_couleur, score_blanc, score_noir, stats)."""
+# Nombre de coups aléatoires joués avant que les IA prennent la main
+NB_COUPS_OUVERTURE = 6
+
+_COLONNES = "abcdefgh"
+
+
+def notation(coup):
+    """Coup (ligne, colonne) en notation usuelle (« f5 »)."""
+    return f"{_COLONNES[coup[1]]}{coup[0] + 1}"
+
+
+def ouverture_aleatoire(graine, nb_coups=NB_COUPS_OUVERTURE):
+    """Retourne les nb_coups premiers coups d'une partie tirés au hasard.
+    La même graine redonne toujours la même ouverture."""
+    rng = random.Random(graine)
     plateau = creer_plateau()
-    ia_blanc = IAOthello(BLANC, profondeur_max=profondeur, temps_max=temps_max, strategie=strat_blanc)
-    ia_noir = IAOthello(NOIR, profondeur_max=profondeur, temps_max=temps_max, strategie=strat_noir)
+    joueur = BLANC
+    coups = []
+    for _ in range(nb_coups):
+        cv = coups_valides(plateau, joueur)
+        if not cv:
+            break
+        coup = rng.choice(cv)
+        plateau, _ = jouer_coup(plateau, coup[0], coup[1], joueur)
+        coups.append(coup)
+        joueur = adversaire(joueur)
+    return coups
+
+
+def charger_ouvertures(chemin):
+    """Lit un fichier d'ouvertures : une par ligne, en notation usuelle
+    (« f5 d6 c3 » ou « f5d6c3 »). Les lignes vides et commençant par #
+    sont ignorées."""
+    ouvertures = []
+    with open(chemin, encoding="utf-8") as f:
+        for ligne in f:
+            ligne = ligne.strip().lower()
+            if not ligne or ligne.startswith("#"):
+                continue
+            ouvertures.append([(int(r) - 1, _COLONNES.index(c))
+                               for c, r in re.findall(r"([a-h])([1-8])", ligne)])
+    return ouvertures
+
+
+def jouer_partie(strat_blanc, strat_noir, profondeur=6, temps_max=2.0, verbose=False,
+                 ouverture=(), options_blanc=None, options_noir=None):
+    """Joue une partie complète entre deux IA, après les coups imposés de
+    l'ouverture. options_blanc / options_noir : réglages supplémentaires
+    d'IAOthello. Retourne (gagnant_couleur, score_blanc, score_noir, stats)."""
+    plateau = creer_plateau()
+    ia_blanc = IAOthello(BLANC, profondeur_max=profondeur, temps_max=temps_max, strategie=strat_blanc,
+                         **(options_blanc or {}))
+    ia_noir = IAOthello(NOIR, profondeur_max=profondeur, temps_max=temps_max, strategie=strat_noir,
+                        **(options_noir or {}))
 
     joueur = BLANC
+    for l, c in ouverture:
+        plateau, _ = jouer_coup(plateau, l, c, joueur)
+        if plateau is None:
+            raise ValueError(f"ouverture invalide : {' '.join(map(notation, ouverture))}")
+        joueur = adversaire(joueur)
     total_noeuds_b, total_noeuds_n = 0, 0
     total_temps_b, total_temps_n = 0.0, 0.0
     total_coupes_b, total_coupes_n = 0, 0
@@ -48,7 +107,6 @@ def jouer_partie(strat_blanc, strat_noir, profondeur=6, temps_max=2.0, verbose=F
             continue
 
         # Jouer le coup
-        from othello import jouer_coup
         nouveau, _ = jouer_coup(plateau, coup[0], coup[1], joueur)
         if nouveau is None:
             break
@@ -88,12 +146,281 @@ def jouer_partie(strat_blanc, strat_noir, profondeur=6, temps_max=2.0, verbose=F
     return g, blancs, noirs, result_stats
 
 
-def main():
-    strats = [STRAT_POSITIONNEL, STRAT_ABSOLU, STRAT_MOBILITE, STRAT_MIXTE]
-    NB_PARTIES = 10  # 1 partie par paire
+def _partie_chronometree(strat_blanc, strat_noir, ouverture, profondeur, temps_max,
+                         options_blanc=None, options_noir=None):
+    """Joue une partie et y ajoute sa durée (tâche du tournoi parallèle)."""
+    t0 = time.time()
+    resultat = jouer_partie(strat_blanc, strat_noir, profondeur, temps_max,
+                            ouverture=ouverture, options_blanc=options_blanc,
+                            options_noir=options_noir)
+    return resultat + (time.time() - t0,)
+
+
+def resultats_tournoi(parties, profondeur, temps_max, jobs=1):
+    """Joue les parties [(strat_blanc, strat_noir, ouverture), ...] et produit leurs
+    résultats (gagnant, score_blanc, score_noir, stats, durée) dans l'ordre
+    de la liste, au fur et à mesure. Une partie peut ajouter
+    (options_blanc, options_noir) à son tuple (voir jouer_partie).
+
+    Avec jobs > 1, les parties sont réparties sur un pool de processus ; un
+    résultat arrivé en avance est conservé jusqu'à ce que tous les
+    précédents soient connus, pour un affichage identique à l'exécution
+    séquentielle."""
+    if jobs <= 1:
+        for partie in parties:
+            yield _partie_chronometree(*partie[:3], profondeur, temps_max, *partie[3:])
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executeur:
+        futures = {executeur.submit(_partie_chronometree, *partie[:3], profondeur, temps_max,
+                                    *partie[3:]): k
+                   for k, partie in enumerate(parties)}
+        en_avance = {}
+        suivant = 0
+        for future in as_completed(futures):
+            en_avance[futures[future]] = future.result()
+            while suivant in en_avance:
+                yield en_avance.pop(suivant)
+                suivant += 1
+
+
+def positions_de_test(nb_positions, graine=0, coups_min=10, coups_max=40):
+    """Génère des positions reproductibles en jouant des coups aléatoires
+    depuis la position initiale. Retourne une liste de (plateau, joueur)."""
+    rng = random.Random(graine)
+    positions = []
+    while len(positions) < nb_positions:
+        plateau = creer_plateau()
+        joueur = BLANC
+        for _ in range(rng.randint(coups_min, coups_max)):
+            cv = coups_valides_rapide(plateau, joueur)
+            if not cv:
+                joueur = adversaire(joueur)
+                cv = coups_valides_rapide(plateau, joueur)
+                if not cv:
+                    break
+            l, c = rng.choice(cv)
+            jouer_coup_rapide(plateau, l, c, joueur)
+            joueur = adversaire(joueur)
+        if len(coups_valides_rapide(plateau, joueur)) > 1:
+            positions.append((plateau, joueur))
+    return positions
+
+
+# Variantes de recherche comparées à profondeur fixe : (nom, options IAOthello)
+VARIANTES_PVS = [
+    ("Alpha-Beta", {'pvs': False, 'aspiration': False}),
+    ("PVS", {'pvs': True, 'aspiration': False}),
+    ("Aspiration", {'pvs': False, 'aspiration': True}),
+    ("PVS + Aspiration", {'pvs': True, 'aspiration': True}),
+]
+
+VARIANTES_TRI = [
+    ("Tri statique", {'tri_dynamique': False}),
+    ("Killers + hist.", {'tri_dynamique': True}),
+]
+
+VARIANTES_SYMETRIE = [
+    ("TT par orientation", {'tt_symetrique': False}),
+    ("TT canonique", {'tt_symetrique': True}),
+]
+
+# Variantes MCTS comparées à MCTS UCB1 seul, au même temps par coup
+MCTS_UCB1 = {'algorithme': ALGO_MCTS, 'mcts_rave': False, 'mcts_biais': None}
+VARIANTES_MCTS = [
+    ("RAVE", {**MCTS_UCB1, 'mcts_rave': True}),
+    ("Biais progressif", {**MCTS_UCB1, 'mcts_biais': STRAT_MOTIFS}),
+    ("Élargissement", {**MCTS_UCB1, 'mcts_elargissement': True}),
+    ("RAVE + biais", {**MCTS_UCB1, 'mcts_rave': True, 'mcts_biais': STRAT_MOTIFS}),
+    ("Les trois", {**MCTS_UCB1, 'mcts_rave': True, 'mcts_biais': STRAT_MOTIFS,
+                   'mcts_elargissement': True}),
+]
+
+# Plafond de la perte d'un coup MCTS : un coup perdant vaut près de -INF
+PERTE_MAX_MCTS = 2000
+
+
+def comparer_recherches(variantes, profondeur=6, nb_positions=10, strategie=STRAT_MIXTE,
+                        coups_min=10, coups_max=40):
+    """Compare le nombre de nœuds explorés par NegaMax à profondeur fixe
+    pour plusieurs réglages de la recherche."""
+    positions = positions_de_test(nb_positions, coups_min=coups_min, coups_max=coups_max)
+
+    print("=" * 60)
+    print(f"NŒUDS À PROFONDEUR FIXE ({profondeur}) — {nb_positions} positions, "
+          f"stratégie {STRATEGIES[strategie]}")
+    print("=" * 60)
+
+    reference = None
+    for nom, options in variantes:
+        noeuds, temps, coupes, coupes_premier = 0, 0.0, 0, 0
+        trouves, sondes = 0, 0
+        for plateau, joueur in positions:
+            ia = IAOthello(joueur, profondeur_max=profondeur, temps_max=float('inf'),
+                           strategie=strategie, **options)
+            ia.choisir_coup([ligne[:] for ligne in plateau])
+            st = ia.obtenir_stats()
+            noeuds += st['noeuds']
+            temps += st['temps']
+            coupes += st['coupes']
+            coupes_premier += st['coupes_premier_coup']
+            trouves += st['tt_trouves']
+            sondes += st['tt_trouves'] + st['tt_manques']
+        if reference is None:
+            reference = noeuds
+        print(f"{nom:>18s}: nœuds={noeuds:>10,d} ({100 * noeuds / reference:5.1f}%), "
+              f"coupes={coupes:,d} (1er coup: {100 * coupes_premier / max(coupes, 1):.1f}%), "
+              f"TT trouvées={100 * trouves / max(sondes, 1):.1f}%, temps={temps:.2f}s")
+
+
+def comparer_coups_mcts(variantes, reference=MCTS_UCB1, nb_positions=100, temps_max=0.5,
+                        profondeur=5, graine=0):
+    """Qualité des coups MCTS au même temps par coup, moins bruitée que
+    des parties : chaque coup légal des positions de test est noté par
+    NegaMax à profondeur fixe, et la perte d'un coup est l'écart entre le
+    meilleur score et le sien (plafonné à PERTE_MAX_MCTS)."""
+    positions = positions_de_test(nb_positions, graine=graine, coups_min=6, coups_max=44)
+    references = []
+    for plateau, joueur in positions:
+        ia = IAOthello(joueur, profondeur_max=profondeur, temps_max=float('inf'))
+        references.append({coup: ia.score_coup_racine([ligne[:] for ligne in plateau], coup,
+                                                      profondeur, -INF, INF)
+                           for coup in coups_valides(plateau, joueur)})
+
+    print("=" * 60)
+    print(f"PERTE DES COUPS MCTS — {temps_max:g}s par coup, {nb_positions} positions, "
+          f"référence NegaMax profondeur {profondeur}")
+    print("=" * 60)
+
+    for nom, options in [("UCB1", reference)] + variantes:
+        perte, meilleurs, iterations = 0, 0, 0
+        for (plateau, joueur), scores in zip(positions, references):
+            ia = IAOthello(joueur, temps_max=temps_max, **options)
+            coup = ia.choisir_coup([ligne[:] for ligne in plateau])
+            iterations += ia.stats['mcts_iterations']
+            meilleur = max(scores.values())
+            perte += min(meilleur - scores[coup], PERTE_MAX_MCTS)
+            meilleurs += scores[coup] == meilleur
+        print(f"{nom:>18s}: perte moyenne={perte / nb_positions:6.1f}, "
+              f"meilleur coup={100 * meilleurs / nb_positions:4.1f}%, "
+              f"itérations/coup={iterations / nb_positions:,.0f}", flush=True)
+
+
+def comparer_mcts(variantes, reference=MCTS_UCB1, nb_parties=10, temps_max=0.5, jobs=1,
+                  graine=0, nb_coups_ouverture=NB_COUPS_OUVERTURE):
+    """Fait jouer chaque variante MCTS contre la référence, au même temps
+    par coup : nb_parties ouvertures aléatoires (graines graine, graine + 1...),
+    chacune jouée avec les deux couleurs."""
+    ouvertures = [ouverture_aleatoire(graine + p, nb_coups_ouverture) for p in range(nb_parties)]
+
+    print("=" * 60)
+    print(f"MCTS CONTRE UCB1 — {temps_max:g}s par coup, {2 * nb_parties} parties par variante")
+    print("=" * 60)
+
+    for nom, options in variantes:
+        parties = []
+        for ouverture in ouvertures:
+            parties.append((STRAT_MIXTE, STRAT_MIXTE, ouverture, options, reference))
+            parties.append((STRAT_MIXTE, STRAT_MIXTE, ouverture, reference, options))
+        gagnees, nulles, ecart = 0, 0, 0
+        for k, (g, blancs, noirs, _, _) in enumerate(resultats_tournoi(parties, 0, temps_max, jobs)):
+            # Les parties paires donnent Blanc à la variante
+            couleur = BLANC if k % 2 == 0 else NOIR
+            if g == couleur:
+                gagnees += 1
+            elif g == VIDE:
+                nulles += 1
+            ecart += (blancs - noirs) if couleur == BLANC else (noirs - blancs)
+        perdues = len(parties) - gagnees - nulles
+        print(f"{nom:>18s}: {gagnees} gagnées, {nulles} nulles, {perdues} perdues "
+              f"({100 * (gagnees + nulles / 2) / len(parties):.0f}%), "
+              f"écart moyen {ecart / len(parties):+.1f} pions", flush=True)
+
+
+def comparer_parallele(parallelisme=PARALLELE_SMP, profondeur=7, nb_positions=6,
+                       nb_workers=(1, 2, 4), strategie=STRAT_MIXTE):
+    """Mesure l'accélération de la recherche parallèle : temps pour
+    atteindre la même profondeur avec 1, 2, 4... processus."""
+    positions = positions_de_test(nb_positions)
+
+    print("=" * 60)
+    print(f"{PARALLELISMES[parallelisme].upper()} — profondeur {profondeur}, "
+          f"{nb_positions} positions, stratégie {STRATEGIES[strategie]}")
+    print("=" * 60)
+
+    reference = None
+    for n in nb_workers:
+        # Une seule IA par réglage : les processus auxiliaires sont
+        # démarrés une fois, comme pendant une partie
+        ia = IAOthello(NOIR, profondeur_max=profondeur, temps_max=float('inf'),
+                       strategie=strategie, nb_workers=n, parallelisme=parallelisme)
+        noeuds, temps = 0, 0.0
+        for plateau, joueur in positions:
+            ia.couleur = joueur
+            ia.choisir_coup([ligne[:] for ligne in plateau])
+            st = ia.obtenir_stats()
+            noeuds += st['noeuds']
+            temps += st['temps']
+        ia.fermer()
+        if reference is None:
+            reference = temps
+        print(f"{n:>2d} processus: nœuds={noeuds:>10,d}, temps={temps:6.2f}s, "
+              f"accélération={reference / temps:.2f}x")
+
+
+def comparer_mcts_parallele(temps_max=1.0, nb_positions=6, nb_workers=(2, 4)):
+    """Débit du MCTS parallèle au même temps par coup : itérations de
+    l'arbre principal et simulations (tous processus) par seconde, en série
+    puis en parallélisme à la racine et aux feuilles."""
+    positions = positions_de_test(nb_positions, coups_min=10, coups_max=30)
+    reglages = [("Série", 1, PARALLELE_SMP)]
+    for n in nb_workers:
+        reglages += [(f"Racine, {n} proc.", n, PARALLELE_SMP),
+                     (f"Feuilles, {n} proc.", n, PARALLELE_FEUILLES)]
+
+    print("=" * 60)
+    print(f"MCTS PARALLÈLE — {temps_max:g}s par coup, {nb_positions} positions")
+    print("=" * 60)
+
+    for nom, n, parallelisme in reglages:
+        # Une seule IA par réglage : le pool est démarré une fois
+        ia = IAOthello(NOIR, temps_max=temps_max, nb_workers=n, parallelisme=parallelisme,
+                       mcts_reutilisation=False, **MCTS_UCB1)
+        iterations, simulations, temps = 0, 0, 0.0
+        for plateau, joueur in positions:
+            ia.couleur = joueur
+            ia.choisir_coup([ligne[:] for ligne in plateau])
+            iterations += ia.stats['profondeur_atteinte']
+            simulations += ia.stats['mcts_simulations']
+            temps += ia.stats['temps']
+        ia.fermer()
+        print(f"{nom:>18s}: itérations/s={iterations / temps:>8,.0f}, "
+              f"simulations/s={simulations / temps:>8,.0f}", flush=True)
+
+
+def main(jobs=1, graine=0, nb_coups_ouverture=NB_COUPS_OUVERTURE, fichier_ouvertures=None):
+    """Tournoi entre les 5 stratégies (dont motifs).
+
+    La partie p de chaque appariement part de l'ouverture p : tirée au
+    hasard avec la graine ``graine + p``, ou lue dans fichier_ouvertures.
+    Les appariements (A, B) et (B, A) jouent donc chaque ouverture avec
+    les couleurs inversées. Une partie se rejoue avec
+    ``jouer_partie(..., ouverture=ouverture_aleatoire(graine, nb_coups))``.
+    """
+    strats = [STRAT_POSITIONNEL, STRAT_ABSOLU, STRAT_MOBILITE, STRAT_MIXTE, STRAT_MOTIFS]
+    NB_PARTIES = 10  # Ouvertures par paire
     PROFONDEUR = 6
     TEMPS = 3.0
 
+    if fichier_ouvertures is not None:
+        ouvertures = charger_ouvertures(fichier_ouvertures)
+        NB_PARTIES = len(ouvertures)
+        origines = [f"ouverture {k + 1}" for k in range(NB_PARTIES)]
+    else:
+        ouvertures = [ouverture_aleatoire(graine + p, nb_coups_ouverture)
+                      for p in range(NB_PARTIES)]
+        origines = [f"graine {graine + p}" for p in range(NB_PARTIES)]
+
     # Matrice de victoires
     victoires = {s: {s2: 0 for s2 in strats} for s in strats}
     scores = {s: {s2: [] for s2 in strats} for s in strats}
@@ -101,38 +428,42 @@ def main():
     print("=" * 60)
     print("BENCHMARK IA OTHELLO — Confrontation des stratégies")
     print(f"Profondeur: {PROFONDEUR}, Temps max: {TEMPS}s, Parties par paire: {NB_PARTIES}")
+    if fichier_ouvertures is not None:
+        print(f"Ouvertures: {fichier_ouvertures}")
+    else:
+        print(f"Ouvertures: {nb_coups_ouverture} coups aléatoires, graines {graine} à "
+              f"{graine + NB_PARTIES - 1}")
     print("=" * 60)
 
     all_stats = {}
 
-    for i, s1 in enumerate(strats):
-        for j, s2 in enumerate(strats):
-            if i == j:
-                continue
+    appariements = [(s1, s2) for s1 in strats for s2 in strats if s1 != s2]
+    parties = [(s1, s2, ouverture) for s1, s2 in appariements for ouverture in ouvertures]
+    resultats = resultats_tournoi(parties, PROFONDEUR, TEMPS, jobs)
 
-            nom1 = STRATEGIES[s1]
-            nom2 = STRATEGIES[s2]
-            print(f"\n--- {nom1} (Blanc) vs {nom2} (Noir) ---")
+    for s1, s2 in appariements:
+        nom1 = STRATEGIES[s1]
+        nom2 = STRATEGIES[s2]
+        print(f"\n--- {nom1} (Blanc) vs {nom2} (Noir) ---")
 
-            for p in range(NB_PARTIES):
-                t0 = time.time()
-                g, blancs, noirs, st = jouer_partie(s1, s2, PROFONDEUR, TEMPS)
-                dt = time.time() - t0
+        for p in range(NB_PARTIES):
+            g, blancs, noirs, st, dt = next(resultats)
 
-                if g == BLANC:
-                    victoires[s1][s2] += 1
-                    res = f"{nom1} gagne"
-                elif g == NOIR:
-                    victoires[s2][s1] += 1
-                    res = f"{nom2} gagne"
-                else:
-                    res = "Nul"
+            if g == BLANC:
+                victoires[s1][s2] += 1
+                res = f"{nom1} gagne"
+            elif g == NOIR:
+                victoires[s2][s1] += 1
+                res = f"{nom2} gagne"
+            else:
+                res = "Nul"
 
-                scores[s1][s2].append((blancs, noirs))
-                print(f"  Partie {p+1}: {blancs}-{noirs} ({res}) [{dt:.1f}s]")
+            scores[s1][s2].append((blancs, noirs))
+            print(f"  Partie {p+1} ({origines[p]}): {blancs}-{noirs} ({res}) [{dt:.1f}s]",
+                  flush=True)
 
-                key = (s1, s2, p)
-                all_stats[key] = st
+            key = (s1, s2, p)
+            all_stats[key] = st
 
     # Résumé
     print("\n" + "=" * 60)
@@ -186,4 +517,50 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pvs", action="store_true",
+                        help="compare les nœuds explorés avec / sans PVS et aspiration")
+    parser.add_argument("--tri", action="store_true",
+                        help="compare les nœuds explorés avec / sans killers et historique")
+    parser.add_argument("--symetrie", action="store_true",
+                        help="compare la table de transposition avec / sans clés canoniques")
+    parser.add_argument("--smp", action="store_true",
+                        help="mesure l'accélération de la recherche Lazy SMP")
+    parser.add_argument("--racine", action="store_true",
+                        help="mesure l'accélération du partage de la racine")
+    parser.add_argument("--mcts", action="store_true",
+                        help="compare RAVE, biais et élargissement progressifs à MCTS UCB1 "
+                             "(perte par coup, puis parties)")
+    parser.add_argument("--mcts-parallele", action="store_true",
+                        help="mesure le débit du MCTS parallèle (racine, feuilles)")
+    parser.add_argument("--temps", type=float, default=0.5, metavar="S",
+                        help="temps par coup des parties MCTS (--mcts, --mcts-parallele)")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="nombre de parties du tournoi jouées en parallèle")
+    parser.add_argument("--graine", type=int, default=0,
+                        help="graine de la première ouverture aléatoire")
+    parser.add_argument("--coups-ouverture", type=int, default=NB_COUPS_OUVERTURE, metavar="N",
+                        help="nombre de coups aléatoires de chaque ouverture")
+    parser.add_argument("--ouvertures", metavar="FICHIER",
+                        help="fichier d'ouvertures (une par ligne, ex. « f5 d6 c3 »)")
+    args = parser.parse_args()
+
+    if args.pvs:
+        comparer_recherches(VARIANTES_PVS)
+    elif args.tri:
+        comparer_recherches(VARIANTES_TRI)
+    elif args.symetrie:
+        # Les transpositions symétriques sont surtout fréquentes en ouverture
+        comparer_recherches(VARIANTES_SYMETRIE, coups_min=2, coups_max=12)
+    elif args.smp:
+        comparer_parallele(PARALLELE_SMP)
+    elif args.racine:
+        comparer_parallele(PARALLELE_RACINE)
+    elif args.mcts_parallele:
+        comparer_mcts_parallele(temps_max=args.temps)
+    elif args.mcts:
+        comparer_coups_mcts(VARIANTES_MCTS, temps_max=args.temps, graine=args.graine)
+        comparer_mcts(VARIANTES_MCTS, temps_max=args.temps, jobs=args.jobs, graine=args.graine,
+                      nb_coups_ouverture=args.coups_ouverture)
+    else:
+        main(args.jobs, args.graine, args.coups_ouverture, args.ouvertures)
@@ -0,0 +1,434 @@
+"""
+Othello — Moteur bitboard
+=========================
+Représentation du plateau par deux entiers de 64 bits (un par couleur).
+La case (ligne, colonne) correspond au bit ``ligne * 8 + colonne``.
+
+Le « plateau binaire » manipulé par ce module est une liste mutable
+``[0, noirs, blancs]`` indexée directement par la couleur (NOIR = 1,
+BLANC = 2), ce qui permet d'écrire ``bb[joueur]`` sans table de
+correspondance.
+
+Les fonctions exposent la même interface que leurs homologues de ia.py
+(``coups_valides_rapide``, ``jouer_coup_rapide``, ``annuler_coup``) et
+peuvent donc être utilisées telles quelles par la recherche.
+"""
+
+import random
+import motifs
+from othello import TAILLE, VIDE, NOIR, BLANC, _rayon as _rayon_cases
+
+# ═══════════════════════════════════════════════════════════════
+# Constantes
+# ═══════════════════════════════════════════════════════════════
+
+PLEIN = 0xFFFFFFFFFFFFFFFF
+
+# Masque excluant les colonnes 0 et 7 : empêche un décalage horizontal
+# ou diagonal de « déborder » d'une ligne sur la suivante.
+_SANS_BORDS_H = 0x7E7E7E7E7E7E7E7E
+
+# (décalage, masque appliqué aux pions adverses) pour les 4 axes.
+# Chaque axe est parcouru dans les deux sens (décalage à gauche / à droite).
+_AXES = (
+    (1, _SANS_BORDS_H),   # horizontal
+    (8, PLEIN),           # vertical
+    (7, _SANS_BORDS_H),   # anti-diagonale
+    (9, _SANS_BORDS_H),   # diagonale
+)
+
+# Bit associé à chaque case et coup (ligne, colonne) associé à chaque bit
+BITS = [1 << i for i in range(TAILLE * TAILLE)]
+COUPS = [(i >> 3, i & 7) for i in range(TAILLE * TAILLE)]
+
+
+def _rayon(ligne, col, dl, dc):
+    """Masque des cases rencontrées depuis (ligne, col) dans la direction
+    (dl, dc) (othello._rayon)."""
+    return sum(BITS[l * TAILLE + c] for l, c in _rayon_cases(ligne, col, dl, dc))
+
+
+# Rayons de chaque case, séparés selon que les index de bits croissent
+# (directions droite / bas) ou décroissent. Un rayon de moins de deux cases
+# ne peut encadrer aucun pion : il est omis.
+_RAYONS_CROISSANTS = []
+_RAYONS_DECROISSANTS = []
+_VOISINS = []
+for _i in range(TAILLE * TAILLE):
+    _l, _c = _i >> 3, _i & 7
+    _croissants, _decroissants, _voisins = [], [], 0
+    for _dl, _dc in ((0, 1), (1, -1), (1, 0), (1, 1), (0, -1), (-1, 1), (-1, 0), (-1, -1)):
+        _r = _rayon(_l, _c, _dl, _dc)
+        if _r:
+            _voisins |= BITS[(_l + _dl) * TAILLE + _c + _dc]
+        if _r.bit_count() < 2:
+            continue
+        (_croissants if _dl * TAILLE + _dc > 0 else _decroissants).append(_r)
+    _RAYONS_CROISSANTS.append(tuple(_croissants))
+    _RAYONS_DECROISSANTS.append(tuple(_decroissants))
+    _VOISINS.append(_voisins)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Conversions depuis / vers le plateau en listes
+# ═══════════════════════════════════════════════════════════════
+
+def depuis_plateau(plateau):
+    """Convertit un plateau 8x8 (listes) en plateau binaire [0, noirs, blancs]."""
+    noirs = 0
+    blancs = 0
+    bit = 1
+    for ligne in plateau:
+        for case in ligne:
+            if case == NOIR:
+                noirs |= bit
+            elif case == BLANC:
+                blancs |= bit
+            bit <<= 1
+    return [0, noirs, blancs]
+
+
+def vers_plateau(bb):
+    """Convertit un plateau binaire en plateau 8x8 (listes)."""
+    noirs = bb[NOIR]
+    blancs = bb[BLANC]
+    plateau = []
+    for l in range(TAILLE):
+        ligne = []
+        for c in range(TAILLE):
+            bit = BITS[l * TAILLE + c]
+            if noirs & bit:
+                ligne.append(NOIR)
+            elif blancs & bit:
+                ligne.append(BLANC)
+            else:
+                ligne.append(VIDE)
+        plateau.append(ligne)
+    return plateau
+
+
+def copier_plateau(bb):
+    """Retourne une copie du plateau binaire."""
+    return bb[:]
+
+
+# ═══════════════════════════════════════════════════════════════
+# Génération des coups et retournements
+# ═══════════════════════════════════════════════════════════════
+
+def masque_coups(joueur_bits, adv_bits):
+    """Retourne le masque des cases jouables pour joueur_bits."""
+    vides = ~(joueur_bits | adv_bits) & PLEIN
+    coups = 0
+    for dec, masque in _AXES:
+        a = adv_bits & masque
+
+        t = a & (joueur_bits << dec)
+        t |= a & (t << dec)
+        t |= a & (t << dec)
+        t |= a & (t << dec)
+        t |= a & (t << dec)
+        t |= a & (t << dec)
+        coups |= t << dec
+
+        t = a & (joueur_bits >> dec)
+        t |= a & (t >> dec)
+        t |= a & (t >> dec)
+        t |= a & (t >> dec)
+        t |= a & (t >> dec)
+        t |= a & (t >> dec)
+        coups |= t >> dec
+
+    return coups & vides
+
+
+def peut_jouer(joueur_bits, adv_bits):
+    """Vrai si joueur_bits a au moins un coup : masque_coups arrêté au
+    premier axe qui en donne un."""
+    vides = ~(joueur_bits | adv_bits) & PLEIN
+    for dec, masque in _AXES:
+        a = adv_bits & masque
+
+        t = a & (joueur_bits << dec)
+        t |= a & (t << dec)
+        t |= a & (t << dec)
+        t |= a & (t << dec)
+        t |= a & (t << dec)
+        t |= a & (t << dec)
+        if t << dec & vides:
+            return True
+
+        t = a & (joueur_bits >> dec)
+        t |= a & (t >> dec)
+        t |= a & (t >> dec)
+        t |= a & (t >> dec)
+        t |= a & (t >> dec)
+        t |= a & (t >> dec)
+        if t >> dec & vides:
+            return True
+
+    return False
+
+
+def masque_voisins(bits):
+    """Retourne le masque des cases voisines (8 directions) des cases de bits."""
+    h = ((bits << 1) & _SANS_COL0) | ((bits >> 1) & _SANS_COL7)
+    ligne = bits | h
+    return (h | (ligne << 8) | (ligne >> 8)) & PLEIN
+
+
+def masque_retournements(bit, joueur_bits, adv_bits):
+    """Retourne le masque des pions retournés si joueur_bits pose sur bit.
+
+    Pour chaque rayon précalculé, la première case non adverse est isolée en
+    une opération ; si c'est un pion du joueur, les cases du rayon situées
+    avant elle sont retournées."""
+    i = bit.bit_length() - 1
+    if not _VOISINS[i] & adv_bits:
+        return 0
+    retournes = 0
+    for r in _RAYONS_CROISSANTS[i]:
+        x = r & ~adv_bits
+        b = x & -x  # Première case non adverse (bit le plus bas)
+        if b & joueur_bits:
+            retournes |= r & (b - 1)
+    for r in _RAYONS_DECROISSANTS[i]:
+        x = r & ~adv_bits
+        if x:
+            b = 1 << (x.bit_length() - 1)  # Première case non adverse (bit le plus haut)
+            if b & joueur_bits:
+                retournes |= r & -(b << 1)
+    return retournes
+
+
+def liste_coups(masque):
+    """Convertit un masque de cases en liste de coups (ligne, colonne)."""
+    coups = []
+    while masque:
+        b = masque & -masque
+        coups.append(COUPS[b.bit_length() - 1])
+        masque ^= b
+    return coups
+
+
+def coups_valides_rapide(bb, joueur):
+    """Équivalent bitboard de ia.coups_valides_rapide (même ordre de coups)."""
+    return liste_coups(masque_coups(bb[joueur], bb[3 - joueur]))
+
+
+def jouer_coup_rapide(bb, ligne, col, joueur):
+    """Joue un coup en place sur le plateau binaire.
+    Retourne le masque des pions retournés (pour annuler le coup),
+    ou None si le coup est invalide."""
+    bit = BITS[ligne * TAILLE + col]
+    adv = 3 - joueur
+    retournes = masque_retournements(bit, bb[joueur], bb[adv])
+    if not retournes:
+        return None
+    bb[joueur] |= retournes | bit
+    bb[adv] ^= retournes
+    return retournes
+
+
+def annuler_coup(bb, ligne, col, joueur, retournes):
+    """Annule un coup joué avec jouer_coup_rapide."""
+    bit = BITS[ligne * TAILLE + col]
+    bb[joueur] ^= retournes | bit
+    bb[3 - joueur] |= retournes
+
+
+def compter_pions(bb):
+    """Retourne le nombre de pions noirs et blancs."""
+    return bin(bb[NOIR]).count("1"), bin(bb[BLANC]).count("1")
+
+
+def compter_cases_vides(bb):
+    """Compte le nombre de cases vides."""
+    return 64 - bin(bb[NOIR] | bb[BLANC]).count("1")
+
+
+def est_partie_finie(bb):
+    """Vérifie si aucun des deux joueurs ne peut jouer."""
+    noirs, blancs = bb[NOIR], bb[BLANC]
+    return not peut_jouer(noirs, blancs) and not peut_jouer(blancs, noirs)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Stabilité
+# ═══════════════════════════════════════════════════════════════
+
+# Cases du bord : de l'autre côté, plus rien ne peut encadrer un pion
+_BORD_H = 0x8181818181818181  # colonnes 0 et 7 (axe horizontal)
+_BORD_V = 0xFF000000000000FF  # lignes 0 et 7 (axe vertical)
+_BORDS = _BORD_H | _BORD_V
+_SANS_COL0 = 0xFEFEFEFEFEFEFEFE
+_SANS_COL7 = 0x7F7F7F7F7F7F7F7F
+
+# Colonne 0 → octet (bit l = case (l, 0)), par multiplication magique
+_COLONNE_0 = 0x0101010101010101
+_MAGIQUE_COLONNE = 0x0102040810204080
+# Octet → colonne 0
+_OCTET_VERS_COLONNE = [sum(_COLONNE_0 & (0xFF << 8 * l) for l in range(TAILLE) if o >> l & 1)
+                       for o in range(256)]
+
+
+def _lignes(dl, dc):
+    """Masques des lignes complètes du plateau dans la direction (dl, dc)."""
+    lignes = []
+    for l in range(TAILLE):
+        for c in range(TAILLE):
+            if 0 <= l - dl < TAILLE and 0 <= c - dc < TAILLE:
+                continue  # Pas le début d'une ligne
+            lignes.append(BITS[l * TAILLE + c] | _rayon(l, c, dl, dc))
+    return tuple(lignes)
+
+
+_LIGNES_H = _lignes(0, 1)
+_LIGNES_V = _lignes(1, 0)
+_LIGNES_D7 = _lignes(1, -1)
+_LIGNES_D9 = _lignes(1, 1)
+
+
+def _table_stables_bord():
+    """Pions stables de chaque configuration d'un bord, index joueur << 8 | adv.
+    Sur un bord, les trois autres axes ont une extrémité hors du plateau :
+    un pion stable le long du bord est donc stable tout court. Les pions
+    instables d'un bord sont ceux des tables de motifs.py, la stabilité ne
+    dépendant pas de la couleur : joueur y est noir, adv blanc."""
+    table = [0] * (1 << 16)
+    for cases in motifs.CODE_LIGNE:
+        joueur = sum(1 << j for j in range(TAILLE) if cases[j] == NOIR)
+        adv = sum(1 << j for j in range(TAILLE) if cases[j] == BLANC)
+        table[joueur << 8 | adv] = (joueur | adv) & ~motifs._instables_bord(cases)
+    return table
+
+
+_STABLES_BORD = _table_stables_bord()
+
+
+def _colonne(bits, c):
+    """Octet de la colonne c (bit l = case (l, c))."""
+    return ((bits >> c & _COLONNE_0) * _MAGIQUE_COLONNE & PLEIN) >> 56
+
+
+def _lignes_pleines(occupes, lignes):
+    """Union des lignes entièrement occupées."""
+    pleines = 0
+    for m in lignes:
+        if occupes & m == m:
+            pleines |= m
+    return pleines
+
+
+def pions_stables(joueur_bits, adv_bits):
+    """Masque des pions de joueur_bits qu'aucune suite de coups ne peut retourner.
+
+    Les pions du bord sont lus dans une table exacte (_STABLES_BORD). Un pion
+    intérieur est stable si, sur chacun des 4 axes, sa ligne est pleine ou
+    l'un de ses deux voisins est un pion stable de sa couleur ; ces pions
+    sont ajoutés par propagation jusqu'à point fixe. Chaque pion trouvé est
+    réellement stable ; seuls quelques cas intérieurs rares échappent à la
+    propagation."""
+    occupes = joueur_bits | adv_bits
+    sur_h = _lignes_pleines(occupes, _LIGNES_H) | _BORD_H
+    sur_v = _lignes_pleines(occupes, _LIGNES_V) | _BORD_V
+    sur_d7 = _lignes_pleines(occupes, _LIGNES_D7) | _BORDS
+    sur_d9 = _lignes_pleines(occupes, _LIGNES_D9) | _BORDS
+
+    table = _STABLES_BORD
+    stable = (
+        table[(joueur_bits & 0xFF) << 8 | adv_bits & 0xFF] |
+        table[(joueur_bits >> 56) << 8 | adv_bits >> 56] << 56 |
+        _OCTET_VERS_COLONNE[table[_colonne(joueur_bits, 0) << 8 | _colonne(adv_bits, 0)]] |
+        _OCTET_VERS_COLONNE[table[_colonne(joueur_bits, 7) << 8 | _colonne(adv_bits, 7)]] << 7
+    ) & joueur_bits
+
+    candidats = joueur_bits & ~_BORDS
+    stable |= candidats & sur_h & sur_v & sur_d7 & sur_d9
+    while True:
+        nouveaux = candidats & ~stable
+        nouveaux &= sur_h | (stable << 1 & _SANS_COL0) | (stable >> 1 & _SANS_COL7)
+        nouveaux &= sur_v | stable << 8 | stable >> 8
+        nouveaux &= sur_d9 | (stable << 9 & _SANS_COL0) | (stable >> 9 & _SANS_COL7)
+        nouveaux &= sur_d7 | (stable << 7 & _SANS_COL7) | (stable >> 7 & _SANS_COL0)
+        if not nouveaux:
+            return stable
+        stable |= nouveaux
+
+
+# ═══════════════════════════════════════════════════════════════
+# Évaluation par motifs
+# ═══════════════════════════════════════════════════════════════
+
+def creer_evaluateur_motifs(poids):
+    """Équivalent bitboard de motifs.creer_evaluateur : retourne
+    score(noirs, blancs), le code ternaire de chaque ligne et colonne étant
+    lu octet par octet dans motifs.CODE_OCTET."""
+    somme = motifs._creer_somme(poids)
+    code = motifs.CODE_OCTET
+    colonne_0, magique = _COLONNE_0, _MAGIQUE_COLONNE
+
+    def score(noirs, blancs):
+        # Colonnes 0, 1, 7 et 6 ramenées en octet, comme _colonne
+        n0 = ((noirs & colonne_0) * magique & PLEIN) >> 56
+        b0 = ((blancs & colonne_0) * magique & PLEIN) >> 56
+        n1 = ((noirs >> 1 & colonne_0) * magique & PLEIN) >> 56
+        b1 = ((blancs >> 1 & colonne_0) * magique & PLEIN) >> 56
+        n7 = ((noirs >> 7 & colonne_0) * magique & PLEIN) >> 56
+        b7 = ((blancs >> 7 & colonne_0) * magique & PLEIN) >> 56
+        n6 = ((noirs >> 6 & colonne_0) * magique & PLEIN) >> 56
+        b6 = ((blancs >> 6 & colonne_0) * magique & PLEIN) >> 56
+        return somme(
+            code[noirs & 0xFF] + 2 * code[blancs & 0xFF],
+            code[noirs >> 8 & 0xFF] + 2 * code[blancs >> 8 & 0xFF],
+            code[noirs >> 16 & 0xFF] + 2 * code[blancs >> 16 & 0xFF],
+            code[noirs >> 56] + 2 * code[blancs >> 56],
+            code[noirs >> 48 & 0xFF] + 2 * code[blancs >> 48 & 0xFF],
+            code[noirs >> 40 & 0xFF] + 2 * code[blancs >> 40 & 0xFF],
+            code[n0] + 2 * code[b0],
+            code[n1] + 2 * code[b1],
+            code[n7] + 2 * code[b7],
+            code[n6] + 2 * code[b6],
+        )
+
+    return score
+
+
+# ═══════════════════════════════════════════════════════════════
+# Hachage de Zobrist
+# ═══════════════════════════════════════════════════════════════
+
+# Même tirage que ia.py (graine 42, même ordre) : un plateau binaire et
+# son équivalent en listes ont donc exactement le même hash.
+_rng = random.Random(42)
+_zobrist_table = [[_rng.getrandbits(64) for _ in range(3)]
+                  for _ in range(TAILLE * TAILLE)]
+_zobrist_joueur = _rng.getrandbits(64)
+del _rng
+
+_zobrist_retournement = [z[NOIR] ^ z[BLANC] for z in _zobrist_table]
+
+
+def zobrist_hash(bb, joueur):
+    """Calcule le hash Zobrist du plateau binaire."""
+    h = 0
+    for couleur in (NOIR, BLANC):
+        m = bb[couleur]
+        while m:
+            b = m & -m
+            h ^= _zobrist_table[b.bit_length() - 1][couleur]
+            m ^= b
+    if joueur == BLANC:
+        h ^= _zobrist_joueur
+    return h
+
+
+def delta_zobrist(ligne, col, joueur, retournes):
+    """Différence de hash (XOR) produite par un coup joué avec jouer_coup_rapide.
+    Le changement de joueur au trait n'est pas inclus."""
+    h = _zobrist_table[ligne * TAILLE + col][joueur]
+    while retournes:
+        b = retournes & -retournes
+        h ^= _zobrist_retournement[b.bit_length() - 1]
+        retournes ^= b
+    return h
@@ -0,0 +1,297 @@
+"""
+Othello IA — Solveur de fin de partie
+=====================================
+Recherche exacte dédiée aux dernières cases vides, sur bitboards :
+  - Évaluation réduite à la différence de pions (plus de mobilité,
+    stabilité ni frontières aux feuilles)
+  - Deux modes : score exact ou gain / nul / perte (fenêtre (-1, 1))
+  - Tri « fastest-first » : d'abord les coups qui laissent le moins de
+    coups à l'adversaire
+  - Tri par parité près des feuilles : d'abord les cases situées dans un
+    quadrant contenant un nombre impair de cases vides
+  - Chemin spécialisé pour les 1 à 3 dernières cases vides, sans
+    génération de coups (retournements calculés case par case)
+  - PVS et table de transposition (bornes + meilleur coup) loin des feuilles
+"""
+
+import time
+from bitboard import PLEIN, BITS, COUPS, masque_coups, masque_retournements
+
+# Modes de résolution
+FINALE_EXACTE = "exacte"
+FINALE_GAIN = "gain"  # gain / nul / perte
+
+MODES_FINALE = {
+    FINALE_EXACTE: "Score exact",
+    FINALE_GAIN: "Gain / Nul / Perte",
+}
+
+# Borne des scores de fin de partie (différence de pions)
+SCORE_MAX = 64
+
+# En dessous de ce nombre de cases vides, on abandonne le tri par mobilité
+# (trop coûteux) au profit du seul tri par parité
+SEUIL_PARITE = 6
+
+# Nombre de cases vides traitées par le chemin spécialisé sans génération de coups
+SEUIL_DERNIERES = 3
+
+# Nombre minimal de cases vides pour consulter la table de transposition
+SEUIL_TT = 8
+
+# Nombre maximal d'entrées de la table de transposition (vidée au-delà)
+TAILLE_TT_FINALE = 1 << 20
+
+# Quadrants 4x4 utilisés pour la parité
+QUADRANTS = (
+    0x000000000F0F0F0F,
+    0x00000000F0F0F0F0,
+    0x0F0F0F0F00000000,
+    0xF0F0F0F000000000,
+)
+
+# Quadrant de chaque case
+_QUADRANT_CASE = [next(q for q in QUADRANTS if q & BITS[i]) for i in range(64)]
+
+# Coins (pour départager le tri par mobilité)
+_COINS = BITS[0] | BITS[7] | BITS[56] | BITS[63]
+
+
+def _cases_par_parite(vides):
+    """Liste les cases vides (bits), celles des quadrants impairs en premier."""
+    impaires = []
+    paires = []
+    for q in QUADRANTS:
+        m = vides & q
+        if not m:
+            continue
+        liste = impaires if m.bit_count() & 1 else paires
+        while m:
+            b = m & -m
+            liste.append(b)
+            m ^= b
+    return impaires + paires
+
+
+class SolveurFinale:
+    """Résolution exacte d'une fin de partie sur bitboards."""
+
+    def __init__(self, mode=FINALE_EXACTE):
+        """
+        Args:
+            mode: FINALE_EXACTE (score exact) ou FINALE_GAIN (gain/nul/perte)
+        """
+        self.mode = mode
+        self.noeuds = 0
+        self.timeout = False
+        self.echeance = float('inf')
+        self._prochain_controle = 0
+        # Meilleur coup parmi les coups de la racine déjà résolus : seul
+        # résultat utilisable quand le temps manque
+        self.meilleur_partiel = None
+        # (joueur_bits, adv_bits) → (borne_inf, borne_sup, meilleur_bit)
+        self.table = {}
+
+    def resoudre(self, joueur_bits, adv_bits, echeance=float('inf')):
+        """Résout la position pour le joueur au trait.
+
+        Retourne (score, meilleur_coup) où score est la différence de pions
+        finale (en mode gain : -1, 0 ou 1) et meilleur_coup un (ligne, col),
+        ou None si le temps est écoulé avant la fin de la résolution ;
+        meilleur_partiel est alors le meilleur des coups résolus (ou None).
+        """
+        self.noeuds = 0
+        self.timeout = False
+        self.meilleur_partiel = None
+        self.echeance = echeance
+        self._prochain_controle = 0
+        if len(self.table) > TAILLE_TT_FINALE:
+            self.table.clear()
+
+        if self.mode == FINALE_GAIN:
+            alpha, beta = -1, 1
+        else:
+            alpha, beta = -SCORE_MAX - 1, SCORE_MAX + 1
+
+        coups = masque_coups(joueur_bits, adv_bits)
+        if not coups:
+            return None
+
+        vides = ~(joueur_bits | adv_bits) & PLEIN
+        meilleur_score = -SCORE_MAX - 1
+        meilleur_coup = None
+        for bit, f in self._ordonner(joueur_bits, adv_bits, coups):
+            j2, a2, v2 = adv_bits ^ f, joueur_bits | f | bit, vides ^ bit
+            if meilleur_coup is None:
+                score = -self._negamax(j2, a2, v2, -beta, -alpha)
+            else:
+                score = -self._negamax(j2, a2, v2, -alpha - 1, -alpha)
+                if alpha < score < beta:
+                    score = -self._negamax(j2, a2, v2, -beta, -score)
+            if self.timeout:
+                return None
+            if score > meilleur_score:
+                meilleur_score = score
+                meilleur_coup = COUPS[bit.bit_length() - 1]
+                self.meilleur_partiel = meilleur_coup
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if self.mode == FINALE_GAIN:
+            meilleur_score = (meilleur_score > 0) - (meilleur_score < 0)
+        return meilleur_score, meilleur_coup
+
+    # ─── Recherche ──────────────────────────────────────────
+
+    def _ordonner(self, j, a, coups, premier=0):
+        """Trie les coups (bit, retournements) : coup de la table en tête,
+        puis coins, fastest-first (mobilité adverse minimale) et parité."""
+        vides = ~(j | a) & PLEIN
+        tries = []
+        while coups:
+            bit = coups & -coups
+            coups ^= bit
+            f = masque_retournements(bit, j, a)
+            if bit == premier:
+                cle = -1000
+            else:
+                mob = masque_coups(a ^ f, j | f | bit).bit_count()
+                impair = (vides & _QUADRANT_CASE[bit.bit_length() - 1]).bit_count() & 1
+                cle = mob * 4 - impair * 2 - (1 if bit & _COINS else 0) * 8
+            tries.append((cle, bit, f))
+        tries.sort()
+        return [(bit, f) for _, bit, f in tries]
+
+    def _negamax(self, j, a, vides, alpha, beta):
+        """NegaMax alpha-beta (fail-soft) sur la différence de pions."""
+        self.noeuds += 1
+        if self.noeuds >= self._prochain_controle:
+            self._prochain_controle = self.noeuds + 2048
+            if time.time() > self.echeance:
+                self.timeout = True
+        if self.timeout:
+            return 0
+
+        n = vides.bit_count()
+        if n == 0:
+            return j.bit_count() - a.bit_count()
+        if n <= SEUIL_DERNIERES:
+            return self._dernieres(j, a, _cases_par_parite(vides), alpha, beta, False)
+        if n <= SEUIL_PARITE:
+            return self._parite(j, a, vides, alpha, beta, False)
+
+        coups = masque_coups(j, a)
+        if not coups:
+            if not masque_coups(a, j):
+                return j.bit_count() - a.bit_count()
+            return -self._negamax(a, j, vides, -beta, -alpha)
+
+        # Table de transposition : bornes connues sur le score exact
+        premier = 0
+        if n >= SEUIL_TT:
+            entree = self.table.get((j, a))
+            if entree is not None:
+                inf, sup, premier = entree
+                if inf >= beta:
+                    return inf
+                if sup <= alpha:
+                    return sup
+                if inf == sup:
+                    return inf
+            alpha_initial = alpha
+
+        meilleur = -SCORE_MAX - 1
+        meilleur_bit = 0
+        for bit, f in self._ordonner(j, a, coups, premier):
+            j2, a2, v2 = a ^ f, j | f | bit, vides ^ bit
+            if not meilleur_bit:
+                score = -self._negamax(j2, a2, v2, -beta, -alpha)
+            else:
+                # PVS : fenêtre nulle, re-recherche si le coup bat alpha
+                score = -self._negamax(j2, a2, v2, -alpha - 1, -alpha)
+                if alpha < score < beta:
+                    score = -self._negamax(j2, a2, v2, -beta, -score)
+            if score > meilleur:
+                meilleur = score
+                meilleur_bit = bit
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if n >= SEUIL_TT and not self.timeout:
+            inf, sup = -SCORE_MAX, SCORE_MAX
+            if entree is not None:
+                inf, sup = entree[0], entree[1]
+            if meilleur >= beta:
+                inf = max(inf, meilleur)
+            elif meilleur <= alpha_initial:
+                sup = min(sup, meilleur)
+            else:
+                inf = sup = meilleur
+            self.table[(j, a)] = (inf, sup, meilleur_bit)
+        return meilleur
+
+    def _parite(self, j, a, vides, alpha, beta, passe):
+        """Cases vides essayées dans l'ordre de parité, sans tri par mobilité."""
+        meilleur = -SCORE_MAX - 1
+        joue = False
+        for bit in _cases_par_parite(vides):
+            f = masque_retournements(bit, j, a)
+            if not f:
+                continue
+            joue = True
+            score = -self._negamax(a ^ f, j | f | bit, vides ^ bit, -beta, -alpha)
+            if score > meilleur:
+                meilleur = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        if joue:
+            return meilleur
+        if passe:
+            return j.bit_count() - a.bit_count()  # Personne ne peut jouer
+        return -self._parite(a, j, vides, -beta, -alpha, True)
+
+    def _dernieres(self, j, a, cases, alpha, beta, passe):
+        """Chemin spécialisé pour les 1 à 3 dernières cases vides."""
+        if len(cases) == 1:
+            return self._derniere(j, a, cases[0])
+
+        meilleur = -SCORE_MAX - 1
+        joue = False
+        for k, bit in enumerate(cases):
+            f = masque_retournements(bit, j, a)
+            if not f:
+                continue
+            joue = True
+            self.noeuds += 1
+            reste = cases[:k] + cases[k + 1:]
+            score = -self._dernieres(a ^ f, j | f | bit, reste, -beta, -alpha, False)
+            if score > meilleur:
+                meilleur = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        if joue:
+            return meilleur
+        if passe:
+            return j.bit_count() - a.bit_count()  # Personne ne peut jouer
+        return -self._dernieres(a, j, cases, -beta, -alpha, True)
+
+    def _derniere(self, j, a, bit):
+        """Score exact avec une seule case vide (le joueur, sinon l'adversaire, y joue)."""
+        nj = j.bit_count()
+        f = masque_retournements(bit, j, a)
+        if f:
+            n = f.bit_count()
+            return 2 * (nj + n) - 62  # (nj + n + 1) - (63 - nj - n - 1)
+        f = masque_retournements(bit, a, j)
+        if f:
+            n = f.bit_count()
+            return 2 * (nj - n) - 64  # (nj - n) - (63 - nj + n + 1)
+        return 2 * nj - 63  # nj - (63 - nj)
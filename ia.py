@@ -5,23 +5,40 @@ Techniques utilisées :
   - NegaMax avec élagage Alpha-Beta
   - Approfondissement itératif (Iterative Deepening)
   - Table de transposition (Zobrist hashing)
-  - Tri des coups (Move Ordering)
-  - Résolution exacte en fin de partie (Endgame Solver)
+  - Tri des coups (Move Ordering, coups killers, heuristique de l'historique)
+  - Résolution exacte en fin de partie (Endgame Solver dédié, finale.py)
+  - Livre d'ouvertures précalculé (livre.py)
   - Fonction d'évaluation multi-composantes :
       * Poids positionnels
       * Mobilité (coups du joueur vs adversaire)
-      * Stabilité des pions (pions impossibles à retourner)
+      * Stabilité des pions (pions impossibles à retourner, sur bitboards)
       * Occupation des coins
       * Pions frontières
       * Parité (qui joue en dernier)
   - Stratégies par phase (ouverture / milieu / fin de partie)
+  - Évaluation par motifs précalculés (bords, coins, motifs.py)
+  - Recherche parallèle sur plusieurs processus (parallele.py) :
+    Lazy SMP ou partage des coups de la racine
 """
 
+import functools
 import math
 import random
 import time
+from concurrent.futures import wait, FIRST_COMPLETED
+from types import SimpleNamespace
+import bitboard
+import motifs
+import plat
+import symetrie
+from finale import SolveurFinale, FINALE_EXACTE, FINALE_GAIN
+from transposition import (
+    TT_EXACT, TT_ALPHA, TT_BETA, TAILLE_TT_DEFAUT,
+    TableTransposition, TableTranspositionCompacte, TableTranspositionPartagee
+)
+from parallele import GroupeLazySMP, PoolRacine, PoolMCTS
 from othello import (
-    TAILLE, VIDE, NOIR, BLANC, DIRECTIONS,
+    TAILLE, VIDE, NOIR, BLANC, DIRECTIONS, RAYONS_CASES,
     adversaire, copier_plateau, est_sur_plateau,
     pions_a_retourner, coups_valides, jouer_coup,
     compter_pions, est_partie_finie
@@ -33,17 +50,63 @@ from othello import (
 
 INF = 1_000_000
 
+# Fenêtre nulle utilisée par PVS pour les coups hors variante principale
+FENETRE_NULLE = 1
+
+# Demi-largeur initiale de la fenêtre d'aspiration autour du score précédent
+FENETRE_ASPIRATION = 50
+
+# Seuils (en cases vides) du solveur de fin de partie : score exact en
+# dessous de SEUIL_FINALE, gain / nul / perte en dessous de SEUIL_GAIN
+SEUIL_FINALE = 14
+SEUIL_GAIN = 18
+
+# Part du temps par coup accordée au solveur ; s'il n'a pas fini, la
+# recherche heuristique dispose du temps restant
+FRACTION_TEMPS_FINALE = 0.5
+
+# Nombre maximal de nœuds de l'arbre MCTS conservé d'un coup à l'autre ;
+# une fois atteint, les itérations simulent depuis les feuilles sans
+# ajouter de nœud
+MCTS_MAX_NOEUDS = 200_000
+
+# Profondeur (en demi-coups, passes comprises) à laquelle on cherche, dans
+# l'arbre du coup précédent, la position sur laquelle l'IA doit jouer
+MCTS_PROFONDEUR_REUTILISATION = 3
+
+# Simulations de chaque tâche envoyée à un processus, en parallélisme aux
+# feuilles : assez pour amortir l'aller-retour entre processus
+MCTS_SIMULATIONS_FEUILLE = 32
+
+# RAVE : nombre de visites d'un coup pour lequel ses statistiques AMAF et
+# ses statistiques propres pèsent autant dans la sélection
+# (β = sqrt(K / (3 n + K)), Gelly et Silver)
+MCTS_RAVE_EQUIVALENCE = 100
+
+# Biais progressif : poids du terme H / (n + 1) ajouté à UCB1, H étant
+# l'écart entre l'évaluation statique du coup et celle des coups frères,
+# ramené dans [-1, 1]
+MCTS_POIDS_BIAIS = 6.0
+
+# Élargissement progressif : un nœud visité n fois ne choisit que parmi
+# ses MCTS_ELARGISSEMENT_C * n ** MCTS_ELARGISSEMENT_ALPHA premiers enfants
+# (arrondi au-dessus), triés par évaluation statique
+MCTS_ELARGISSEMENT_C = 1.5
+MCTS_ELARGISSEMENT_ALPHA = 0.5
+
 # Stratégies d'évaluation disponibles
 STRAT_POSITIONNEL = "positionnel"
 STRAT_ABSOLU = "absolu"
 STRAT_MOBILITE = "mobilite"
 STRAT_MIXTE = "mixte"
+STRAT_MOTIFS = "motifs"
 
 STRATEGIES = {
     STRAT_POSITIONNEL: "Positionnelle",
     STRAT_ABSOLU: "Absolue",
     STRAT_MOBILITE: "Mobilité",
     STRAT_MIXTE: "Mixte",
+    STRAT_MOTIFS: "Motifs",
 }
 
 # Algorithmes de recherche disponibles
@@ -57,6 +120,30 @@ ALGORITHMES = {
     ALGO_MCTS: "MCTS",
 }
 
+# Représentations du plateau utilisables par la recherche
+MOTEUR_LISTE = "liste"
+MOTEUR_BITBOARD = "bitboard"
+MOTEUR_PLAT = "plat"
+MOTEUR_INCREMENTAL = "incremental"
+
+MOTEURS = {
+    MOTEUR_LISTE: "Listes 8x8",
+    MOTEUR_BITBOARD: "Bitboards",
+    MOTEUR_PLAT: "Plateau plat (64 cases)",
+    MOTEUR_INCREMENTAL: "Listes 8x8 + état incrémental",
+}
+
+# Modes de recherche parallèle (nb_workers > 1)
+PARALLELE_SMP = "smp"
+PARALLELE_RACINE = "racine"
+PARALLELE_FEUILLES = "feuilles"
+
+PARALLELISMES = {
+    PARALLELE_SMP: "Lazy SMP (table partagée)",
+    PARALLELE_RACINE: "Partage de la racine",
+    PARALLELE_FEUILLES: "Simulations des feuilles (MCTS)",
+}
+
 # Table de poids positionnels classique pour Othello 8x8
 # Les coins valent beaucoup, les cases adjacentes aux coins (X/C) sont dangereuses
 POIDS_POSITION = [
@@ -108,6 +195,11 @@ _zobrist_table = [[[random.getrandbits(64) for _ in range(3)]
                    for _ in range(TAILLE)] for _ in range(TAILLE)]
 _zobrist_joueur = random.getrandbits(64)
 
+# Retourner un pion fait passer sa case de NOIR à BLANC (ou l'inverse) :
+# la mise à jour du hash est la même dans les deux sens.
+_zobrist_retournement = [[_zobrist_table[l][c][NOIR] ^ _zobrist_table[l][c][BLANC]
+                          for c in range(TAILLE)] for l in range(TAILLE)]
+
 
 def zobrist_hash(plateau, joueur):
     """Calcule le hash Zobrist du plateau."""
@@ -121,6 +213,16 @@ def zobrist_hash(plateau, joueur):
     return h
 
 
+def delta_zobrist(ligne, col, joueur, pions_retournes):
+    """Différence de hash (XOR) produite par un coup joué avec jouer_coup_rapide.
+    Appliquer le même delta après annuler_coup restaure le hash d'origine.
+    Le changement de joueur au trait (_zobrist_joueur) n'est pas inclus."""
+    h = _zobrist_table[ligne][col][joueur]
+    for l, c in pions_retournes:
+        h ^= _zobrist_retournement[l][c]
+    return h
+
+
 # ═══════════════════════════════════════════════════════════════
 # Fonctions utilitaires rapides
 # ═══════════════════════════════════════════════════════════════
@@ -131,15 +233,17 @@ def jouer_coup_rapide(plateau, ligne, col, joueur):
     adv = adversaire(joueur)
     pions = []
 
-    for dl, dc in DIRECTIONS:
-        l, c = ligne + dl, col + dc
-        pions_dir = []
-        while 0 <= l < TAILLE and 0 <= c < TAILLE and plateau[l][c] == adv:
-            pions_dir.append((l, c))
-            l += dl
-            c += dc
-        if pions_dir and 0 <= l < TAILLE and 0 <= c < TAILLE and plateau[l][c] == joueur:
-            pions.extend(pions_dir)
+    for rayon in RAYONS_CASES[ligne][col]:
+        l, c = rayon[0]
+        if plateau[l][c] != adv:
+            continue
+        for k in range(1, len(rayon)):
+            l, c = rayon[k]
+            case = plateau[l][c]
+            if case != adv:
+                if case == joueur:
+                    pions.extend(rayon[:k])
+                break
 
     if not pions:
         return None
@@ -163,30 +267,306 @@ def coups_valides_rapide(plateau, joueur):
     adv = adversaire(joueur)
     coups = []
     for l in range(TAILLE):
+        ligne = plateau[l]
+        rayons_ligne = RAYONS_CASES[l]
         for c in range(TAILLE):
-            if plateau[l][c] != VIDE:
+            if ligne[c] != VIDE:
                 continue
-            valide = False
-            for dl, dc in DIRECTIONS:
-                ll, cc = l + dl, c + dc
-                found = False
-                while 0 <= ll < TAILLE and 0 <= cc < TAILLE and plateau[ll][cc] == adv:
-                    ll += dl
-                    cc += dc
-                    found = True
-                if found and 0 <= ll < TAILLE and 0 <= cc < TAILLE and plateau[ll][cc] == joueur:
-                    valide = True
+            for rayon in rayons_ligne[c]:
+                ll, cc = rayon[0]
+                if plateau[ll][cc] != adv:
+                    continue
+                for k in range(1, len(rayon)):
+                    ll, cc = rayon[k]
+                    case = plateau[ll][cc]
+                    if case != adv:
+                        break
+                if case == joueur:
+                    coups.append((l, c))
                     break
-            if valide:
-                coups.append((l, c))
     return coups
 
 
+def peut_jouer(plateau, joueur):
+    """Vrai si le joueur a au moins un coup : coups_valides_rapide arrêté
+    au premier coup trouvé."""
+    adv = adversaire(joueur)
+    for l in range(TAILLE):
+        ligne = plateau[l]
+        rayons_ligne = RAYONS_CASES[l]
+        for c in range(TAILLE):
+            if ligne[c] != VIDE:
+                continue
+            for rayon in rayons_ligne[c]:
+                ll, cc = rayon[0]
+                if plateau[ll][cc] != adv:
+                    continue
+                for k in range(1, len(rayon)):
+                    ll, cc = rayon[k]
+                    case = plateau[ll][cc]
+                    if case != adv:
+                        break
+                if case == joueur:
+                    return True
+    return False
+
+
+def partie_bloquee(plateau):
+    """Vrai si aucun des deux joueurs ne peut jouer (partie terminée)."""
+    return not peut_jouer(plateau, NOIR) and not peut_jouer(plateau, BLANC)
+
+
 def compter_cases_vides(plateau):
     """Compte le nombre de cases vides."""
     return sum(1 for l in range(TAILLE) for c in range(TAILLE) if plateau[l][c] == VIDE)
 
 
+# ═══════════════════════════════════════════════════════════════
+# État de recherche incrémental
+# ═══════════════════════════════════════════════════════════════
+
+# Coin associé à chaque case X / C (None ailleurs), et cases X / C de chaque coin
+_COIN_DE_CASE = [[None] * TAILLE for _ in range(TAILLE)]
+_ADJACENTES_COIN = [[()] * TAILLE for _ in range(TAILLE)]
+for _coin, _cases in COIN_ADJACENTES.items():
+    _ADJACENTES_COIN[_coin[0]][_coin[1]] = tuple(_cases)
+    for _l, _c in _cases:
+        _COIN_DE_CASE[_l][_c] = _coin
+
+# Voisins (index plats) de chaque case
+_VOISINS = [[(l + dl) * TAILLE + c + dc for dl, dc in DIRECTIONS
+             if 0 <= l + dl < TAILLE and 0 <= c + dc < TAILLE]
+            for l in range(TAILLE) for c in range(TAILLE)]
+
+
+class EtatRecherche(list):
+    """Plateau 8x8 (liste de lignes, lisible tel quel par les fonctions
+    d'évaluation) accompagné de valeurs tenues à jour par différences à
+    chaque coup joué / annulé, au lieu d'être recalculées à chaque nœud :
+      - pions[couleur] : nombre de pions
+      - vides : nombre de cases vides
+      - bits[couleur] : pions en bitboard (comme bitboard.depuis_plateau)
+      - position[couleur] : somme des poids positionnels des pions, cases
+        X / C ajustées selon le propriétaire du coin (eval_positionnelle)
+      - frontiere : index plats des pions frontières (adjacents à une case
+        vide), frontieres[couleur] leur nombre par couleur
+    """
+
+    def __init__(self, plateau):
+        super().__init__(ligne[:] for ligne in plateau)
+        noirs, blancs = compter_pions(self)
+        self.pions = [0, noirs, blancs]
+        self.vides = TAILLE * TAILLE - noirs - blancs
+        self.bits = bitboard.depuis_plateau(self)
+        self.position = [0, 0, 0]
+        self.frontiere = set()
+        self.frontieres = [0, 0, 0]
+        # Nombre de cases vides autour de chaque case
+        self.voisins_vides = [sum(1 for j in voisins if self[j // TAILLE][j % TAILLE] == VIDE)
+                              for voisins in _VOISINS]
+        for l in range(TAILLE):
+            for c in range(TAILLE):
+                couleur = self[l][c]
+                if couleur == VIDE:
+                    continue
+                self.position[couleur] += self._poids(l, c, couleur)
+                if self.voisins_vides[l * TAILLE + c]:
+                    self.frontiere.add(l * TAILLE + c)
+                    self.frontieres[couleur] += 1
+        # Valeurs à restaurer à l'annulation de chaque coup joué
+        self._pile = []
+
+    def _poids(self, l, c, couleur):
+        """Poids positionnel d'un pion de cette couleur en (l, c)."""
+        poids = POIDS_POSITION[l][c]
+        coin = _COIN_DE_CASE[l][c]
+        if coin is not None and self[coin[0]][coin[1]] == couleur:
+            return abs(poids)
+        return poids
+
+    def jouer(self, ligne, col, joueur, pions):
+        """Met l'état à jour après jouer_coup_rapide (pions : cases retournées)."""
+        adv = 3 - joueur
+        position = self.position
+        frontiere = self.frontiere
+        frontieres = self.frontieres
+        sauvegarde = (position[NOIR], position[BLANC], frontieres[NOIR], frontieres[BLANC])
+
+        n = len(pions)
+        self.pions[joueur] += n + 1
+        self.pions[adv] -= n
+        self.vides -= 1
+        retournes = 0
+        for l, c in pions:
+            retournes |= 1 << (l * TAILLE + c)
+        self.bits[joueur] |= retournes | 1 << (ligne * TAILLE + col)
+        self.bits[adv] ^= retournes
+
+        # Poids positionnels : le pion posé, puis les pions retournés. Le
+        # coin d'une case X / C retournée est inchangé, sauf s'il vient
+        # d'être pris (il était vide avant le coup)
+        position[joueur] += self._poids(ligne, col, joueur)
+        for l, c in pions:
+            poids = POIDS_POSITION[l][c]
+            coin = _COIN_DE_CASE[l][c]
+            if coin is None:
+                position[joueur] += poids
+                position[adv] -= poids
+            else:
+                proprietaire = self[coin[0]][coin[1]]
+                position[adv] -= abs(poids) if proprietaire == adv else poids
+                position[joueur] += abs(poids) if proprietaire == joueur else poids
+            if l * TAILLE + c in frontiere:
+                frontieres[joueur] += 1
+                frontieres[adv] -= 1
+        # Coin pris : ses cases X / C déjà au joueur ne sont plus pénalisées
+        for l, c in _ADJACENTES_COIN[ligne][col]:
+            if self[l][c] == joueur and (l, c) not in pions:
+                position[joueur] += abs(POIDS_POSITION[l][c]) - POIDS_POSITION[l][c]
+
+        # Frontières : la case jouée n'est plus vide pour ses voisins
+        i = ligne * TAILLE + col
+        voisins_vides = self.voisins_vides
+        retires = []
+        for j in _VOISINS[i]:
+            voisins_vides[j] -= 1
+            if not voisins_vides[j] and j in frontiere:
+                frontiere.discard(j)
+                retires.append(j)
+                frontieres[self[j // TAILLE][j % TAILLE]] -= 1
+        if voisins_vides[i]:
+            frontiere.add(i)
+            frontieres[joueur] += 1
+
+        self._pile.append((sauvegarde, retires, retournes))
+
+    def annuler(self, ligne, col, joueur, pions):
+        """Restaure l'état après annuler_coup."""
+        n = len(pions)
+        self.pions[joueur] -= n + 1
+        self.pions[3 - joueur] += n
+        self.vides += 1
+
+        sauvegarde, retires, retournes = self._pile.pop()
+        self.bits[joueur] ^= retournes | 1 << (ligne * TAILLE + col)
+        self.bits[3 - joueur] |= retournes
+        self.position[NOIR], self.position[BLANC], \
+            self.frontieres[NOIR], self.frontieres[BLANC] = sauvegarde
+
+        i = ligne * TAILLE + col
+        voisins_vides = self.voisins_vides
+        for j in _VOISINS[i]:
+            voisins_vides[j] += 1
+        self.frontiere.discard(i)
+        self.frontiere.update(retires)
+
+
+def jouer_coup_incremental(etat, ligne, col, joueur):
+    """jouer_coup_rapide sur un EtatRecherche, valeurs incrémentales comprises."""
+    pions = jouer_coup_rapide(etat, ligne, col, joueur)
+    if pions is not None:
+        etat.jouer(ligne, col, joueur, pions)
+    return pions
+
+
+def annuler_coup_incremental(etat, ligne, col, joueur, pions_retournes):
+    """Annule un coup joué avec jouer_coup_incremental."""
+    annuler_coup(etat, ligne, col, joueur, pions_retournes)
+    etat.annuler(ligne, col, joueur, pions_retournes)
+
+
+def compter_cases_vides_incremental(etat):
+    """compter_cases_vides d'un EtatRecherche."""
+    return etat.vides
+
+
+def _identite(plateau):
+    """Conversion neutre pour le moteur en listes (aucune copie)."""
+    return plateau
+
+
+# Primitives de chaque moteur : la recherche n'appelle que celles-ci, ce qui
+# permet de changer de représentation du plateau sans toucher à l'algorithme.
+# depuis_plateau / vers_plateau convertissent depuis / vers les listes 8x8
+# utilisées par othello.py et main.py ; fonctions_evaluation (ajoutées plus
+# bas) reçoivent le plateau du moteur.
+# cle_joueur est la clé XORée au hash à chaque changement de joueur au trait.
+_PRIMITIVES_MOTEUR = {
+    MOTEUR_LISTE: SimpleNamespace(
+        coups_valides_rapide=coups_valides_rapide,
+        jouer_coup_rapide=jouer_coup_rapide,
+        annuler_coup=annuler_coup,
+        compter_cases_vides=compter_cases_vides,
+        zobrist_hash=zobrist_hash,
+        delta_zobrist=delta_zobrist,
+        cle_joueur=_zobrist_joueur,
+        depuis_plateau=_identite,
+        vers_plateau=_identite,
+    ),
+    MOTEUR_BITBOARD: SimpleNamespace(
+        coups_valides_rapide=bitboard.coups_valides_rapide,
+        jouer_coup_rapide=bitboard.jouer_coup_rapide,
+        annuler_coup=bitboard.annuler_coup,
+        compter_cases_vides=bitboard.compter_cases_vides,
+        zobrist_hash=bitboard.zobrist_hash,
+        delta_zobrist=bitboard.delta_zobrist,
+        cle_joueur=bitboard._zobrist_joueur,
+        depuis_plateau=bitboard.depuis_plateau,
+        vers_plateau=bitboard.vers_plateau,
+    ),
+    MOTEUR_PLAT: SimpleNamespace(
+        coups_valides_rapide=plat.coups_valides_rapide,
+        jouer_coup_rapide=plat.jouer_coup_rapide,
+        annuler_coup=plat.annuler_coup,
+        compter_cases_vides=plat.compter_cases_vides,
+        zobrist_hash=plat.zobrist_hash,
+        delta_zobrist=plat.delta_zobrist,
+        cle_joueur=bitboard._zobrist_joueur,
+        depuis_plateau=plat.depuis_plateau,
+        vers_plateau=plat.vers_plateau,
+    ),
+    # Les fonctions d'évaluation y lisent les valeurs incrémentales
+    MOTEUR_INCREMENTAL: SimpleNamespace(
+        coups_valides_rapide=coups_valides_rapide,
+        jouer_coup_rapide=jouer_coup_incremental,
+        annuler_coup=annuler_coup_incremental,
+        compter_cases_vides=compter_cases_vides_incremental,
+        zobrist_hash=zobrist_hash,
+        delta_zobrist=delta_zobrist,
+        cle_joueur=_zobrist_joueur,
+        depuis_plateau=EtatRecherche,
+        vers_plateau=_identite,
+    ),
+}
+
+
+def _primitives_symetriques(moteur, delta):
+    """Primitives du moteur dont le hash empaquette ceux des 8 symétries
+    du plateau (voir symetrie.py)."""
+    p = _PRIMITIVES_MOTEUR[moteur]
+    vers_plateau = p.vers_plateau
+
+    def hash_symetrique(plateau, joueur):
+        return symetrie.hash_symetrique(vers_plateau(plateau), joueur)
+
+    return SimpleNamespace(**{**vars(p), 'zobrist_hash': hash_symetrique,
+                              'delta_zobrist': delta,
+                              'cle_joueur': symetrie.CLE_JOUEUR_8})
+
+
+# Primitives utilisées avec tt_symetrique : la table de transposition est
+# indexée par le hash canonique (le plus petit des 8), si bien que deux
+# positions symétriques partagent leur entrée
+_PRIMITIVES_SYMETRIQUES = {
+    MOTEUR_LISTE: _primitives_symetriques(MOTEUR_LISTE, symetrie.delta_symetrique),
+    MOTEUR_BITBOARD: _primitives_symetriques(MOTEUR_BITBOARD,
+                                             symetrie.delta_symetrique_bitboard),
+    MOTEUR_PLAT: _primitives_symetriques(MOTEUR_PLAT, symetrie.delta_symetrique_plat),
+    MOTEUR_INCREMENTAL: _primitives_symetriques(MOTEUR_INCREMENTAL,
+                                                symetrie.delta_symetrique),
+}
+
+
 # ═══════════════════════════════════════════════════════════════
 # Fonction d'évaluation multi-composantes
 # ═══════════════════════════════════════════════════════════════
@@ -243,12 +623,43 @@ def eval_coins(plateau, joueur):
     return score * 250
 
 
+# Nombre de pions stables (noirs, blancs) par position (noirs, blancs) ;
+# vidé quand il atteint TAILLE_CACHE_STABILITE entrées
+TAILLE_CACHE_STABILITE = 1 << 16
+_cache_stabilite = {}
+
+
+def _stables_bitboard(noirs, blancs):
+    """Nombre de pions stables (noirs, blancs) de la position en bitboards
+    (bitboard.pions_stables), mémorisé par position."""
+    cle = (noirs, blancs)
+    stables = _cache_stabilite.get(cle)
+    if stables is None:
+        stables = (bitboard.pions_stables(noirs, blancs).bit_count(),
+                   bitboard.pions_stables(blancs, noirs).bit_count())
+        if len(_cache_stabilite) >= TAILLE_CACHE_STABILITE:
+            _cache_stabilite.clear()
+        _cache_stabilite[cle] = stables
+    return stables
+
+
+def _stables_noirs_blancs(plateau):
+    """Nombre de pions stables (noirs, blancs)."""
+    bb = bitboard.depuis_plateau(plateau)
+    return _stables_bitboard(bb[NOIR], bb[BLANC])
+
+
 def eval_stabilite(plateau, joueur):
     """Évalue la stabilité des pions (pions qui ne peuvent plus être retournés).
-    Un pion est stable s'il est dans un coin, ou appuyé contre un bord/coin stable."""
-    adv = adversaire(joueur)
-    stable_j = _compter_pions_stables(plateau, joueur)
-    stable_a = _compter_pions_stables(plateau, adv)
+    Un pion est stable s'il est sur un bord sans menace le long de ce bord,
+    ou si chacune de ses 4 lignes est pleine ou appuyée sur un pion stable."""
+    return _score_stables(_stables_noirs_blancs(plateau), joueur)
+
+
+def _score_stables(stables, joueur):
+    """Score de stabilité d'après le nombre de pions stables (noirs, blancs)."""
+    noirs, blancs = stables
+    stable_j, stable_a = (noirs, blancs) if joueur == NOIR else (blancs, noirs)
 
     if stable_j + stable_a == 0:
         return 0
@@ -256,55 +667,8 @@ def eval_stabilite(plateau, joueur):
 
 
 def _compter_pions_stables(plateau, joueur):
-    """Compte les pions stables pour un joueur en utilisant une propagation depuis les coins."""
-    stable = [[False] * TAILLE for _ in range(TAILLE)]
-    count = 0
-
-    for cl, cc in COINS:
-        if plateau[cl][cc] != joueur:
-            continue
-
-        # Propagation depuis ce coin
-        # Direction de propagation depuis chaque coin
-        dl = 1 if cl == 0 else -1
-        dc = 1 if cc == 0 else -1
-
-        # Marquer les pions stables le long des bords et diagonales depuis le coin
-        # Ligne horizontale depuis le coin
-        c = cc
-        while 0 <= c < TAILLE and plateau[cl][c] == joueur:
-            stable[cl][c] = True
-            c += dc
-
-        # Colonne verticale depuis le coin
-        l = cl
-        while 0 <= l < TAILLE and plateau[l][cc] == joueur:
-            stable[l][cc] = True
-            l += dl
-
-        # Triangle stable : si une ligne complète est stable,
-        # la ligne suivante est aussi stable jusqu'au premier non-joueur
-        l = cl
-        while 0 <= l < TAILLE:
-            c = cc
-            row_stable = True
-            while 0 <= c < TAILLE:
-                if plateau[l][c] == joueur and (stable[l - dl][c] if 0 <= l - dl < TAILLE else l == cl):
-                    stable[l][c] = True
-                else:
-                    row_stable = False
-                    break
-                c += dc
-            if not row_stable and l != cl:
-                break
-            l += dl
-
-    for l in range(TAILLE):
-        for c in range(TAILLE):
-            if stable[l][c]:
-                count += 1
-
-    return count
+    """Compte les pions stables pour un joueur."""
+    return _stables_noirs_blancs(plateau)[joueur - 1]
 
 
 def eval_frontieres(plateau, joueur):
@@ -346,7 +710,186 @@ def eval_parite(plateau, joueur):
         return -10
 
 
-def evaluation(plateau, joueur):
+# ─── Composantes lues dans les bitboards ────────────────────
+
+# Poids positionnels de chaque octet de pions, ligne par ligne :
+# (décalage de la ligne, poids de l'octet)
+_POIDS_OCTETS = tuple(
+    (8 * l, [sum(POIDS_POSITION[l][c] for c in range(TAILLE) if o >> c & 1)
+             for o in range(256)])
+    for l in range(TAILLE))
+
+# Cases X / C de chaque coin : (bit du coin, ((bit, abs(poids) - poids), ...)),
+# à ajouter quand le coin et la case sont au même joueur
+_AJUSTEMENTS_COINS = tuple(
+    (bitboard.BITS[l * TAILLE + c],
+     tuple((bitboard.BITS[la * TAILLE + ca], abs(POIDS_POSITION[la][ca]) - POIDS_POSITION[la][ca])
+           for la, ca in COIN_ADJACENTES[(l, c)]))
+    for l, c in COINS)
+
+_MASQUE_COINS = sum(bitboard.BITS[l * TAILLE + c] for l, c in COINS)
+
+
+def compter_pions_bitboard(bb):
+    """compter_pions d'un plateau binaire."""
+    return bb[NOIR].bit_count(), bb[BLANC].bit_count()
+
+
+def _position_bitboard(bits):
+    """Somme des poids positionnels des pions de bits (eval_positionnelle)."""
+    score = 0
+    for decalage, poids in _POIDS_OCTETS:
+        score += poids[bits >> decalage & 0xFF]
+    for coin, adjacentes in _AJUSTEMENTS_COINS:
+        if bits & coin:
+            for bit, ajustement in adjacentes:
+                if bits & bit:
+                    score += ajustement
+    return score
+
+
+def eval_positionnelle_bitboard(bb, joueur):
+    """eval_positionnelle d'un plateau binaire."""
+    return _position_bitboard(bb[joueur]) - _position_bitboard(bb[3 - joueur])
+
+
+def eval_mobilite_bitboard(bb, joueur):
+    """eval_mobilite d'un plateau binaire, par masque_coups."""
+    joueur_bits, adv_bits = bb[joueur], bb[3 - joueur]
+    coups_j = bitboard.masque_coups(joueur_bits, adv_bits).bit_count()
+    coups_a = bitboard.masque_coups(adv_bits, joueur_bits).bit_count()
+    if coups_j + coups_a == 0:
+        return 0
+    return 100 * (coups_j - coups_a) / (coups_j + coups_a)
+
+
+def eval_coins_bitboard(bb, joueur):
+    """eval_coins d'un plateau binaire."""
+    return ((bb[joueur] & _MASQUE_COINS).bit_count() -
+            (bb[3 - joueur] & _MASQUE_COINS).bit_count()) * 250
+
+
+def eval_stabilite_bitboard(bb, joueur):
+    """eval_stabilite d'un plateau binaire."""
+    return _score_stables(_stables_bitboard(bb[NOIR], bb[BLANC]), joueur)
+
+
+def eval_frontieres_bitboard(bb, joueur):
+    """eval_frontieres d'un plateau binaire : pions voisins d'une case vide."""
+    joueur_bits, adv_bits = bb[joueur], bb[3 - joueur]
+    voisins_vides = bitboard.masque_voisins(~(joueur_bits | adv_bits) & bitboard.PLEIN)
+    front_j = (joueur_bits & voisins_vides).bit_count()
+    front_a = (adv_bits & voisins_vides).bit_count()
+    if front_j + front_a == 0:
+        return 0
+    return -100 * (front_j - front_a) / (front_j + front_a)
+
+
+def eval_parite_bitboard(bb, joueur):
+    """eval_parite d'un plateau binaire (64 cases : même parité que les pions)."""
+    return 10 if (bb[NOIR] | bb[BLANC]).bit_count() % 2 == 0 else -10
+
+
+# Tables des motifs, construites une fois à l'import
+_score_motifs = motifs.creer_evaluateur(POIDS_POSITION)
+_score_motifs_bitboard = bitboard.creer_evaluateur_motifs(POIDS_POSITION)
+
+
+def score_motifs_bitboard(bb):
+    """Score des motifs (du point de vue des noirs) d'un plateau binaire."""
+    return _score_motifs_bitboard(bb[NOIR], bb[BLANC])
+
+
+# ─── Composantes lues dans l'état incrémental ───────────────
+
+def compter_pions_incremental(etat):
+    """compter_pions d'un EtatRecherche."""
+    return etat.pions[NOIR], etat.pions[BLANC]
+
+
+def partie_bloquee_incrementale(etat):
+    """partie_bloquee d'un EtatRecherche, par ses bitboards."""
+    return bitboard.est_partie_finie(etat.bits)
+
+
+def eval_positionnelle_incrementale(etat, joueur):
+    """eval_positionnelle d'un EtatRecherche."""
+    return etat.position[joueur] - etat.position[adversaire(joueur)]
+
+
+def eval_mobilite_incrementale(etat, joueur):
+    """eval_mobilite d'un EtatRecherche, par ses bitboards."""
+    return eval_mobilite_bitboard(etat.bits, joueur)
+
+
+def eval_coins_incrementale(etat, joueur):
+    """eval_coins d'un EtatRecherche, par ses bitboards."""
+    return eval_coins_bitboard(etat.bits, joueur)
+
+
+def eval_stabilite_incrementale(etat, joueur):
+    """eval_stabilite d'un EtatRecherche."""
+    return eval_stabilite_bitboard(etat.bits, joueur)
+
+
+def eval_frontieres_incrementale(etat, joueur):
+    """eval_frontieres d'un EtatRecherche."""
+    front_j = etat.frontieres[joueur]
+    front_a = etat.frontieres[adversaire(joueur)]
+    if front_j + front_a == 0:
+        return 0
+    return -100 * (front_j - front_a) / (front_j + front_a)
+
+
+def eval_parite_incrementale(etat, joueur):
+    """eval_parite d'un EtatRecherche."""
+    return 10 if etat.vides % 2 == 0 else -10
+
+
+def score_motifs_incremental(etat):
+    """Score des motifs d'un EtatRecherche, par ses bitboards."""
+    return score_motifs_bitboard(etat.bits)
+
+
+# Composantes de l'évaluation qui dépendent de la représentation du
+# plateau : les stratégies les appellent par ces tables, une par moteur
+# (fonctions_evaluation des primitives, plus bas)
+COMPOSANTES_LISTE = SimpleNamespace(
+    compter_pions=compter_pions,
+    partie_bloquee=partie_bloquee,
+    positionnelle=eval_positionnelle,
+    mobilite=eval_mobilite,
+    coins=eval_coins,
+    stabilite=eval_stabilite,
+    frontieres=eval_frontieres,
+    parite=eval_parite,
+    motifs=_score_motifs,
+)
+COMPOSANTES_BITBOARD = SimpleNamespace(
+    compter_pions=compter_pions_bitboard,
+    partie_bloquee=bitboard.est_partie_finie,
+    positionnelle=eval_positionnelle_bitboard,
+    mobilite=eval_mobilite_bitboard,
+    coins=eval_coins_bitboard,
+    stabilite=eval_stabilite_bitboard,
+    frontieres=eval_frontieres_bitboard,
+    parite=eval_parite_bitboard,
+    motifs=score_motifs_bitboard,
+)
+COMPOSANTES_INCREMENTALES = SimpleNamespace(
+    compter_pions=compter_pions_incremental,
+    partie_bloquee=partie_bloquee_incrementale,
+    positionnelle=eval_positionnelle_incrementale,
+    mobilite=eval_mobilite_incrementale,
+    coins=eval_coins_incrementale,
+    stabilite=eval_stabilite_incrementale,
+    frontieres=eval_frontieres_incrementale,
+    parite=eval_parite_incrementale,
+    motifs=score_motifs_incremental,
+)
+
+
+def evaluation(plateau, joueur, composantes=COMPOSANTES_LISTE):
     """
     Fonction d'évaluation principale — stratégie mixte par phase.
 
@@ -354,13 +897,12 @@ def evaluation(plateau, joueur):
     Phase 2 (milieu, 20-50 pions joués) : mobilité + stabilité + coins
     Phase 3 (fin, > 50 pions joués) : différence de pions + résolution
     """
-    noirs, blancs = compter_pions(plateau)
+    noirs, blancs = composantes.compter_pions(plateau)
     total_pions = noirs + blancs
     vides = 64 - total_pions
 
     # ── Fin de partie : score absolu ──
-    if vides == 0 or (not coups_valides_rapide(plateau, NOIR) and
-                       not coups_valides_rapide(plateau, BLANC)):
+    if vides == 0 or composantes.partie_bloquee(plateau):
         diff = (noirs - blancs) if joueur == NOIR else (blancs - noirs)
         if diff > 0:
             return INF - 100 + diff  # Victoire
@@ -372,21 +914,21 @@ def evaluation(plateau, joueur):
     # ── Phase d'ouverture (≤ 20 pions sur le plateau) ──
     if total_pions <= 20:
         score = (
-            eval_positionnelle(plateau, joueur) * 1.0 +
-            eval_mobilite(plateau, joueur) * 5.0 +
-            eval_coins(plateau, joueur) * 10.0 +
-            eval_frontieres(plateau, joueur) * 2.0
+            composantes.positionnelle(plateau, joueur) * 1.0 +
+            composantes.mobilite(plateau, joueur) * 5.0 +
+            composantes.coins(plateau, joueur) * 10.0 +
+            composantes.frontieres(plateau, joueur) * 2.0
         )
 
     # ── Phase de milieu (20-50 pions) ──
     elif total_pions <= 50:
         score = (
-            eval_positionnelle(plateau, joueur) * 0.5 +
-            eval_mobilite(plateau, joueur) * 4.0 +
-            eval_coins(plateau, joueur) * 15.0 +
-            eval_stabilite(plateau, joueur) * 3.0 +
-            eval_frontieres(plateau, joueur) * 1.5 +
-            eval_parite(plateau, joueur) * 1.0
+            composantes.positionnelle(plateau, joueur) * 0.5 +
+            composantes.mobilite(plateau, joueur) * 4.0 +
+            composantes.coins(plateau, joueur) * 15.0 +
+            composantes.stabilite(plateau, joueur) * 3.0 +
+            composantes.frontieres(plateau, joueur) * 1.5 +
+            composantes.parite(plateau, joueur) * 1.0
         )
 
     # ── Phase de fin de partie (> 50 pions) ──
@@ -394,25 +936,24 @@ def evaluation(plateau, joueur):
         diff = (noirs - blancs) if joueur == NOIR else (blancs - noirs)
         score = (
             diff * 10.0 +
-            eval_coins(plateau, joueur) * 20.0 +
-            eval_stabilite(plateau, joueur) * 5.0 +
-            eval_parite(plateau, joueur) * 3.0
+            composantes.coins(plateau, joueur) * 20.0 +
+            composantes.stabilite(plateau, joueur) * 5.0 +
+            composantes.parite(plateau, joueur) * 3.0
         )
 
     return score
 
 
-def evaluation_positionnelle_strat(plateau, joueur):
+def evaluation_positionnelle_strat(plateau, joueur, composantes=COMPOSANTES_LISTE):
     """
     Stratégie positionnelle : évalue principalement selon la position
     des pions sur le plateau (poids statiques et coins).
     """
-    noirs, blancs = compter_pions(plateau)
+    noirs, blancs = composantes.compter_pions(plateau)
     total_pions = noirs + blancs
     vides = 64 - total_pions
 
-    if vides == 0 or (not coups_valides_rapide(plateau, NOIR) and
-                       not coups_valides_rapide(plateau, BLANC)):
+    if vides == 0 or composantes.partie_bloquee(plateau):
         diff = (noirs - blancs) if joueur == NOIR else (blancs - noirs)
         if diff > 0:
             return INF - 100 + diff
@@ -423,37 +964,36 @@ def evaluation_positionnelle_strat(plateau, joueur):
 
     if total_pions <= 20:
         score = (
-            eval_positionnelle(plateau, joueur) * 5.0 +
-            eval_coins(plateau, joueur) * 10.0
+            composantes.positionnelle(plateau, joueur) * 5.0 +
+            composantes.coins(plateau, joueur) * 10.0
         )
     elif total_pions <= 50:
         score = (
-            eval_positionnelle(plateau, joueur) * 3.0 +
-            eval_coins(plateau, joueur) * 15.0 +
-            eval_stabilite(plateau, joueur) * 2.0
+            composantes.positionnelle(plateau, joueur) * 3.0 +
+            composantes.coins(plateau, joueur) * 15.0 +
+            composantes.stabilite(plateau, joueur) * 2.0
         )
     else:
         diff = (noirs - blancs) if joueur == NOIR else (blancs - noirs)
         score = (
-            eval_positionnelle(plateau, joueur) * 1.0 +
-            eval_coins(plateau, joueur) * 20.0 +
+            composantes.positionnelle(plateau, joueur) * 1.0 +
+            composantes.coins(plateau, joueur) * 20.0 +
             diff * 5.0
         )
 
     return score
 
 
-def evaluation_absolue_strat(plateau, joueur):
+def evaluation_absolue_strat(plateau, joueur, composantes=COMPOSANTES_LISTE):
     """
     Stratégie absolue : maximise la différence brute de pions.
     Approche gloutonne, privilégie le matériel.
     """
-    noirs, blancs = compter_pions(plateau)
+    noirs, blancs = composantes.compter_pions(plateau)
     total_pions = noirs + blancs
     vides = 64 - total_pions
 
-    if vides == 0 or (not coups_valides_rapide(plateau, NOIR) and
-                       not coups_valides_rapide(plateau, BLANC)):
+    if vides == 0 or composantes.partie_bloquee(plateau):
         diff = (noirs - blancs) if joueur == NOIR else (blancs - noirs)
         if diff > 0:
             return INF - 100 + diff
@@ -463,22 +1003,21 @@ def evaluation_absolue_strat(plateau, joueur):
             return 0
 
     diff = (noirs - blancs) if joueur == NOIR else (blancs - noirs)
-    score = diff * 10.0 + eval_coins(plateau, joueur) * 5.0
+    score = diff * 10.0 + composantes.coins(plateau, joueur) * 5.0
 
     return score
 
 
-def evaluation_mobilite_strat(plateau, joueur):
+def evaluation_mobilite_strat(plateau, joueur, composantes=COMPOSANTES_LISTE):
     """
     Stratégie mobilité : maximise le nombre de coups disponibles
     et minimise les pions frontières.
     """
-    noirs, blancs = compter_pions(plateau)
+    noirs, blancs = composantes.compter_pions(plateau)
     total_pions = noirs + blancs
     vides = 64 - total_pions
 
-    if vides == 0 or (not coups_valides_rapide(plateau, NOIR) and
-                       not coups_valides_rapide(plateau, BLANC)):
+    if vides == 0 or composantes.partie_bloquee(plateau):
         diff = (noirs - blancs) if joueur == NOIR else (blancs - noirs)
         if diff > 0:
             return INF - 100 + diff
@@ -489,33 +1028,102 @@ def evaluation_mobilite_strat(plateau, joueur):
 
     if total_pions <= 20:
         score = (
-            eval_mobilite(plateau, joueur) * 8.0 +
-            eval_frontieres(plateau, joueur) * 3.0 +
-            eval_coins(plateau, joueur) * 5.0
+            composantes.mobilite(plateau, joueur) * 8.0 +
+            composantes.frontieres(plateau, joueur) * 3.0 +
+            composantes.coins(plateau, joueur) * 5.0
         )
     elif total_pions <= 50:
         score = (
-            eval_mobilite(plateau, joueur) * 6.0 +
-            eval_coins(plateau, joueur) * 8.0 +
-            eval_frontieres(plateau, joueur) * 2.0
+            composantes.mobilite(plateau, joueur) * 6.0 +
+            composantes.coins(plateau, joueur) * 8.0 +
+            composantes.frontieres(plateau, joueur) * 2.0
         )
     else:
         diff = (noirs - blancs) if joueur == NOIR else (blancs - noirs)
         score = (
-            eval_mobilite(plateau, joueur) * 2.0 +
+            composantes.mobilite(plateau, joueur) * 2.0 +
             diff * 8.0 +
-            eval_coins(plateau, joueur) * 10.0
+            composantes.coins(plateau, joueur) * 10.0
         )
 
     return score
 
 
+def evaluation_motifs_strat(plateau, joueur, composantes=COMPOSANTES_LISTE):
+    """
+    Stratégie motifs : somme de valeurs précalculées pour chaque bord,
+    coin 3x3 et bande 2x5 (poids positionnels, stabilité exacte des bords,
+    accès aux coins, voir motifs.py), soit une lecture de table par motif.
+    Sans terme de mobilité : la plus rapide par feuille.
+    """
+    noirs, blancs = composantes.compter_pions(plateau)
+    total_pions = noirs + blancs
+    vides = 64 - total_pions
+    diff = (noirs - blancs) if joueur == NOIR else (blancs - noirs)
+
+    if vides == 0 or composantes.partie_bloquee(plateau):
+        if diff > 0:
+            return INF - 100 + diff
+        elif diff < 0:
+            return -INF + 100 - diff
+        else:
+            return 0
+
+    score = composantes.motifs(plateau)
+    if joueur == BLANC:
+        score = -score
+    if total_pions > 50:
+        score += diff * 10.0
+    return score
+
+
 # Dictionnaire des fonctions d'évaluation par stratégie
 FONCTIONS_EVALUATION = {
     STRAT_POSITIONNEL: evaluation_positionnelle_strat,
     STRAT_ABSOLU: evaluation_absolue_strat,
     STRAT_MOBILITE: evaluation_mobilite_strat,
     STRAT_MIXTE: evaluation,
+    STRAT_MOTIFS: evaluation_motifs_strat,
+}
+
+def _evaluations_composantes(composantes):
+    """Fonctions d'évaluation qui lisent les composantes d'un moteur."""
+    return {strategie: functools.partial(fn, composantes=composantes)
+            for strategie, fn in FONCTIONS_EVALUATION.items()}
+
+
+def _evaluations_converties(vers_plateau):
+    """Fonctions d'évaluation d'un moteur sans composantes propres : le
+    plateau est converti en listes à chaque feuille."""
+    def convertir(fn):
+        def evaluer(plateau, joueur):
+            return fn(vers_plateau(plateau), joueur)
+        return evaluer
+    return {strategie: convertir(fn) for strategie, fn in FONCTIONS_EVALUATION.items()}
+
+
+# Fonctions d'évaluation de la recherche, par moteur : elles reçoivent le
+# plateau du moteur lui-même (plateau binaire, EtatRecherche...) et en
+# lisent directement les composantes
+_EVALUATIONS_MOTEUR = {
+    MOTEUR_LISTE: FONCTIONS_EVALUATION,
+    MOTEUR_BITBOARD: _evaluations_composantes(COMPOSANTES_BITBOARD),
+    MOTEUR_PLAT: _evaluations_converties(plat.vers_plateau),
+    MOTEUR_INCREMENTAL: _evaluations_composantes(COMPOSANTES_INCREMENTALES),
+}
+for _primitives in (_PRIMITIVES_MOTEUR, _PRIMITIVES_SYMETRIQUES):
+    for _moteur, _p in _primitives.items():
+        _p.fonctions_evaluation = _EVALUATIONS_MOTEUR[_moteur]
+
+# Ordre de grandeur des scores de chaque évaluation en milieu de partie ;
+# le biais progressif MCTS ramène l'écart de score entre deux coups dans
+# [-1, 1] par tanh(écart / échelle)
+_ECHELLES_BIAIS = {
+    STRAT_POSITIONNEL: 1000.0,
+    STRAT_ABSOLU: 60.0,
+    STRAT_MOBILITE: 200.0,
+    STRAT_MIXTE: 300.0,
+    STRAT_MOTIFS: 300.0,
 }
 
 
@@ -536,15 +1144,29 @@ _PRIORITE_COUP = [
 ]
 
 
-def trier_coups(coups, plateau, joueur, tt_best_move=None):
+# Nombre de coups killers conservés par ply
+NB_KILLERS = 2
+
+# Nombre maximal de plies suivis par les coups killers
+PLY_MAX = 64
+
+
+def trier_coups(coups, plateau, joueur, tt_best_move=None, killers=(), historique=None):
     """Trie les coups par ordre de qualité décroissante.
-    Le meilleur coup de la table de transposition est mis en premier."""
+    Le meilleur coup de la table de transposition est mis en premier, puis
+    les coins, puis les coups killers du ply. Le reste est classé par
+    priorité statique, l'historique des coupes départageant les ex aequo."""
 
     def cle_tri(coup):
         l, c = coup
         if tt_best_move and coup == tt_best_move:
-            return -1  # Toujours en premier
-        return _PRIORITE_COUP[l][c]
+            return (-2, 0)  # Toujours en premier
+        priorite = _PRIORITE_COUP[l][c]
+        if priorite and coup in killers:
+            return (-1, 0)
+        if historique is None:
+            return (priorite, 0)
+        return (priorite, -historique[l * TAILLE + c])
 
     return sorted(coups, key=cle_tri)
 
@@ -553,44 +1175,202 @@ def trier_coups(coups, plateau, joueur, tt_best_move=None):
 # NegaMax avec Alpha-Beta + Table de Transposition
 # ═══════════════════════════════════════════════════════════════
 
-# Types d'entrées dans la table de transposition
-TT_EXACT = 0
-TT_ALPHA = 1  # Borne supérieure
-TT_BETA = 2   # Borne inférieure
+# Les types d'entrées (TT_EXACT, TT_ALPHA, TT_BETA) et la table elle-même
+# sont définis dans transposition.py
 
 
 # ═══════════════════════════════════════════════════════════════
 # MCTS — Noeud de l'arbre de recherche
 # ═══════════════════════════════════════════════════════════════
 
+# Politique des simulations : un coin jouable est toujours joué ; sinon un
+# coup hors cases X / C (priorité 5 ou 6 de _PRIORITE_COUP) s'il en existe
+_COINS_SIMULATION = sum(bitboard.BITS[l * TAILLE + c]
+                        for l in range(TAILLE) for c in range(TAILLE)
+                        if _PRIORITE_COUP[l][c] == 0)
+_RISQUEES_SIMULATION = sum(bitboard.BITS[l * TAILLE + c]
+                           for l in range(TAILLE) for c in range(TAILLE)
+                           if _PRIORITE_COUP[l][c] >= 5)
+_SURES_SIMULATION = bitboard.PLEIN & ~_COINS_SIMULATION & ~_RISQUEES_SIMULATION
+
+# Taille de lot à partir de laquelle simuler_parties passe par NumPy
+# (vectorise.simuler_lot), plus rapide que la boucle Python au-delà
+SEUIL_LOT_NUMPY = 128
+
+
+def simuler_partie(noirs, blancs, joueur, couleur, amaf=False):
+    """Partie rapide depuis la position (bitboards noirs / blancs, joueur
+    au trait) jusqu'à la fin. Retourne 1.0 si couleur gagne, 0.5 en cas
+    de nul, 0.0 sinon ; avec amaf, retourne (résultat, cases jouées par
+    Noir, cases jouées par Blanc), les cases en masques de bits.
+
+    Sans génération complète des coups : les cases vides voisines d'un pion
+    adverse sont essayées dans l'ordre de la politique (coins, cases sûres,
+    cases X / C), à partir d'une case tirée au hasard dans chaque classe,
+    jusqu'au premier coup qui retourne des pions."""
+    if joueur == NOIR:
+        j, a = noirs, blancs
+    else:
+        j, a = blancs, noirs
+    hasard = random.getrandbits
+    retournements = bitboard.masque_retournements
+    voisins = bitboard.masque_voisins
+    bits = bitboard.BITS
+    plein = bitboard.PLEIN
+    classes = (_SURES_SIMULATION, _RISQUEES_SIMULATION)
+    passe = False
+    joues_j = joues_a = 0  # Cases jouées par chaque camp
+
+    while True:
+        candidats = voisins(a) & ~(j | a) & plein
+        bit = 0
+        m = candidats & _COINS_SIMULATION
+        while m:
+            b = m & -m
+            f = retournements(b, j, a)
+            if f:
+                bit = b
+                break
+            m ^= b
+        if not bit:
+            for classe in classes:
+                m = candidats & classe
+                if not m:
+                    continue
+                # Rotation de r bits : le parcours commence à une case au hasard
+                r = hasard(6)
+                m = ((m >> r) | (m << (64 - r))) & plein
+                while m:
+                    b = m & -m
+                    b2 = bits[(b.bit_length() - 1 + r) & 63]
+                    f = retournements(b2, j, a)
+                    if f:
+                        bit = b2
+                        break
+                    m ^= b
+                if bit:
+                    break
+
+        if bit:
+            j, a = a ^ f, j | f | bit
+            joues_j, joues_a = joues_a, joues_j | bit
+            passe = False
+        elif passe:
+            break  # Aucun des deux joueurs ne peut jouer
+        else:
+            j, a = a, j
+            joues_j, joues_a = joues_a, joues_j
+            passe = True
+        joueur = adversaire(joueur)
+
+    nb_j, nb_a = j.bit_count(), a.bit_count()
+    if joueur != couleur:
+        nb_j, nb_a = nb_a, nb_j
+    resultat = 1.0 if nb_j > nb_a else (0.0 if nb_j < nb_a else 0.5)
+    if not amaf:
+        return resultat
+    if joueur == NOIR:
+        return resultat, joues_j, joues_a
+    return resultat, joues_a, joues_j
+
+
+def simuler_parties(noirs, blancs, joueur, couleur, nb):
+    """nb simulations depuis la même position ; retourne la somme des
+    résultats de simuler_partie. Par NumPy (vectorise.simuler_lot) à partir
+    de SEUIL_LOT_NUMPY simulations si NumPy est installé."""
+    if nb >= SEUIL_LOT_NUMPY:
+        import vectorise  # vectorise importe ia
+        if vectorise.NUMPY_DISPONIBLE:
+            return vectorise.simuler_lot(noirs, blancs, joueur, couleur, nb)
+    return sum(simuler_partie(noirs, blancs, joueur, couleur) for _ in range(nb))
+
+
+# Coup « passe » dans le masque des coups non explorés d'un nœud : bit
+# situé après les 64 cases
+_PASSE_MCTS = 1 << (TAILLE * TAILLE)
+
+
 class NoeudMCTS:
-    """Noeud de l'arbre Monte Carlo Tree Search."""
+    """Noeud de l'arbre Monte Carlo Tree Search.
+
+    Nœud compact (__slots__) : la position est gardée sous forme de deux
+    bitboards (noirs, blancs) et les coups non explorés sous forme d'un
+    masque de cases ; la liste des enfants n'est créée qu'à la première
+    expansion.
+
+    amaf_visites / amaf_victoires comptent les simulations où le coup du
+    nœud a été joué plus tard par le même joueur (RAVE) ; biais est
+    l'évaluation statique de la position pour le joueur qui vient d'y
+    jouer (biais progressif)."""
 
-    def __init__(self, plateau, joueur, coup=None, parent=None):
-        self.plateau = [row[:] for row in plateau]
+    __slots__ = ('noirs', 'blancs', 'joueur', 'coup', 'parent', 'enfants',
+                 'visites', 'victoires', 'non_explores',
+                 'amaf_visites', 'amaf_victoires', 'biais')
+
+    def __init__(self, noirs, blancs, joueur, coup=None, parent=None):
+        self.noirs = noirs
+        self.blancs = blancs
         self.joueur = joueur
         self.coup = coup
         self.parent = parent
-        self.enfants = []
+        self.enfants = ()
         self.visites = 0
         self.victoires = 0.0
-        self.coups_non_explores = coups_valides_rapide(self.plateau, self.joueur)
+        self.amaf_visites = 0
+        self.amaf_victoires = 0.0
+        self.biais = 0.0
+        if joueur == NOIR:
+            joueur_bits, adv_bits = noirs, blancs
+        else:
+            joueur_bits, adv_bits = blancs, noirs
+        coups = bitboard.masque_coups(joueur_bits, adv_bits)
+        if not coups and bitboard.masque_coups(adv_bits, joueur_bits):
+            coups = _PASSE_MCTS  # Le joueur doit passer : un seul enfant
+        self.non_explores = coups
+
+    @classmethod
+    def depuis_plateau(cls, plateau, joueur):
+        """Racine de l'arbre pour un plateau 8x8 (listes)."""
+        bb = bitboard.depuis_plateau(plateau)
+        return cls(bb[NOIR], bb[BLANC], joueur)
+
+    def plateau(self):
+        """Plateau 8x8 (listes) du nœud."""
+        return bitboard.vers_plateau([0, self.noirs, self.blancs])
 
     def est_terminal(self):
         """Vérifie si le noeud est un état terminal."""
-        return (not self.coups_non_explores and
-                not coups_valides_rapide(self.plateau, adversaire(self.joueur)))
+        return not self.non_explores and not self.enfants
 
     def est_totalement_expanse(self):
         """Vérifie si tous les coups ont été explorés."""
-        return len(self.coups_non_explores) == 0
+        return not self.non_explores
+
+    def taille(self):
+        """Nombre de nœuds du sous-arbre issu de ce nœud."""
+        taille = 0
+        pile = [self]
+        while pile:
+            noeud = pile.pop()
+            taille += 1
+            pile.extend(noeud.enfants)
+        return taille
 
 
 class IAOthello:
     """Moteur d'IA pour Othello."""
 
     def __init__(self, couleur, profondeur_max=8, temps_max=5.0,
-                 strategie=STRAT_MIXTE, algorithme=ALGO_NEGAMAX):
+                 strategie=STRAT_MIXTE, algorithme=ALGO_NEGAMAX,
+                 moteur=MOTEUR_LISTE, debug_hash=False,
+                 taille_tt_mo=TAILLE_TT_DEFAUT, tt_compacte=False,
+                 pvs=True, aspiration=False,
+                 seuil_finale=SEUIL_FINALE, seuil_gain=SEUIL_GAIN,
+                 tri_dynamique=True, nb_workers=1, parallelisme=PARALLELE_SMP,
+                 livre=None, tt_symetrique=False,
+                 mcts_reutilisation=True, mcts_max_noeuds=MCTS_MAX_NOEUDS,
+                 mcts_simulations_lot=1, mcts_rave=False, mcts_biais=None,
+                 mcts_elargissement=False):
         """
         Args:
             couleur: NOIR ou BLANC
@@ -598,16 +1378,139 @@ class IAOthello:
             temps_max: temps maximum par coup en secondes
             strategie: type de stratégie d'évaluation
             algorithme: algorithme de recherche (negamax, minmax, mcts)
+            moteur: représentation du plateau pendant la recherche
+                    (liste, bitboard, plat, incremental)
+            debug_hash: vérifie à chaque nœud que le hash incrémental
+                        est égal au hash recalculé (lent, pour le débogage)
+            taille_tt_mo: taille de la table de transposition en Mo
+            tt_compacte: entrées empaquetées en mots de 64 bits (16 octets
+                         par entrée au lieu de ~256)
+            pvs: Principal Variation Search (fenêtre nulle hors variante
+                 principale, re-recherche en cas d'échec haut)
+            aspiration: fenêtres d'aspiration centrées sur le score de
+                        l'itération précédente (NegaMax)
+            seuil_finale: nombre de cases vides à partir duquel le solveur
+                          de fin de partie calcule le score exact
+            seuil_gain: nombre de cases vides à partir duquel le solveur
+                        détermine gain / nul / perte
+            tri_dynamique: tri des coups par coups killers et historique
+                           des coupes (en plus des priorités statiques)
+            nb_workers: nombre de processus de recherche
+            parallelisme: répartition du travail quand nb_workers > 1 :
+                          PARALLELE_SMP (NegaMax, processus auxiliaires sur
+                          la même position, table de transposition en
+                          mémoire partagée) ou PARALLELE_RACINE (NegaMax et
+                          MinMax, un sous-arbre de la racine par tâche) ;
+                          en MCTS, un arbre par processus, ou
+                          PARALLELE_FEUILLES (un seul arbre, des feuilles
+                          simulées par les processus sans les attendre)
+            livre: LivreOuvertures (livre.py) consulté avant toute
+                   recherche ; peut être partagé entre plusieurs IA
+            tt_symetrique: table de transposition indexée par la forme
+                           canonique de la position (symetrie.py) : les
+                           positions symétriques partagent leur entrée
+            mcts_reutilisation: MCTS repart du sous-arbre de la position
+                                jouée au lieu d'un arbre vide
+            mcts_max_noeuds: nombre maximal de nœuds de l'arbre MCTS
+            mcts_simulations_lot: simulations par feuille développée (par
+                                  lots NumPy à partir de SEUIL_LOT_NUMPY)
+            mcts_rave: sélection MCTS mêlant aux statistiques de chaque
+                       coup ses statistiques AMAF (coups joués plus tard
+                       dans les simulations) ; les simulations sont alors
+                       jouées une à une, sans lots NumPy
+            mcts_biais: stratégie (clé de FONCTIONS_EVALUATION) dont
+                        l'évaluation statique biaise la sélection MCTS,
+                        d'autant moins que le coup est visité ; None pour
+                        ne pas biaiser
+            mcts_elargissement: élargissement progressif, un nœud MCTS
+                                développe tous ses coups à la fois, triés
+                                par l'évaluation de mcts_biais (à défaut
+                                par _PRIORITE_COUP), mais ne choisit
+                                d'abord que parmi les premiers ; les
+                                suivants s'ajoutent à mesure des visites
         """
         self.couleur = couleur
         self.profondeur_max = profondeur_max
         self.temps_max = temps_max
         self.strategie = strategie
         self.algorithme = algorithme
-        self.fn_evaluation = FONCTIONS_EVALUATION[strategie]
-
-        # Table de transposition : hash → (profondeur, score, type, meilleur_coup)
-        self.table_transposition = {}
+        self.moteur = moteur
+        self.tt_symetrique = tt_symetrique
+        if tt_symetrique:
+            self.primitives = _PRIMITIVES_SYMETRIQUES[moteur]
+        else:
+            self.primitives = _PRIMITIVES_MOTEUR[moteur]
+        self.fn_evaluation = self.primitives.fonctions_evaluation[strategie]
+        self.debug_hash = debug_hash
+        self.pvs = pvs
+        self.aspiration = aspiration
+        self.seuil_finale = seuil_finale
+        self.seuil_gain = seuil_gain
+        # Meilleur coup partiel du solveur quand il a manqué de temps :
+        # essayé en premier par la recherche heuristique qui prend le relais
+        self.coup_finale = None
+        # Conservé d'un coup à l'autre : sa table de transposition sert
+        # encore au coup suivant
+        self.solveur = SolveurFinale()
+
+        # Coups killers (derniers coups ayant provoqué une coupe, par ply)
+        # et historique des coupes par couleur et par case
+        self.tri_dynamique = tri_dynamique
+        self.killers = [[] for _ in range(PLY_MAX)]
+        self.historique = {NOIR: [0] * (TAILLE * TAILLE),
+                           BLANC: [0] * (TAILLE * TAILLE)}
+        self.profondeur_iteration = 0
+
+        # Hash Zobrist de la position courante, mis à jour par XOR à chaque
+        # coup joué / annulé pendant la recherche (plus de recalcul par nœud) ;
+        # avec tt_symetrique, les 8 hashs symétriques empaquetés
+        self.hash_courant = 0
+
+        # Table de transposition bornée : hash → (profondeur, score, type, meilleur_coup)
+        if nb_workers > 1 and parallelisme == PARALLELE_SMP and algorithme != ALGO_MCTS:
+            classe_tt = TableTranspositionPartagee
+        elif tt_compacte:
+            classe_tt = TableTranspositionCompacte
+        else:
+            classe_tt = TableTransposition
+        self.table_transposition = classe_tt(taille_tt_mo)
+
+        # Recherche parallèle : les processus sont démarrés à la première
+        # recherche et réutilisés ensuite (voir parallele.py)
+        self.nb_workers = nb_workers
+        self.parallelisme = parallelisme
+        self.groupe_smp = None
+        self.pool_racine = None
+        self.pool_mcts = None
+        self.options_auxiliaires = {
+            'couleur': couleur, 'profondeur_max': profondeur_max, 'temps_max': temps_max,
+            'strategie': strategie, 'algorithme': algorithme, 'moteur': moteur,
+            'taille_tt_mo': taille_tt_mo, 'tt_compacte': tt_compacte, 'pvs': pvs,
+            'aspiration': aspiration, 'tri_dynamique': tri_dynamique,
+            'tt_symetrique': tt_symetrique, 'mcts_reutilisation': mcts_reutilisation,
+            'mcts_max_noeuds': mcts_max_noeuds, 'mcts_simulations_lot': mcts_simulations_lot,
+            'mcts_rave': mcts_rave, 'mcts_biais': mcts_biais,
+            'mcts_elargissement': mcts_elargissement,
+        }
+        # Réglages propres aux processus auxiliaires : drapeau d'arrêt partagé,
+        # décalage de profondeur et ordre des coups de la racine
+        self.arret = None
+        self.decalage_profondeur = 0
+        self.rng_racine = None
+        self.score_racine = 0
+        self.livre = livre
+
+        # Arbre MCTS conservé entre deux appels à choisir_coup
+        self.mcts_reutilisation = mcts_reutilisation
+        self.mcts_max_noeuds = mcts_max_noeuds
+        self.mcts_simulations_lot = mcts_simulations_lot
+        # Sélection MCTS : RAVE, biais progressif, élargissement progressif
+        self.mcts_rave = mcts_rave
+        self.mcts_biais = mcts_biais
+        self.fn_biais = FONCTIONS_EVALUATION[mcts_biais] if mcts_biais is not None else None
+        self.mcts_elargissement = mcts_elargissement
+        self.arbre_mcts = None
+        self.nb_noeuds_mcts = 0
         self.noeuds_explores = 0
         self.temps_debut = 0
         self.timeout = False
@@ -616,9 +1519,15 @@ class IAOthello:
         self.stats = {
             'noeuds': 0,
             'coupes': 0,
+            'coupes_premier_coup': 0,
             'tt_hits': 0,
+            'tt_trouves': 0,
+            'tt_manques': 0,
+            're_recherches': 0,
             'profondeur_atteinte': 0,
             'temps': 0,
+            'livre': False,
+            'mcts_visites_reutilisees': 0,
         }
 
     def reinitialiser_stats(self):
@@ -628,9 +1537,15 @@ class IAOthello:
         self.stats = {
             'noeuds': 0,
             'coupes': 0,
+            'coupes_premier_coup': 0,
             'tt_hits': 0,
+            'tt_trouves': 0,
+            'tt_manques': 0,
+            're_recherches': 0,
             'profondeur_atteinte': 0,
             'temps': 0,
+            'livre': False,
+            'mcts_visites_reutilisees': 0,
         }
 
     def choisir_coup(self, plateau):
@@ -645,64 +1560,167 @@ class IAOthello:
             return coups[0]
 
         self.reinitialiser_stats()
+        if self.livre is not None:
+            coup = self.livre.chercher(plateau, self.couleur)
+            if coup in coups:
+                self.stats['livre'] = True
+                return coup
+
+        self.table_transposition.nouvelle_recherche()
+        self._vieillir_heuristiques_tri()
         self.temps_debut = time.time()
         self.timeout = False
 
-        if self.algorithme == ALGO_MCTS:
+        coup = None
+        if self.algorithme != ALGO_MCTS:
+            coup = self._choisir_coup_finale(plateau)
+
+        if coup is not None:
+            pass
+        elif self.algorithme == ALGO_MCTS:
             coup = self._choisir_coup_mcts(plateau)
+        elif self.nb_workers > 1 and self.parallelisme == PARALLELE_RACINE:
+            coup = self._choisir_coup_racine_parallele(plateau)
         elif self.algorithme == ALGO_MINMAX:
             coup = self._choisir_coup_minmax(plateau)
+        elif self.nb_workers > 1:
+            coup = self._choisir_coup_smp(plateau)
         else:
             coup = self._choisir_coup_negamax(plateau)
 
         self.stats['temps'] = time.time() - self.temps_debut
         self.stats['noeuds'] = self.noeuds_explores
+        self.stats['tt_trouves'] = self.table_transposition.trouves
+        self.stats['tt_manques'] = self.table_transposition.manques
         return coup
 
+    # ─── Heuristiques de tri ────────────────────────────────
+
+    def _vieillir_heuristiques_tri(self):
+        """Oublie les killers et divise l'historique par deux entre deux coups :
+        les informations des recherches précédentes comptent moins."""
+        for k in self.killers:
+            k.clear()
+        for table in self.historique.values():
+            for i in range(len(table)):
+                table[i] >>= 1
+
+    def _trier(self, coups, plateau, joueur, tt_best_move, profondeur):
+        """Trie les coups d'un nœud intérieur."""
+        if not self.tri_dynamique:
+            return trier_coups(coups, plateau, joueur, tt_best_move)
+        ply = (self.profondeur_iteration - profondeur) % PLY_MAX
+        return trier_coups(coups, plateau, joueur, tt_best_move,
+                           self.killers[ply], self.historique[joueur])
+
+    def _enregistrer_coupe(self, coup, joueur, profondeur, premier):
+        """Met à jour statistiques, killers et historique après une coupe."""
+        self.stats['coupes'] += 1
+        if premier:
+            self.stats['coupes_premier_coup'] += 1
+        if not self.tri_dynamique:
+            return
+        killers = self.killers[(self.profondeur_iteration - profondeur) % PLY_MAX]
+        if coup not in killers:
+            killers.insert(0, coup)
+            del killers[NB_KILLERS:]
+        self.historique[joueur][coup[0] * TAILLE + coup[1]] += profondeur * profondeur
+
+    # ─── Fin de partie ──────────────────────────────────────
+
+    def _choisir_coup_finale(self, plateau):
+        """Résolution par le solveur de fin de partie.
+        Retourne None si la position est trop loin de la fin, si le temps
+        alloué ne suffit pas, ou si la partie est perdue en mode gain/nul/perte
+        (la recherche heuristique choisit alors le coup le plus résistant)."""
+        self.coup_finale = None
+        vides = compter_cases_vides(plateau)
+        if vides > max(self.seuil_finale, self.seuil_gain):
+            return None
+
+        mode = FINALE_EXACTE if vides <= self.seuil_finale else FINALE_GAIN
+        self.solveur.mode = mode
+        bb = bitboard.depuis_plateau(plateau)
+        echeance = self.temps_debut + self.temps_max * FRACTION_TEMPS_FINALE
+        resultat = self.solveur.resoudre(bb[self.couleur], bb[adversaire(self.couleur)],
+                                         echeance)
+        self.noeuds_explores += self.solveur.noeuds
+        if resultat is None:
+            self.coup_finale = self.solveur.meilleur_partiel
+            return None
+
+        score, coup = resultat
+        if mode == FINALE_GAIN and score < 0:
+            return None
+        self.stats['profondeur_atteinte'] = vides
+        self.stats['score_finale'] = score
+        return coup
+
+    def _profondeur_limite(self, vides):
+        """Profondeur maximale de l'approfondissement itératif : jusqu'à la
+        fin de la partie sous le seuil du solveur exact."""
+        return vides if vides <= self.seuil_finale else self.profondeur_max
+
+    def _premier_coup(self, coups):
+        """Coup cherché en premier à la racine : le meilleur coup partiel
+        du solveur s'il a manqué de temps, sinon le premier coup."""
+        if self.coup_finale in coups:
+            return self.coup_finale
+        return coups[0]
+
     # ─── NegaMax ────────────────────────────────────────────
 
     def _choisir_coup_negamax(self, plateau):
         """Choix de coup par NegaMax avec approfondissement itératif."""
-        coups = coups_valides_rapide(plateau, self.couleur)
-        vides = compter_cases_vides(plateau)
-
-        if vides <= 14:
-            profondeur_limite = vides
-        else:
-            profondeur_limite = self.profondeur_max
-
-        meilleur_coup = coups[0]
+        p = self.primitives
+        plateau = p.depuis_plateau(plateau)
+        coups = p.coups_valides_rapide(plateau, self.couleur)
+        vides = p.compter_cases_vides(plateau)
+        self.hash_courant = p.zobrist_hash(plateau, self.couleur)
+
+        profondeur_limite = self._profondeur_limite(vides)
+        meilleur_coup = self._premier_coup(coups)
         meilleur_score = -INF
 
-        for profondeur in range(1, profondeur_limite + 1):
+        # Processus auxiliaire Lazy SMP : décalage d'une itération sur la
+        # recherche principale
+        for profondeur in range(1 + self.decalage_profondeur, profondeur_limite + 1):
             if self.timeout:
                 break
+            self.profondeur_iteration = profondeur
 
-            score_courant = -INF
-            coup_courant = None
             coups_tries = trier_coups(coups, plateau, self.couleur, meilleur_coup)
+            if self.rng_racine is not None:
+                # Processus auxiliaire : ordre différent après le meilleur coup
+                # connu, pour explorer d'autres sous-arbres que le principal
+                reste = coups_tries[1:]
+                self.rng_racine.shuffle(reste)
+                coups_tries[1:] = reste
+
+            # Fenêtre d'aspiration : on parie que le score reste proche de
+            # celui de l'itération précédente, et on élargit en cas d'échec
+            if (self.aspiration and profondeur > 2 and
+                    abs(meilleur_score) < INF - 200):
+                alpha = meilleur_score - FENETRE_ASPIRATION
+                beta = meilleur_score + FENETRE_ASPIRATION
+            else:
+                alpha = -INF
+                beta = INF
 
-            alpha = -INF
-            beta = INF
-
-            for coup in coups_tries:
+            while True:
+                score_courant, coup_courant = self._negamax_racine(
+                    plateau, coups_tries, profondeur, alpha, beta)
                 if self.timeout:
                     break
-
-                l, c = coup
-                pions = jouer_coup_rapide(plateau, l, c, self.couleur)
-                if pions is None:
-                    continue
-
-                score = -self._negamax(plateau, adversaire(self.couleur),
-                                       profondeur - 1, -beta, -alpha)
-                annuler_coup(plateau, l, c, self.couleur, pions)
-
-                if score > score_courant:
-                    score_courant = score
-                    coup_courant = coup
-                if score > alpha:
-                    alpha = score
+                if score_courant <= alpha:
+                    alpha = -INF  # Échec bas
+                elif score_courant >= beta:
+                    beta = INF  # Échec haut : le coup réfutant passe en tête
+                    coups_tries.remove(coup_courant)
+                    coups_tries.insert(0, coup_courant)
+                else:
+                    break
+                self.stats['re_recherches'] += 1
 
             if not self.timeout and coup_courant is not None:
                 meilleur_coup = coup_courant
@@ -712,26 +1730,210 @@ class IAOthello:
             if meilleur_score >= INF - 200:
                 break
 
+        self.score_racine = meilleur_score
         return meilleur_coup
 
-    # ─── MinMax ─────────────────────────────────────────────
+    def _choisir_coup_smp(self, plateau):
+        """Lazy SMP : les processus auxiliaires cherchent la même position
+        pendant la recherche principale et remplissent la table partagée.
+        Le coup retenu est celui de l'itération complète la plus profonde."""
+        if self.groupe_smp is None:
+            self.groupe_smp = GroupeLazySMP(self.options_auxiliaires,
+                                            self.table_transposition,
+                                            self.nb_workers - 1)
+        self.groupe_smp.lancer(plateau, self.couleur, self.temps_debut,
+                               self.table_transposition.generation)
+        meilleur_coup = self._choisir_coup_negamax(plateau)
+        profondeur_max = self.stats['profondeur_atteinte']
+
+        for profondeur, coup, noeuds in self.groupe_smp.collecter(
+                self.temps_debut + self.temps_max):
+            self.noeuds_explores += noeuds
+            if coup is not None and profondeur > profondeur_max:
+                meilleur_coup = coup
+                profondeur_max = profondeur
+        self.stats['profondeur_atteinte'] = profondeur_max
+        return meilleur_coup
 
-    def _choisir_coup_minmax(self, plateau):
-        """Choix de coup par MinMax avec approfondissement itératif."""
-        coups = coups_valides_rapide(plateau, self.couleur)
-        vides = compter_cases_vides(plateau)
+    # ─── Partage de la racine ───────────────────────────────
 
-        if vides <= 14:
-            profondeur_limite = vides
-        else:
-            profondeur_limite = self.profondeur_max
+    def _choisir_coup_racine_parallele(self, plateau):
+        """Choix de coup avec approfondissement itératif, les coups de la
+        racine étant répartis entre les processus de self.pool_racine."""
+        if self.pool_racine is None:
+            self.pool_racine = PoolRacine(self.nb_workers)
+        p = self.primitives
+        bb = p.depuis_plateau(plateau)
+        coups = p.coups_valides_rapide(bb, self.couleur)
+        vides = p.compter_cases_vides(bb)
+
+        profondeur_limite = self._profondeur_limite(vides)
+        meilleur_coup = self._premier_coup(coups)
+        echeance = self.temps_debut + self.temps_max
+
+        for profondeur in range(1, profondeur_limite + 1):
+            coups_tries = trier_coups(coups, bb, self.couleur, meilleur_coup)
+            resultat = self._racine_parallele(plateau, coups_tries, profondeur, echeance)
+            if resultat is None:
+                break
+            meilleur_score, meilleur_coup = resultat
+            self.score_racine = meilleur_score
+            self.stats['profondeur_atteinte'] = profondeur
+            if meilleur_score >= INF - 200:
+                break
+
+        return meilleur_coup
 
+    def _racine_parallele(self, plateau, coups, profondeur, echeance):
+        """Une itération du partage de la racine.
+
+        Le premier coup (meilleur coup de l'itération précédente) est cherché
+        seul en fenêtre complète pour fixer alpha. Les autres sont ensuite
+        cherchés en parallèle avec une fenêtre nulle au-dessus de cet alpha,
+        et re-cherchés en fenêtre (alpha, INF) s'ils dépassent leur fenêtre :
+        alpha a pu monter depuis leur lancement, sans que leur score, simple
+        borne inférieure, suffise à les écarter.
+        Retourne (meilleur_score, meilleur_coup), ou None si le temps est
+        écoulé avant la fin de l'itération."""
+        def soumettre(coup, alpha, beta):
+            return self.pool_racine.soumettre(self.options_auxiliaires, plateau, self.couleur,
+                                              coup, profondeur, alpha, beta, self.temps_debut)
+
+        # Future → (coup, fenêtre complète ?, alpha de la fenêtre)
+        en_cours = {soumettre(coups[0], -INF, INF): (coups[0], True, -INF)}
+        alpha = -INF
         meilleur_coup = coups[0]
+        freres_lances = False
+
+        while en_cours:
+            restant = echeance - time.time()
+            faits, _ = wait(en_cours, timeout=None if math.isinf(restant) else max(restant, 0),
+                            return_when=FIRST_COMPLETED)
+            temps_ecoule = not faits
+            for future in faits:
+                coup, complete, alpha_fenetre = en_cours.pop(future)
+                score, timeout, noeuds, coupes = future.result()
+                self.noeuds_explores += noeuds
+                self.stats['coupes'] += coupes
+                if timeout:
+                    temps_ecoule = True
+                elif complete:
+                    if score > alpha:
+                        alpha = score
+                        meilleur_coup = coup
+                elif score > alpha_fenetre:
+                    # Échec haut de la fenêtre nulle : valeur exacte nécessaire
+                    alpha_fenetre = max(alpha_fenetre, alpha)
+                    en_cours[soumettre(coup, alpha_fenetre, INF)] = (coup, True, alpha_fenetre)
+                    self.stats['re_recherches'] += 1
+            if temps_ecoule:
+                # Temps écoulé : les tâches déjà lancées s'arrêtent d'elles-mêmes
+                for future in en_cours:
+                    future.cancel()
+                self.timeout = True
+                return None
+
+            if not freres_lances:
+                freres_lances = True
+                for coup in coups[1:]:
+                    en_cours[soumettre(coup, alpha, alpha + FENETRE_NULLE)] = (coup, False, alpha)
+
+        return alpha, meilleur_coup
+
+    def score_coup_racine(self, plateau, coup, profondeur, alpha, beta):
+        """Score, du point de vue de self.couleur, d'un coup de la racine
+        cherché à la profondeur donnée dans la fenêtre (alpha, beta).
+        Point d'entrée des processus du partage de la racine."""
+        p = self.primitives
+        plateau = p.depuis_plateau(plateau)
+        self.hash_courant = p.zobrist_hash(plateau, self.couleur)
+        self.profondeur_iteration = profondeur
+
+        l, c = coup
+        pions = p.jouer_coup_rapide(plateau, l, c, self.couleur)
+        self.hash_courant ^= p.delta_zobrist(l, c, self.couleur, pions) ^ p.cle_joueur
+        adv = adversaire(self.couleur)
+        if self.algorithme == ALGO_MINMAX:
+            score = self._minmax(plateau, adv, profondeur - 1, alpha, beta, False)
+        else:
+            score = -self._negamax(plateau, adv, profondeur - 1, -beta, -alpha)
+        p.annuler_coup(plateau, l, c, self.couleur, pions)
+        return score
+
+    def fermer(self):
+        """Arrête les processus de la recherche parallèle et libère la
+        mémoire partagée."""
+        if self.groupe_smp is not None:
+            self.groupe_smp.fermer()
+            self.groupe_smp = None
+        if self.pool_racine is not None:
+            self.pool_racine.fermer()
+            self.pool_racine = None
+        if self.pool_mcts is not None:
+            self.pool_mcts.fermer()
+            self.pool_mcts = None
+        if isinstance(self.table_transposition, TableTranspositionPartagee):
+            self.table_transposition.fermer()
+
+    def _negamax_racine(self, plateau, coups, profondeur, alpha, beta):
+        """Recherche les coups de la racine dans la fenêtre (alpha, beta).
+        Retourne (meilleur_score, meilleur_coup)."""
+        p = self.primitives
+        adv = adversaire(self.couleur)
+        score_courant = -INF
+        coup_courant = None
+
+        for coup in coups:
+            if self.timeout:
+                break
+
+            l, c = coup
+            pions = p.jouer_coup_rapide(plateau, l, c, self.couleur)
+            if pions is None:
+                continue
+            delta = p.delta_zobrist(l, c, self.couleur, pions) ^ p.cle_joueur
+            self.hash_courant ^= delta
+
+            if coup_courant is None or not self.pvs:
+                score = -self._negamax(plateau, adv, profondeur - 1, -beta, -alpha)
+            else:
+                score = -self._negamax(plateau, adv, profondeur - 1,
+                                       -alpha - FENETRE_NULLE, -alpha)
+                if alpha < score < beta and not self.timeout:
+                    score = -self._negamax(plateau, adv, profondeur - 1,
+                                           -beta, -alpha)
+                    self.stats['re_recherches'] += 1
+            p.annuler_coup(plateau, l, c, self.couleur, pions)
+            self.hash_courant ^= delta
+
+            if score > score_courant:
+                score_courant = score
+                coup_courant = coup
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        return score_courant, coup_courant
+
+    # ─── MinMax ─────────────────────────────────────────────
+
+    def _choisir_coup_minmax(self, plateau):
+        """Choix de coup par MinMax avec approfondissement itératif."""
+        p = self.primitives
+        plateau = p.depuis_plateau(plateau)
+        coups = p.coups_valides_rapide(plateau, self.couleur)
+        vides = p.compter_cases_vides(plateau)
+        self.hash_courant = p.zobrist_hash(plateau, self.couleur)
+
+        profondeur_limite = self._profondeur_limite(vides)
+        meilleur_coup = self._premier_coup(coups)
         meilleur_score = -INF
 
         for profondeur in range(1, profondeur_limite + 1):
             if self.timeout:
                 break
+            self.profondeur_iteration = profondeur
 
             score_courant = -INF
             coup_courant = None
@@ -745,13 +1947,16 @@ class IAOthello:
                     break
 
                 l, c = coup
-                pions = jouer_coup_rapide(plateau, l, c, self.couleur)
+                pions = p.jouer_coup_rapide(plateau, l, c, self.couleur)
                 if pions is None:
                     continue
+                delta = p.delta_zobrist(l, c, self.couleur, pions) ^ p.cle_joueur
+                self.hash_courant ^= delta
 
                 score = self._minmax(plateau, adversaire(self.couleur),
                                      profondeur - 1, alpha, beta, False)
-                annuler_coup(plateau, l, c, self.couleur, pions)
+                p.annuler_coup(plateau, l, c, self.couleur, pions)
+                self.hash_courant ^= delta
 
                 if score > score_courant:
                     score_courant = score
@@ -776,9 +1981,14 @@ class IAOthello:
             return 0
 
         self.noeuds_explores += 1
-
-        h = zobrist_hash(plateau, joueur)
-        tt_entry = self.table_transposition.get(h)
+        p = self.primitives
+
+        h = self.hash_courant
+        if self.debug_hash:
+            assert h == p.zobrist_hash(plateau, joueur), "hash incrémental désynchronisé"
+        if self.tt_symetrique:
+            h, sym = symetrie.cle_canonique(h)
+        tt_entry = self.table_transposition.lire(h)
         tt_best_move = None
 
         if tt_entry is not None:
@@ -792,23 +2002,28 @@ class IAOthello:
                 elif tt_type == TT_ALPHA and tt_score <= alpha:
                     return tt_score
             tt_best_move = tt_move
+            if self.tt_symetrique:
+                tt_best_move = symetrie.transformer_coup(tt_move, symetrie.INVERSES[sym])
 
         if profondeur == 0:
             score = self.fn_evaluation(plateau, self.couleur)
-            self.table_transposition[h] = (0, score, TT_EXACT, None)
+            self.table_transposition.ecrire(h, 0, score, TT_EXACT, None)
             return score
 
-        coups = coups_valides_rapide(plateau, joueur)
+        coups = p.coups_valides_rapide(plateau, joueur)
 
         if not coups:
-            coups_adv = coups_valides_rapide(plateau, adversaire(joueur))
+            coups_adv = p.coups_valides_rapide(plateau, adversaire(joueur))
             if not coups_adv:
                 return self.fn_evaluation(plateau, self.couleur)
             else:
-                return self._minmax(plateau, adversaire(joueur),
-                                    profondeur, alpha, beta, not est_maximisant)
+                self.hash_courant ^= p.cle_joueur
+                score = self._minmax(plateau, adversaire(joueur),
+                                     profondeur, alpha, beta, not est_maximisant)
+                self.hash_courant ^= p.cle_joueur
+                return score
 
-        coups = trier_coups(coups, plateau, joueur, tt_best_move)
+        coups = self._trier(coups, plateau, joueur, tt_best_move, profondeur)
         meilleur_coup = coups[0]
 
         if est_maximisant:
@@ -818,12 +2033,15 @@ class IAOthello:
                 if self.timeout:
                     return 0
                 l, c = coup
-                pions = jouer_coup_rapide(plateau, l, c, joueur)
+                pions = p.jouer_coup_rapide(plateau, l, c, joueur)
                 if pions is None:
                     continue
+                delta = p.delta_zobrist(l, c, joueur, pions) ^ p.cle_joueur
+                self.hash_courant ^= delta
                 score = self._minmax(plateau, adversaire(joueur),
                                      profondeur - 1, alpha, beta, False)
-                annuler_coup(plateau, l, c, joueur, pions)
+                p.annuler_coup(plateau, l, c, joueur, pions)
+                self.hash_courant ^= delta
                 if score > meilleur_score:
                     meilleur_score = score
                     meilleur_coup = coup
@@ -831,7 +2049,7 @@ class IAOthello:
                     alpha = score
                     tt_type = TT_EXACT
                 if alpha >= beta:
-                    self.stats['coupes'] += 1
+                    self._enregistrer_coupe(coup, joueur, profondeur, coup is coups[0])
                     tt_type = TT_BETA
                     break
         else:
@@ -841,12 +2059,15 @@ class IAOthello:
                 if self.timeout:
                     return 0
                 l, c = coup
-                pions = jouer_coup_rapide(plateau, l, c, joueur)
+                pions = p.jouer_coup_rapide(plateau, l, c, joueur)
                 if pions is None:
                     continue
+                delta = p.delta_zobrist(l, c, joueur, pions) ^ p.cle_joueur
+                self.hash_courant ^= delta
                 score = self._minmax(plateau, adversaire(joueur),
                                      profondeur - 1, alpha, beta, True)
-                annuler_coup(plateau, l, c, joueur, pions)
+                p.annuler_coup(plateau, l, c, joueur, pions)
+                self.hash_courant ^= delta
                 if score < meilleur_score:
                     meilleur_score = score
                     meilleur_coup = coup
@@ -854,43 +2075,136 @@ class IAOthello:
                     beta = score
                     tt_type = TT_EXACT
                 if alpha >= beta:
-                    self.stats['coupes'] += 1
+                    self._enregistrer_coupe(coup, joueur, profondeur, coup is coups[0])
                     tt_type = TT_ALPHA
                     break
 
         if not self.timeout:
-            self.table_transposition[h] = (profondeur, meilleur_score,
+            if self.tt_symetrique:
+                meilleur_coup = symetrie.transformer_coup(meilleur_coup, sym)
+            self.table_transposition.ecrire(h, profondeur, meilleur_score,
                                             tt_type, meilleur_coup)
         return meilleur_score
 
     # ─── MCTS ───────────────────────────────────────────────
 
     def _choisir_coup_mcts(self, plateau):
-        """Choix de coup par Monte Carlo Tree Search."""
-        racine = NoeudMCTS(plateau, self.couleur)
+        """Choix de coup par Monte Carlo Tree Search : le coup de la racine
+        le plus visité. Avec nb_workers > 1, les processus auxiliaires font
+        croître leurs propres arbres (visites additionnées) ou, avec
+        PARALLELE_FEUILLES, se partagent les simulations."""
+        if self.nb_workers > 1 and self.pool_mcts is None:
+            self.pool_mcts = PoolMCTS(self.nb_workers - 1)
+        arbres = []
+        if self.nb_workers > 1 and self.parallelisme != PARALLELE_FEUILLES:
+            arbres = self.pool_mcts.lancer_arbres(self.options_auxiliaires, plateau,
+                                                  self.couleur, self.temps_debut)
+
+        racine = self._mcts_arbre(plateau)
+        visites = {enfant.coup: enfant.visites for enfant in racine.enfants}
+        for tache in arbres:
+            visites_arbre, iterations = tache.result()
+            self.stats['mcts_iterations'] += iterations
+            self.stats['mcts_simulations'] += iterations
+            self.noeuds_explores += iterations
+            for coup, n in visites_arbre.items():
+                visites[coup] = visites.get(coup, 0) + n
+
+        if not visites:
+            coups = coups_valides_rapide(plateau, self.couleur)
+            return coups[0] if coups else None
+        return max(visites, key=visites.get)
+
+    def _mcts_arbre(self, plateau):
+        """Fait croître l'arbre MCTS de la position jusqu'à l'échéance
+        temps_max et retourne sa racine.
+
+        En parallélisme aux feuilles, la boucle ne s'arrête jamais sur un
+        processus auxiliaire : chacun a au plus une tâche en cours, les
+        MCTS_SIMULATIONS_FEUILLE simulations d'une feuille, dont le chemin
+        porte une perte virtuelle jusqu'à son retour pour que les sélections
+        suivantes choisissent d'autres feuilles. Pendant ce temps, le
+        processus principal poursuit ses propres itérations."""
+        feuilles = self.pool_mcts is not None and self.parallelisme == PARALLELE_FEUILLES
+        lot = self.mcts_simulations_lot
+        en_cours = {}  # Future → feuille simulée par un processus auxiliaire
+        racine = None
+        if self.mcts_reutilisation and self.arbre_mcts is not None:
+            racine = self._mcts_sous_arbre(self.arbre_mcts, plateau, self.couleur)
+        if racine is None:
+            racine = NoeudMCTS.depuis_plateau(plateau, self.couleur)
+            self.nb_noeuds_mcts = 1
+        else:
+            # Le reste de l'ancien arbre n'est plus référencé
+            racine.parent = None
+            self.nb_noeuds_mcts = racine.taille()
+            self.stats['mcts_visites_reutilisees'] = racine.visites
+        self.arbre_mcts = racine if self.mcts_reutilisation else None
 
         iterations = 0
+        simulations = 0
         while time.time() - self.temps_debut < self.temps_max:
             # Sélection
             noeud = self._mcts_selection(racine)
-            # Expansion
-            if not noeud.est_terminal() and noeud.visites > 0:
+            # Expansion (tant que l'arbre n'a pas atteint sa taille maximale)
+            if (not noeud.est_terminal() and noeud.visites > 0 and
+                    self.nb_noeuds_mcts < self.mcts_max_noeuds):
                 noeud = self._mcts_expansion(noeud)
-            # Simulation
-            resultat = self._mcts_simulation(noeud)
-            # Rétropropagation
-            self._mcts_retropropagation(noeud, resultat)
+            # Simulation, confiée à un processus auxiliaire libre en
+            # parallélisme aux feuilles
+            if (feuilles and len(en_cours) < self.pool_mcts.nb_workers and
+                    not noeud.est_terminal()):
+                tache = self.pool_mcts.simuler(noeud.noirs, noeud.blancs, noeud.joueur,
+                                               self.couleur, MCTS_SIMULATIONS_FEUILLE,
+                                               amaf=self.mcts_rave)
+                en_cours[tache] = noeud
+                self._mcts_perte_virtuelle(noeud, MCTS_SIMULATIONS_FEUILLE)
+            else:
+                resultat = self._mcts_simulation(noeud, lot)
+                # Rétropropagation
+                self._mcts_retropropagation(noeud, resultat, lot)
+                simulations += lot
             iterations += 1
             self.noeuds_explores += 1
 
-        self.stats['profondeur_atteinte'] = iterations
+            # Résultats des processus auxiliaires, sans les attendre
+            for tache in [tache for tache in en_cours if tache.done()]:
+                noeud = en_cours.pop(tache)
+                resultat = tache.result()
+                if self.mcts_rave:
+                    # Cases jouées de chaque simulation : statistiques AMAF
+                    for partie in resultat:
+                        self._mcts_amaf(noeud, *partie)
+                    resultat = sum(partie[0] for partie in resultat)
+                self._mcts_perte_virtuelle(noeud, -MCTS_SIMULATIONS_FEUILLE)
+                self._mcts_retropropagation(noeud, resultat, MCTS_SIMULATIONS_FEUILLE)
+                simulations += MCTS_SIMULATIONS_FEUILLE
+
+        # Tâches encore en cours à l'échéance : leurs résultats sont perdus
+        for tache, noeud in en_cours.items():
+            tache.cancel()
+            self._mcts_perte_virtuelle(noeud, -MCTS_SIMULATIONS_FEUILLE)
 
-        if not racine.enfants:
-            coups = coups_valides_rapide(plateau, self.couleur)
-            return coups[0] if coups else None
-
-        meilleur = max(racine.enfants, key=lambda n: n.visites)
-        return meilleur.coup
+        self.stats['profondeur_atteinte'] = iterations
+        self.stats['mcts_iterations'] = iterations
+        self.stats['mcts_simulations'] = simulations
+        self.stats['mcts_noeuds_arbre'] = self.nb_noeuds_mcts
+        return racine
+
+    def _mcts_sous_arbre(self, racine, plateau, joueur):
+        """Nœud de l'arbre du coup précédent correspondant à la position
+        (plateau, joueur au trait), cherché jusqu'à
+        MCTS_PROFONDEUR_REUTILISATION demi-coups sous la racine ; None s'il
+        n'y figure pas."""
+        bb = bitboard.depuis_plateau(plateau)
+        noirs, blancs = bb[NOIR], bb[BLANC]
+        niveau = [racine]
+        for _ in range(MCTS_PROFONDEUR_REUTILISATION + 1):
+            for noeud in niveau:
+                if noeud.joueur == joueur and noeud.noirs == noirs and noeud.blancs == blancs:
+                    return noeud
+            niveau = [enfant for noeud in niveau for enfant in noeud.enfants]
+        return None
 
     def _mcts_selection(self, noeud):
         """Sélection UCB1 : descend l'arbre vers la feuille la plus prometteuse."""
@@ -901,75 +2215,184 @@ class IAOthello:
         return noeud
 
     def _meilleur_enfant_ucb1(self, noeud, c=1.41):
-        """Sélectionne le meilleur enfant selon la formule UCB1."""
+        """Sélectionne le meilleur enfant selon la formule UCB1.
+
+        Avec mcts_rave, le taux de victoires d'un coup est mêlé à son taux
+        AMAF, avec un poids β qui décroît quand le coup est visité ; avec
+        mcts_biais, le terme MCTS_POIDS_BIAIS * H / (n + 1) s'y ajoute, H
+        étant l'écart entre l'évaluation du coup et la moyenne de celles de
+        ses frères, ramené dans [-1, 1]. Avec mcts_elargissement, seuls les
+        premiers enfants sont candidats."""
+        enfants = noeud.enfants
+        if self.mcts_elargissement:
+            limite = MCTS_ELARGISSEMENT_C * noeud.visites ** MCTS_ELARGISSEMENT_ALPHA
+            enfants = enfants[:math.ceil(limite)]
+        log_visites = math.log(noeud.visites)
+        pour_couleur = noeud.joueur == self.couleur
+        rave = self.mcts_rave
+        biais = self.mcts_biais is not None
+        if biais:
+            moyenne = sum(enfant.biais for enfant in enfants) / len(enfants)
+            echelle = _ECHELLES_BIAIS[self.mcts_biais]
+
         def ucb1(enfant):
-            if enfant.visites == 0:
+            n = enfant.visites
+            if n == 0:
                 return float('inf')
-            exploitation = enfant.victoires / enfant.visites
-            exploration = c * math.sqrt(math.log(noeud.visites) / enfant.visites)
-            if noeud.joueur == self.couleur:
-                return exploitation + exploration
-            else:
-                return (1.0 - exploitation) + exploration
-        return max(noeud.enfants, key=ucb1)
+            exploitation = enfant.victoires / n
+            if rave and enfant.amaf_visites:
+                beta = math.sqrt(MCTS_RAVE_EQUIVALENCE / (3 * n + MCTS_RAVE_EQUIVALENCE))
+                exploitation = ((1.0 - beta) * exploitation +
+                                beta * enfant.amaf_victoires / enfant.amaf_visites)
+            if not pour_couleur:
+                exploitation = 1.0 - exploitation
+            exploration = c * math.sqrt(log_visites / n)
+            if biais:
+                h = math.tanh((enfant.biais - moyenne) / echelle)
+                return exploitation + exploration + MCTS_POIDS_BIAIS * h / (n + 1)
+            return exploitation + exploration
+        return max(enfants, key=ucb1)
 
     def _mcts_expansion(self, noeud):
-        """Expansion : ajoute un enfant non exploré au noeud."""
-        idx = random.randint(0, len(noeud.coups_non_explores) - 1)
-        coup = noeud.coups_non_explores.pop(idx)
-        nouveau_plateau = [row[:] for row in noeud.plateau]
-        jouer_coup_rapide(nouveau_plateau, coup[0], coup[1], noeud.joueur)
-        enfant = NoeudMCTS(nouveau_plateau, adversaire(noeud.joueur),
-                           coup=coup, parent=noeud)
-        noeud.enfants.append(enfant)
+        """Expansion : ajoute un enfant non exploré au noeud (tous ses
+        enfants avec mcts_elargissement) et retourne celui à simuler."""
+        if self.mcts_elargissement:
+            return self._mcts_expansion_complete(noeud)
+        # Coup tiré au hasard parmi les bits du masque
+        masque = noeud.non_explores
+        for _ in range(random.randrange(masque.bit_count())):
+            masque &= masque - 1
+        bit = masque & -masque
+        noeud.non_explores ^= bit
+
+        enfant = self._mcts_enfant(noeud, bit)
+        if noeud.enfants:
+            noeud.enfants.append(enfant)
+        else:
+            noeud.enfants = [enfant]
         return enfant
 
-    def _mcts_simulation(self, noeud):
-        """Simulation : partie aléatoire depuis le noeud jusqu'à la fin."""
-        plateau = [row[:] for row in noeud.plateau]
-        joueur = noeud.joueur
-
-        while True:
-            coups = coups_valides_rapide(plateau, joueur)
-            if not coups:
-                coups_adv = coups_valides_rapide(plateau, adversaire(joueur))
-                if not coups_adv:
-                    break
-                joueur = adversaire(joueur)
-                continue
-            coup = random.choice(coups)
-            jouer_coup_rapide(plateau, coup[0], coup[1], joueur)
-            joueur = adversaire(joueur)
-
-        noirs, blancs = compter_pions(plateau)
-        if self.couleur == NOIR:
-            return 1.0 if noirs > blancs else (0.0 if noirs < blancs else 0.5)
+    def _mcts_expansion_complete(self, noeud):
+        """Expansion de tous les coups du nœud (élargissement progressif) :
+        les enfants sont triés du meilleur au moins bon selon l'évaluation
+        de mcts_biais, à défaut selon _PRIORITE_COUP ; retourne le premier."""
+        enfants = []
+        masque = noeud.non_explores
+        while masque:
+            bit = masque & -masque
+            masque ^= bit
+            enfants.append(self._mcts_enfant(noeud, bit))
+        noeud.non_explores = 0
+        if self.fn_biais is not None:
+            enfants.sort(key=lambda enfant: -enfant.biais)
         else:
-            return 1.0 if blancs > noirs else (0.0 if blancs < noirs else 0.5)
+            # Ordre aléatoire entre coups de même priorité
+            random.shuffle(enfants)
+            enfants.sort(key=lambda enfant: (_PRIORITE_COUP[enfant.coup[0]][enfant.coup[1]]
+                                             if enfant.coup is not None else 0))
+        noeud.enfants = enfants
+        return enfants[0]
+
+    def _mcts_enfant(self, noeud, bit):
+        """Nouvel enfant du nœud pour le coup bit (_PASSE_MCTS pour passer)."""
+        self.nb_noeuds_mcts += 1
+        noirs, blancs = noeud.noirs, noeud.blancs
+        if bit == _PASSE_MCTS:
+            coup = None
+        else:
+            coup = bitboard.COUPS[bit.bit_length() - 1]
+            if noeud.joueur == NOIR:
+                retournes = bitboard.masque_retournements(bit, noirs, blancs)
+                noirs |= retournes | bit
+                blancs ^= retournes
+            else:
+                retournes = bitboard.masque_retournements(bit, blancs, noirs)
+                blancs |= retournes | bit
+                noirs ^= retournes
+        enfant = NoeudMCTS(noirs, blancs, adversaire(noeud.joueur), coup=coup, parent=noeud)
+        if self.fn_biais is not None:
+            enfant.biais = self.fn_biais(enfant.plateau(), noeud.joueur)
+        return enfant
 
-    def _mcts_retropropagation(self, noeud, resultat):
-        """Rétropropagation : met à jour les stats de la feuille à la racine."""
+    def _mcts_simulation(self, noeud, nb=1):
+        """Simulation : nb parties rapides depuis le noeud jusqu'à la fin ;
+        retourne la somme de leurs résultats. Avec mcts_rave, chaque partie
+        met aussi à jour les statistiques AMAF du chemin."""
+        if self.mcts_rave:
+            total = 0.0
+            for _ in range(nb):
+                resultat, joues_noirs, joues_blancs = simuler_partie(
+                    noeud.noirs, noeud.blancs, noeud.joueur, self.couleur, amaf=True)
+                self._mcts_amaf(noeud, resultat, joues_noirs, joues_blancs)
+                total += resultat
+            return total
+        if nb == 1:
+            return simuler_partie(noeud.noirs, noeud.blancs, noeud.joueur, self.couleur)
+        return simuler_parties(noeud.noirs, noeud.blancs, noeud.joueur, self.couleur, nb)
+
+    def _mcts_amaf(self, noeud, resultat, joues_noirs, joues_blancs):
+        """Mise à jour AMAF (« all moves as first ») d'une simulation : à
+        chaque nœud du chemin, de la feuille à la racine, les enfants dont
+        la case a ensuite été jouée par le même joueur, dans l'arbre ou la
+        simulation, comptent la partie comme si leur coup avait été joué.
+        joues_noirs / joues_blancs : cases jouées dans la simulation."""
+        joues = [0, joues_noirs, joues_blancs]
+        bits = bitboard.BITS
+        while noeud is not None:
+            masque = joues[noeud.joueur]
+            if masque:
+                for enfant in noeud.enfants:
+                    coup = enfant.coup
+                    if coup is not None and masque & bits[coup[0] * TAILLE + coup[1]]:
+                        enfant.amaf_visites += 1
+                        enfant.amaf_victoires += resultat
+            parent = noeud.parent
+            if parent is not None and noeud.coup is not None:
+                joues[parent.joueur] |= bits[noeud.coup[0] * TAILLE + noeud.coup[1]]
+            noeud = parent
+
+    def _mcts_retropropagation(self, noeud, resultat, nb=1):
+        """Rétropropagation : met à jour les stats de la feuille à la racine
+        (resultat : somme des résultats de nb simulations)."""
         while noeud is not None:
-            noeud.visites += 1
+            noeud.visites += nb
             noeud.victoires += resultat
             noeud = noeud.parent
 
+    def _mcts_perte_virtuelle(self, noeud, nb):
+        """Perte virtuelle de nb simulations sur le chemin de la feuille à
+        la racine : chaque nœud les compte perdues par le joueur qui l'a
+        choisi. Retirée avec nb négatif quand les vraies simulations
+        reviennent."""
+        while noeud is not None:
+            noeud.visites += nb
+            parent = noeud.parent
+            if parent is not None and parent.joueur != self.couleur:
+                noeud.victoires += nb
+            noeud = parent
+
     # ─── NegaMax (méthode interne) ──────────────────────────
 
     def _negamax(self, plateau, joueur, profondeur, alpha, beta):
         """
         NegaMax avec élagage Alpha-Beta et table de transposition.
         """
-        # Vérifier le timeout
-        if time.time() - self.temps_debut > self.temps_max:
+        # Vérifier le timeout (et l'arrêt demandé par la recherche principale)
+        if (time.time() - self.temps_debut > self.temps_max or
+                (self.arret is not None and self.arret.value)):
             self.timeout = True
             return 0
 
         self.noeuds_explores += 1
+        p = self.primitives
 
         # Lookup dans la table de transposition
-        h = zobrist_hash(plateau, joueur)
-        tt_entry = self.table_transposition.get(h)
+        h = self.hash_courant
+        if self.debug_hash:
+            assert h == p.zobrist_hash(plateau, joueur), "hash incrémental désynchronisé"
+        if self.tt_symetrique:
+            h, sym = symetrie.cle_canonique(h)
+        tt_entry = self.table_transposition.lire(h)
         tt_best_move = None
 
         if tt_entry is not None:
@@ -983,46 +2406,68 @@ class IAOthello:
                 elif tt_type == TT_ALPHA and tt_score <= alpha:
                     return tt_score
             tt_best_move = tt_move
+            if self.tt_symetrique:
+                tt_best_move = symetrie.transformer_coup(tt_move, symetrie.INVERSES[sym])
 
         # Feuille : évaluation
         if profondeur == 0:
             score = self.fn_evaluation(plateau, joueur)
-            self.table_transposition[h] = (0, score, TT_EXACT, None)
+            self.table_transposition.ecrire(h, 0, score, TT_EXACT, None)
             return score
 
-        coups = coups_valides_rapide(plateau, joueur)
+        coups = p.coups_valides_rapide(plateau, joueur)
 
         # Aucun coup : passer le tour ou fin de partie
         if not coups:
-            coups_adv = coups_valides_rapide(plateau, adversaire(joueur))
+            coups_adv = p.coups_valides_rapide(plateau, adversaire(joueur))
             if not coups_adv:
                 # Fin de partie
                 return self.fn_evaluation(plateau, joueur)
             else:
                 # Passer le tour
-                return -self._negamax(plateau, adversaire(joueur),
-                                      profondeur, -beta, -alpha)
+                self.hash_courant ^= p.cle_joueur
+                score = -self._negamax(plateau, adversaire(joueur),
+                                       profondeur, -beta, -alpha)
+                self.hash_courant ^= p.cle_joueur
+                return score
 
         # Tri des coups pour améliorer les coupes alpha-beta
-        coups = trier_coups(coups, plateau, joueur, tt_best_move)
+        coups = self._trier(coups, plateau, joueur, tt_best_move, profondeur)
 
         meilleur_score = -INF
         meilleur_coup = coups[0]
         tt_type = TT_ALPHA  # Par défaut, borne supérieure
 
+        adv = adversaire(joueur)
+        premier = True
+
         for coup in coups:
             if self.timeout:
                 return 0
 
             l, c = coup
-            pions = jouer_coup_rapide(plateau, l, c, joueur)
+            pions = p.jouer_coup_rapide(plateau, l, c, joueur)
             if pions is None:
                 continue
+            delta = p.delta_zobrist(l, c, joueur, pions) ^ p.cle_joueur
+            self.hash_courant ^= delta
 
-            score = -self._negamax(plateau, adversaire(joueur),
-                                   profondeur - 1, -beta, -alpha)
-
-            annuler_coup(plateau, l, c, joueur, pions)
+            if premier or not self.pvs:
+                # Variante principale : fenêtre complète
+                score = -self._negamax(plateau, adv, profondeur - 1, -beta, -alpha)
+                premier = False
+            else:
+                # PVS : on vérifie avec une fenêtre nulle que le coup ne bat
+                # pas alpha, et on ne re-cherche que s'il la dépasse
+                score = -self._negamax(plateau, adv, profondeur - 1,
+                                       -alpha - FENETRE_NULLE, -alpha)
+                if alpha < score < beta and not self.timeout:
+                    score = -self._negamax(plateau, adv, profondeur - 1,
+                                           -beta, -alpha)
+                    self.stats['re_recherches'] += 1
+
+            p.annuler_coup(plateau, l, c, joueur, pions)
+            self.hash_courant ^= delta
 
             if score > meilleur_score:
                 meilleur_score = score
@@ -1033,17 +2478,30 @@ class IAOthello:
                 tt_type = TT_EXACT
 
             if alpha >= beta:
-                self.stats['coupes'] += 1
+                self._enregistrer_coupe(coup, joueur, profondeur, coup is coups[0])
                 tt_type = TT_BETA
                 break
 
         # Stocker dans la table de transposition
         if not self.timeout:
-            self.table_transposition[h] = (profondeur, meilleur_score,
+            if self.tt_symetrique:
+                meilleur_coup = symetrie.transformer_coup(meilleur_coup, sym)
+            self.table_transposition.ecrire(h, profondeur, meilleur_score,
                                             tt_type, meilleur_coup)
 
         return meilleur_score
 
     def obtenir_stats(self):
         """Retourne les statistiques de la dernière recherche."""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats['taux_coupe_premier'] = (stats['coupes_premier_coup'] / stats['coupes']
+                                       if stats['coupes'] else 0.0)
+        sondes = stats['tt_trouves'] + stats['tt_manques']
+        stats['taux_tt'] = stats['tt_trouves'] / sondes if sondes else 0.0
+        if 'mcts_iterations' in stats:
+            stats['mcts_iterations_par_s'] = (stats['mcts_iterations'] / stats['temps']
+                                              if stats['temps'] else 0.0)
+            stats['mcts_simulations_par_s'] = (stats['mcts_simulations'] / stats['temps']
+                                               if stats['temps'] else 0.0)
+        stats['tt_symetrique'] = self.tt_symetrique
+        return stats
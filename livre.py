@@ -0,0 +1,230 @@
+"""
+Othello IA — Livre d'ouvertures
+===============================
+Les premiers coups d'une partie mènent toujours aux mêmes positions : on
+les cherche une fois pour toutes, hors partie et en profondeur, et
+l'IA lit ensuite le coup dans le livre au lieu de chercher.
+
+  - construire() énumère les positions atteignables en moins de
+    nb_plies demi-coups depuis creer_plateau(), une seule par classe de
+    symétrie, et les cherche sur tous les cœurs (ProcessPoolExecutor)
+  - le fichier binaire contient une entrée de 12 octets par position,
+    triée par hash canonique (symetrie.forme_canonique) :
+    hash (u64), coup (u8, ligne * 8 + colonne dans l'orientation
+    canonique), profondeur (u8), score (i16)
+  - LivreOuvertures projette le fichier en mémoire (mmap) et y cherche
+    une position par dichotomie, sans rien charger au préalable
+
+    python livre.py                      # construit livre.bin
+    python livre.py -n 8 -p 10 -j 8      # plus de plies, plus profond
+    python livre.py --info               # contenu d'un livre existant
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from othello import (
+    TAILLE, BLANC, creer_plateau, coups_valides, jouer_coup, adversaire
+)
+import symetrie
+
+FICHIER_LIVRE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "livre.bin")
+
+# Réglages par défaut de la construction
+NB_PLIES_LIVRE = 6
+PROFONDEUR_LIVRE = 10
+TEMPS_LIVRE = 30.0  # secondes par position
+
+_MAGIQUE = b"OTHLIVRE"
+_VERSION = 1
+_ENTETE = struct.Struct("<8sII")  # magique, version, nombre d'entrées
+_ENTREE = struct.Struct("<QBBh")  # hash, coup, profondeur, score
+_CLE = struct.Struct("<Q")
+
+_SCORE_MAX = 2 ** 15 - 1
+
+
+# ═══════════════════════════════════════════════════════════════
+# Lecture
+# ═══════════════════════════════════════════════════════════════
+
+class LivreOuvertures:
+    """Livre d'ouvertures lu par projection en mémoire du fichier."""
+
+    def __init__(self, chemin=FICHIER_LIVRE):
+        """
+        Args:
+            chemin: fichier écrit par ecrire_livre / construire
+        """
+        self.chemin = chemin
+        with open(chemin, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magique, version, self.nb_entrees = _ENTETE.unpack_from(self._mmap, 0)
+        if magique != _MAGIQUE or version != _VERSION:
+            self._mmap.close()
+            raise ValueError(f"{chemin} : pas un livre d'ouvertures (version {_VERSION})")
+        if len(self._mmap) != _ENTETE.size + self.nb_entrees * _ENTREE.size:
+            self._mmap.close()
+            raise ValueError(f"{chemin} : fichier tronqué")
+
+    def __len__(self):
+        return self.nb_entrees
+
+    def _entree(self, k):
+        """k-ième entrée (hash, coup, profondeur, score)."""
+        return _ENTREE.unpack_from(self._mmap, _ENTETE.size + k * _ENTREE.size)
+
+    def _chercher_hash(self, h):
+        """Entrée de hash h, ou None (recherche par dichotomie)."""
+        bas, haut = 0, self.nb_entrees
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            if _CLE.unpack_from(self._mmap, _ENTETE.size + milieu * _ENTREE.size)[0] < h:
+                bas = milieu + 1
+            else:
+                haut = milieu
+        if bas < self.nb_entrees:
+            entree = self._entree(bas)
+            if entree[0] == h:
+                return entree
+        return None
+
+    def chercher(self, plateau, joueur):
+        """Coup du livre (ligne, col) pour cette position, ou None.
+        Retourne le coup dans l'orientation du plateau donné."""
+        h, s = symetrie.forme_canonique(plateau, joueur)
+        entree = self._chercher_hash(h)
+        if entree is None:
+            return None
+        coup = divmod(entree[1], TAILLE)
+        return symetrie.transformer_coup(coup, symetrie.INVERSES[s])
+
+    def entrees(self):
+        """Itère sur les entrées (hash, coup, profondeur, score)."""
+        for k in range(self.nb_entrees):
+            yield self._entree(k)
+
+    def fermer(self):
+        """Libère la projection du fichier."""
+        self._mmap.close()
+
+
+def ouvrir_livre(chemin=FICHIER_LIVRE):
+    """LivreOuvertures du fichier, ou None s'il n'existe pas."""
+    if not os.path.exists(chemin):
+        return None
+    return LivreOuvertures(chemin)
+
+
+def ecrire_livre(chemin, entrees):
+    """Écrit les entrées [(hash, coup, profondeur, score)] triées par hash."""
+    entrees = sorted(entrees)
+    with open(chemin, "wb") as f:
+        f.write(_ENTETE.pack(_MAGIQUE, _VERSION, len(entrees)))
+        for h, coup, profondeur, score in entrees:
+            score = max(-_SCORE_MAX, min(_SCORE_MAX, round(score)))
+            f.write(_ENTREE.pack(h, coup, profondeur, score))
+
+
+# ═══════════════════════════════════════════════════════════════
+# Construction
+# ═══════════════════════════════════════════════════════════════
+
+def positions_ouverture(nb_plies):
+    """{hash canonique: (plateau canonique, joueur)} des positions atteintes
+    après 0 à nb_plies - 1 demi-coups depuis creer_plateau(), où le joueur
+    au trait a le choix entre plusieurs coups (aucun passe n'est possible
+    si tôt dans la partie)."""
+    positions = {}
+    h, s = symetrie.forme_canonique(creer_plateau(), BLANC)
+    niveau = {h: (symetrie.transformer_plateau(creer_plateau(), s), BLANC)}
+    for _ in range(nb_plies):
+        suivant = {}
+        for h, (plateau, joueur) in niveau.items():
+            coups = coups_valides(plateau, joueur)
+            if len(coups) > 1:
+                positions[h] = (plateau, joueur)
+            for l, c in coups:
+                nouveau, _ = jouer_coup(plateau, l, c, joueur)
+                h2, s = symetrie.forme_canonique(nouveau, adversaire(joueur))
+                if h2 not in positions and h2 not in suivant:
+                    suivant[h2] = (symetrie.transformer_plateau(nouveau, s), adversaire(joueur))
+        niveau = suivant
+    return positions
+
+
+def _chercher_position(plateau, joueur, profondeur, temps_max, strategie):
+    """Tâche du pool : meilleur coup de la position.
+    Retourne (coup, profondeur atteinte, score)."""
+    from ia import IAOthello
+
+    ia = IAOthello(joueur, profondeur_max=profondeur, temps_max=temps_max, strategie=strategie)
+    coup = ia.choisir_coup(plateau)
+    return coup, ia.stats['profondeur_atteinte'], ia.score_racine
+
+
+def construire(chemin=FICHIER_LIVRE, nb_plies=NB_PLIES_LIVRE, profondeur=PROFONDEUR_LIVRE,
+               temps_max=TEMPS_LIVRE, strategie=None, jobs=None, verbose=True):
+    """Construit le livre des nb_plies premiers demi-coups et l'écrit dans chemin.
+
+    Args:
+        profondeur, temps_max: limites de la recherche de chaque position
+        strategie: stratégie d'évaluation (défaut : celle d'IAOthello)
+        jobs: nombre de processus (défaut : nombre de cœurs)
+    Retourne le nombre d'entrées écrites."""
+    from ia import STRAT_MIXTE
+
+    strategie = strategie or STRAT_MIXTE
+    positions = positions_ouverture(nb_plies)
+    if verbose:
+        print(f"{len(positions)} positions à chercher (profondeur {profondeur}, "
+              f"{temps_max:g}s max chacune)")
+
+    hashs = list(positions)
+    t0 = time.time()
+    entrees = []
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as executeur:
+        resultats = executeur.map(
+            _chercher_position,
+            [positions[h][0] for h in hashs], [positions[h][1] for h in hashs],
+            [profondeur] * len(hashs), [temps_max] * len(hashs), [strategie] * len(hashs))
+        for k, (h, (coup, atteinte, score)) in enumerate(zip(hashs, resultats), 1):
+            entrees.append((h, coup[0] * TAILLE + coup[1], atteinte, score))
+            if verbose and (k % 50 == 0 or k == len(hashs)):
+                print(f"  {k}/{len(hashs)} positions ({time.time() - t0:.0f}s)")
+
+    ecrire_livre(chemin, entrees)
+    if verbose:
+        print(f"{len(entrees)} entrées écrites dans {chemin}")
+    return len(entrees)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--sortie", default=FICHIER_LIVRE, metavar="FICHIER")
+    parser.add_argument("-n", "--plies", type=int, default=NB_PLIES_LIVRE,
+                        help="nombre de demi-coups couverts depuis la position initiale")
+    parser.add_argument("-p", "--profondeur", type=int, default=PROFONDEUR_LIVRE)
+    parser.add_argument("-t", "--temps", type=float, default=TEMPS_LIVRE,
+                        help="temps maximum par position (secondes)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="nombre de processus (défaut : nombre de cœurs)")
+    parser.add_argument("--info", action="store_true",
+                        help="affiche le contenu du livre au lieu de le construire")
+    args = parser.parse_args()
+
+    if args.info:
+        livre = LivreOuvertures(args.sortie)
+        print(f"{args.sortie} : {len(livre)} entrées")
+        for h, coup, profondeur, score in livre.entrees():
+            l, c = divmod(coup, TAILLE)
+            print(f"  {h:016x}  {'abcdefgh'[c]}{l + 1}  profondeur {profondeur:2d}  score {score:6d}")
+        livre.fermer()
+        sys.exit(0)
+
+    construire(args.sortie, args.plies, args.profondeur, args.temps, jobs=args.jobs)
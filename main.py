@@ -13,7 +13,8 @@ from othello import (
     compter_pions, est_partie_finie, gagnant, adversaire
 )
 from ia import (IAOthello, STRATEGIES, STRAT_MIXTE, STRAT_POSITIONNEL, STRAT_ABSOLU, STRAT_MOBILITE,
-                ALGORITHMES, ALGO_NEGAMAX, ALGO_MINMAX, ALGO_MCTS)
+                STRAT_MOTIFS, ALGORITHMES, ALGO_NEGAMAX, ALGO_MINMAX, ALGO_MCTS)
+from livre import ouvrir_livre
 
 # ─────────────────────────────────────────────────────────────
 # Couleurs
@@ -77,6 +78,7 @@ class JeuOthelloGUI:
         self.mode = self.MODE_MENU
         self.ia = None
         self.ia2 = None        # Pour le mode IA vs IA
+        self.livre = ouvrir_livre()  # None si livre.bin n'a pas été construit
         self.ia_couleur = NOIR  # L'IA joue les noirs par défaut
         self.ia_reflechit = False
         self.ia_coup_pret = None
@@ -111,14 +113,15 @@ class JeuOthelloGUI:
         # Recréer les IA si besoin
         if self.mode == self.MODE_HVA:
             self.ia = IAOthello(self.ia_couleur, profondeur_max=10, temps_max=5.0,
-                                strategie=self.strat_hva, algorithme=self.algo_hva)
+                                strategie=self.strat_hva, algorithme=self.algo_hva,
+                                livre=self.livre)
         elif self.mode == self.MODE_AVA:
             self.ia = IAOthello(BLANC, profondeur_max=8, temps_max=3.0,
                                 strategie=self.strat_ava_blanc,
-                                algorithme=self.algo_ava_blanc)
+                                algorithme=self.algo_ava_blanc, livre=self.livre)
             self.ia2 = IAOthello(NOIR, profondeur_max=8, temps_max=3.0,
                                  strategie=self.strat_ava_noir,
-                                 algorithme=self.algo_ava_noir)
+                                 algorithme=self.algo_ava_noir, livre=self.livre)
 
     def lancer_mode(self, mode):
         """Lance un mode de jeu."""
@@ -126,14 +129,15 @@ class JeuOthelloGUI:
         if mode == self.MODE_HVA:
             self.ia_couleur = NOIR  # IA joue les noirs
             self.ia = IAOthello(NOIR, profondeur_max=10, temps_max=5.0,
-                                strategie=self.strat_hva, algorithme=self.algo_hva)
+                                strategie=self.strat_hva, algorithme=self.algo_hva,
+                                livre=self.livre)
         elif mode == self.MODE_AVA:
             self.ia = IAOthello(BLANC, profondeur_max=8, temps_max=3.0,
                                 strategie=self.strat_ava_blanc,
-                                algorithme=self.algo_ava_blanc)
+                                algorithme=self.algo_ava_blanc, livre=self.livre)
             self.ia2 = IAOthello(NOIR, profondeur_max=8, temps_max=3.0,
                                  strategie=self.strat_ava_noir,
-                                 algorithme=self.algo_ava_noir)
+                                 algorithme=self.algo_ava_noir, livre=self.livre)
         else:
             self.ia = None
             self.ia2 = None
@@ -682,6 +686,7 @@ class JeuOthelloGUI:
             STRAT_ABSOLU: "Maximise la différence brute de pions (gloutonne)",
             STRAT_MOBILITE: "Maximise le nombre de coups disponibles",
             STRAT_MIXTE: "Combine toutes les heuristiques (la plus forte)",
+            STRAT_MOTIFS: "Tables précalculées des bords et coins (la plus rapide)",
         }
 
         strat_couleurs = {
@@ -689,11 +694,12 @@ class JeuOthelloGUI:
             STRAT_ABSOLU: (255, 130, 130),
             STRAT_MOBILITE: (130, 200, 255),
             STRAT_MIXTE: (130, 255, 130),
+            STRAT_MOTIFS: (255, 210, 120),
         }
 
         self.rects_strat = []
 
-        for strat_id in [STRAT_POSITIONNEL, STRAT_ABSOLU, STRAT_MOBILITE, STRAT_MIXTE]:
+        for strat_id in [STRAT_POSITIONNEL, STRAT_ABSOLU, STRAT_MOBILITE, STRAT_MIXTE, STRAT_MOTIFS]:
             x_btn = cx - largeur_btn // 2
             rect = pygame.Rect(x_btn, y, largeur_btn, hauteur_btn)
             self.rects_strat.append((rect, strat_id))
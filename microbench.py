@@ -0,0 +1,347 @@
+"""
+Microbenchmarks des primitives du moteur
+========================================
+Chronomètre chaque primitive chaude isolément, sur un corpus fixe de
+positions, et écrit les résultats en JSON pour comparer deux commits :
+
+    python microbench.py -o avant.json
+    ... modification ...
+    python microbench.py -o apres.json --comparer avant.json
+
+Chaque mesure est le meilleur de plusieurs répétitions ; une répétition
+enchaîne assez de passes sur le corpus pour durer au moins DUREE_MIN.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from ia import (
+    IAOthello, INF, ALGO_MCTS, MOTEURS, MOTEUR_LISTE, MOTEUR_BITBOARD, MOTEUR_INCREMENTAL,
+    STRAT_MIXTE, STRAT_MOTIFS, FONCTIONS_EVALUATION, _PRIMITIVES_MOTEUR,
+    COMPOSANTES_BITBOARD, COMPOSANTES_INCREMENTALES, simuler_partie,
+    eval_positionnelle, eval_mobilite, eval_stabilite, _compter_pions_stables, eval_frontieres
+)
+from othello import adversaire, NOIR, BLANC
+import bitboard
+from benchmark import positions_de_test
+import vectorise
+
+# Corpus : positions reproductibles après 10 à 40 coups aléatoires
+NB_POSITIONS = 50
+GRAINE_CORPUS = 2024
+
+REPETITIONS = 5
+DUREE_MIN = 0.2  # secondes par répétition
+
+PROFONDEUR_NEGAMAX = 4
+NB_POSITIONS_NEGAMAX = 8
+STRATEGIES_NEGAMAX = (STRAT_MIXTE, STRAT_MOTIFS)
+
+TEMPS_MCTS = 1.0  # secondes par position
+NB_POSITIONS_MCTS = 4
+LOT_SIMULATIONS = 256  # simulations par appel de vectorise.simuler_lot
+
+
+# ═══════════════════════════════════════════════════════════════
+# Mesure
+# ═══════════════════════════════════════════════════════════════
+
+def mesurer(passe, repetitions=REPETITIONS):
+    """Chronomètre passe(), qui parcourt le corpus et retourne le nombre
+    d'appels effectués. Retourne {'appels', 'ns_par_appel', 'appels_par_s'}."""
+    # Calibration : nombre de passes pour dépasser DUREE_MIN
+    nb_passes = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(nb_passes):
+            appels = passe()
+        if time.perf_counter() - t0 >= DUREE_MIN:
+            break
+        nb_passes *= 2
+
+    meilleur = float('inf')
+    for _ in range(repetitions):
+        t0 = time.perf_counter()
+        for _ in range(nb_passes):
+            passe()
+        meilleur = min(meilleur, time.perf_counter() - t0)
+
+    total = appels * nb_passes
+    return {
+        'appels': appels,
+        'ns_par_appel': meilleur * 1e9 / total,
+        'appels_par_s': total / meilleur,
+    }
+
+
+def mesurer_negamax(positions, moteur, strategie=STRAT_MIXTE, profondeur=PROFONDEUR_NEGAMAX):
+    """NegaMax complet à profondeur fixe (table de transposition vide),
+    évaluation comprise. Retourne {'noeuds', 'ns_par_noeud', 'noeuds_par_s'}."""
+    p = _PRIMITIVES_MOTEUR[moteur]
+    noeuds = 0
+    temps = 0.0
+    for plateau, joueur in positions:
+        ia = IAOthello(joueur, profondeur_max=profondeur, temps_max=float('inf'),
+                       moteur=moteur, strategie=strategie)
+        bb = p.depuis_plateau(plateau)
+        ia.hash_courant = p.zobrist_hash(bb, joueur)
+        ia.profondeur_iteration = profondeur
+        ia.temps_debut = time.time()
+        t0 = time.perf_counter()
+        ia._negamax(bb, joueur, profondeur, -INF, INF)
+        temps += time.perf_counter() - t0
+        noeuds += ia.noeuds_explores
+    return {
+        'noeuds': noeuds,
+        'ns_par_noeud': temps * 1e9 / noeuds,
+        'noeuds_par_s': noeuds / temps,
+    }
+
+
+def _octets_arbre(racine):
+    """Mémoire occupée par un arbre MCTS (nœuds, entiers et listes d'enfants)."""
+    octets = 0
+    pile = [racine]
+    while pile:
+        noeud = pile.pop()
+        octets += (sys.getsizeof(noeud) + sys.getsizeof(noeud.enfants) +
+                   sys.getsizeof(noeud.noirs) + sys.getsizeof(noeud.blancs) +
+                   sys.getsizeof(noeud.non_explores) + sys.getsizeof(noeud.victoires) +
+                   sys.getsizeof(noeud.amaf_victoires) + sys.getsizeof(noeud.biais))
+        pile.extend(noeud.enfants)
+    return octets
+
+
+def mesurer_mcts(positions, temps_max=TEMPS_MCTS):
+    """MCTS pendant temps_max sur chaque position, depuis un arbre vide.
+    Retourne {'iterations', 'ns_par_iteration', 'iterations_par_s',
+    'simulations_par_s', 'octets_par_noeud'}."""
+    iterations = 0
+    simulations = 0
+    temps = 0.0
+    octets = 0
+    noeuds = 0
+    for plateau, joueur in positions:
+        ia = IAOthello(joueur, temps_max=temps_max, algorithme=ALGO_MCTS)
+        ia.choisir_coup([ligne[:] for ligne in plateau])
+        stats = ia.obtenir_stats()
+        iterations += stats['mcts_iterations']
+        simulations += stats['mcts_simulations']
+        temps += stats['temps']
+        octets += _octets_arbre(ia.arbre_mcts)
+        noeuds += ia.arbre_mcts.taille()
+    return {
+        'iterations': iterations,
+        'ns_par_iteration': temps * 1e9 / iterations,
+        'iterations_par_s': iterations / temps,
+        'simulations_par_s': simulations / temps,
+        'octets_par_noeud': octets / noeuds,
+    }
+
+
+# ═══════════════════════════════════════════════════════════════
+# Primitives mesurées
+# ═══════════════════════════════════════════════════════════════
+
+def bancs(positions):
+    """Retourne [(nom, passe)] pour chaque primitive et chaque moteur."""
+    resultat = []
+
+    for moteur in MOTEURS:
+        p = _PRIMITIVES_MOTEUR[moteur]
+        corpus = [(p.depuis_plateau(plateau), joueur) for plateau, joueur in positions]
+        coups = [p.coups_valides_rapide(bb, joueur) for bb, joueur in corpus]
+
+        def generation(p=p, corpus=corpus):
+            for bb, joueur in corpus:
+                p.coups_valides_rapide(bb, joueur)
+            return len(corpus)
+
+        def jouer_annuler(p=p, corpus=corpus, coups=coups):
+            n = 0
+            for (bb, joueur), cv in zip(corpus, coups):
+                for l, c in cv:
+                    pions = p.jouer_coup_rapide(bb, l, c, joueur)
+                    p.annuler_coup(bb, l, c, joueur, pions)
+                n += len(cv)
+            return n
+
+        def hachage(p=p, corpus=corpus):
+            for bb, joueur in corpus:
+                p.zobrist_hash(bb, joueur)
+            return len(corpus)
+
+        resultat += [
+            (f"coups_valides_rapide[{moteur}]", generation),
+            (f"jouer_coup_rapide+annuler_coup[{moteur}]", jouer_annuler),
+            (f"zobrist_hash[{moteur}]", hachage),
+        ]
+
+    def evaluer(fn, positions=positions):
+        def passe():
+            for plateau, joueur in positions:
+                fn(plateau, joueur)
+                fn(plateau, adversaire(joueur))
+            return 2 * len(positions)
+        return passe
+
+    composantes = (eval_positionnelle, eval_mobilite, eval_stabilite,
+                   _compter_pions_stables, eval_frontieres)
+    for fn in composantes:
+        resultat.append((fn.__name__, evaluer(fn)))
+    for strategie, fn in FONCTIONS_EVALUATION.items():
+        resultat.append((f"evaluation[{strategie}]", evaluer(fn)))
+
+    # Composantes et stratégies des moteurs bitboard et incrémental, sur le
+    # plateau de la recherche
+    for moteur, composantes_moteur in ((MOTEUR_BITBOARD, COMPOSANTES_BITBOARD),
+                                       (MOTEUR_INCREMENTAL, COMPOSANTES_INCREMENTALES)):
+        p = _PRIMITIVES_MOTEUR[moteur]
+        etats = [(p.depuis_plateau(plateau), joueur) for plateau, joueur in positions]
+        for nom in ("positionnelle", "mobilite", "stabilite", "frontieres"):
+            fn = getattr(composantes_moteur, nom)
+            resultat.append((f"eval_{nom}[{moteur}]", evaluer(fn, etats)))
+        for strategie, fn in p.fonctions_evaluation.items():
+            resultat.append((f"evaluation[{strategie}][{moteur}]", evaluer(fn, etats)))
+
+    # Stabilité sur bitboards, sans le cache par position de ia.py
+    corpus_bb = [bitboard.depuis_plateau(plateau) for plateau, _ in positions]
+
+    def stabilite_bitboard():
+        for bb in corpus_bb:
+            bitboard.pions_stables(bb[NOIR], bb[BLANC])
+            bitboard.pions_stables(bb[BLANC], bb[NOIR])
+        return 2 * len(corpus_bb)
+
+    resultat.append(("pions_stables[bitboard]", stabilite_bitboard))
+
+    # Simulations MCTS : une partie jouée jusqu'au bout par position
+    def simulation():
+        for bb, (_, joueur) in zip(corpus_bb, positions):
+            simuler_partie(bb[NOIR], bb[BLANC], joueur, NOIR)
+        return len(corpus_bb)
+
+    resultat.append(("simuler_partie", simulation))
+
+    # Évaluation par lots (NumPy optionnel) : temps ramené à un plateau
+    if vectorise.NUMPY_DISPONIBLE:
+        lot = vectorise.depuis_plateaux([plateau for plateau, _ in positions])
+        joueurs = [joueur for _, joueur in positions]
+
+        def evaluer_lot(strategie):
+            def passe():
+                vectorise.evaluer_lot(lot, joueurs, strategie)
+                return len(positions)
+            return passe
+
+        for strategie in FONCTIONS_EVALUATION:
+            resultat.append((f"evaluer_lot[{strategie}]", evaluer_lot(strategie)))
+
+        # Temps ramené à une simulation
+        def simulation_lot():
+            for bb, (_, joueur) in zip(corpus_bb, positions):
+                vectorise.simuler_lot(bb[NOIR], bb[BLANC], joueur, NOIR, LOT_SIMULATIONS)
+            return LOT_SIMULATIONS * len(corpus_bb)
+
+        resultat.append((f"simuler_lot[{LOT_SIMULATIONS}]", simulation_lot))
+    return resultat
+
+
+def executer(filtre=None, repetitions=REPETITIONS):
+    """Lance tous les microbenchmarks (dont le nom contient filtre)
+    et retourne le document JSON."""
+    positions = positions_de_test(NB_POSITIONS, graine=GRAINE_CORPUS)
+    resultats = {}
+    for nom, passe in bancs(positions):
+        if filtre and filtre not in nom:
+            continue
+        resultats[nom] = mesurer(passe, repetitions)
+        print(f"{nom:>42s}: {resultats[nom]['ns_par_appel']:>12,.0f} ns/appel", file=sys.stderr)
+
+    # Recherche complète par stratégie ; la stratégie par défaut garde le nom
+    # _negamax[moteur]
+    for strategie in STRATEGIES_NEGAMAX:
+        prefixe = "_negamax" if strategie == STRAT_MIXTE else f"_negamax[{strategie}]"
+        for moteur in MOTEURS:
+            nom = f"{prefixe}[{moteur}]"
+            if filtre and filtre not in nom:
+                continue
+            resultats[nom] = mesurer_negamax(positions[:NB_POSITIONS_NEGAMAX], moteur, strategie)
+            print(f"{nom:>42s}: {resultats[nom]['noeuds_par_s']:>12,.0f} nœuds/s", file=sys.stderr)
+
+        # Le moteur bitboard doit battre les listes sur la recherche complète,
+        # pas seulement sur la génération des coups
+        liste = resultats.get(f"{prefixe}[{MOTEUR_LISTE}]")
+        binaire = resultats.get(f"{prefixe}[{MOTEUR_BITBOARD}]")
+        if liste and binaire:
+            print(f"{prefixe + '[bitboard / liste]':>42s}: "
+                  f"{binaire['noeuds_par_s'] / liste['noeuds_par_s']:>12.2f}x", file=sys.stderr)
+
+    nom = "_choisir_coup_mcts"
+    if not filtre or filtre in nom:
+        resultats[nom] = r = mesurer_mcts(positions[:NB_POSITIONS_MCTS])
+        print(f"{nom:>42s}: {r['iterations_par_s']:>12,.0f} itérations/s, "
+              f"{r['simulations_par_s']:,.0f} simulations/s, "
+              f"{r['octets_par_noeud']:,.0f} octets/nœud", file=sys.stderr)
+
+    return {
+        'meta': {
+            'commit': _commit_courant(),
+            'date': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'positions': NB_POSITIONS,
+            'graine_corpus': GRAINE_CORPUS,
+            'profondeur_negamax': PROFONDEUR_NEGAMAX,
+            'strategies_negamax': list(STRATEGIES_NEGAMAX),
+            'temps_mcts': TEMPS_MCTS,
+        },
+        'resultats': resultats,
+    }
+
+
+def _commit_courant():
+    """Hash du commit git courant, ou None hors d'un dépôt."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def comparer(avant, apres):
+    """Affiche le rapport de vitesse entre deux documents JSON
+    (> 1 : plus rapide après)."""
+    print(f"{'primitive':>42s} {'avant':>12s} {'après':>12s} {'vitesse':>8s}")
+    for nom, r in apres['resultats'].items():
+        r0 = avant['resultats'].get(nom)
+        if r0 is None:
+            continue
+        cle = next(c for c in ('ns_par_noeud', 'ns_par_iteration', 'ns_par_appel') if c in r)
+        print(f"{nom:>42s} {r0[cle]:>12,.0f} {r[cle]:>12,.0f} {r0[cle] / r[cle]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-o", "--sortie", metavar="FICHIER",
+                        help="fichier JSON de sortie (sinon : sortie standard)")
+    parser.add_argument("--comparer", metavar="FICHIER",
+                        help="résultats JSON d'un commit précédent à comparer")
+    parser.add_argument("--filtre", help="ne mesure que les primitives dont le nom contient ce texte")
+    parser.add_argument("--repetitions", type=int, default=REPETITIONS)
+    args = parser.parse_args()
+
+    document = executer(args.filtre, args.repetitions)
+    texte = json.dumps(document, indent=2, ensure_ascii=False)
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as f:
+            f.write(texte + "\n")
+    else:
+        print(texte)
+
+    if args.comparer:
+        with open(args.comparer, encoding="utf-8") as f:
+            comparer(json.load(f), document)
@@ -0,0 +1,271 @@
+"""
+Othello IA — Évaluation par motifs
+==================================
+Une position est découpée en motifs : les 4 bords (8 cases), les 4 coins
+3x3 et les 8 bandes 2x5 le long des bords. Chaque motif ne prend que
+3^n configurations (6 561 pour un bord), dont la valeur est précalculée
+une fois pour toutes ; évaluer une feuille revient alors à calculer le
+code ternaire de chaque motif et à additionner des lectures de tables.
+
+Valeurs des tables, du point de vue des noirs (les blancs ont l'opposé) :
+  - Bord : poids positionnels des cases (cases C ajustées selon le coin,
+    coins comptés pour moitié car ils appartiennent à deux bords),
+    stabilité exacte le long du bord (pion qu'aucune suite de coups sur
+    ce bord ne peut retourner) et accès aux coins vides
+  - Coin 3x3 : case X ajustée selon le coin, cases intérieures et leur
+    stabilité par propagation depuis le coin
+  - Bande 2x5 : pions de la deuxième rangée exposés à une case vide du bord
+
+Le code ternaire d'une ligne a pour chiffre k la case k (VIDE = 0,
+NOIR = 1, BLANC = 2). Les motifs sont orientés pour que le coin soit
+toujours le chiffre 0 : une seule table par type de motif.
+"""
+
+from itertools import product
+from othello import TAILLE, VIDE, NOIR, BLANC
+
+# Bonus par pion stable le long d'un bord, et par pion intérieur stable
+# d'un coin 3x3
+STABILITE_BORD = 40
+STABILITE_COIN = 40
+
+# Bonus quand le joueur peut prendre un coin vide le long d'un bord
+ACCES_COIN = 100
+
+# Pénalité d'un pion de la deuxième rangée voisin d'une case vide du bord
+EXPOSITION = 20
+
+# Code ternaire de chaque ligne de 8 cases (tuple → code)
+CODE_LIGNE = {}
+for _code in range(3 ** TAILLE):
+    _cases = tuple(_code // 3 ** k % 3 for k in range(TAILLE))
+    CODE_LIGNE[_cases] = _code
+
+# Code de la même ligne lue dans l'autre sens
+MIROIR = [0] * 3 ** TAILLE
+for _cases, _code in CODE_LIGNE.items():
+    MIROIR[_code] = CODE_LIGNE[_cases[::-1]]
+
+# Code ternaire d'un octet de pions d'une seule couleur (bit k = chiffre k) :
+# la ligne d'octets (noirs, blancs) a pour code
+# CODE_OCTET[noirs] + 2 * CODE_OCTET[blancs]
+CODE_OCTET = [sum(3 ** k for k in range(TAILLE) if o >> k & 1) for o in range(256)]
+
+
+def _signe(couleur):
+    """+1 pour les noirs, -1 pour les blancs, 0 pour une case vide."""
+    return 1 if couleur == NOIR else -1 if couleur == BLANC else 0
+
+
+def _decoder(code, n):
+    """Cases d'un code ternaire de n chiffres."""
+    return [code // 3 ** k % 3 for k in range(n)]
+
+
+# ═══════════════════════════════════════════════════════════════
+# Bords
+# ═══════════════════════════════════════════════════════════════
+
+def _jouer_ligne(cases, i, couleur):
+    """Pose un pion en i sur une ligne (tuple), avec ou sans retournement
+    le long de la ligne. Retourne (nouvelle ligne, masque des retournés)."""
+    adv = 3 - couleur
+    nouveau = list(cases)
+    nouveau[i] = couleur
+    retournes = 0
+    for pas in (-1, 1):
+        j = i + pas
+        masque = 0
+        while 0 <= j < TAILLE and cases[j] == adv:
+            masque |= 1 << j
+            j += pas
+        if masque and 0 <= j < TAILLE and cases[j] == couleur:
+            retournes |= masque
+    for j in range(TAILLE):
+        if retournes >> j & 1:
+            nouveau[j] = couleur
+    return tuple(nouveau), retournes
+
+
+# Pions instables de chaque configuration de bord déjà calculée, partagés
+# entre les tables de ce module et celle des pions stables de bitboard.py
+_MEMO_INSTABLES = {}
+
+
+def _instables_bord(cases, memo=_MEMO_INSTABLES):
+    """Masque des pions de la ligne qu'une suite de coups le long de la
+    ligne peut retourner. Tout coup est envisagé sur chaque case vide,
+    pour chaque couleur (il peut être légal grâce à une autre direction)."""
+    if cases in memo:
+        return memo[cases]
+    instables = 0
+    occupes = sum(1 << j for j in range(TAILLE) if cases[j] != VIDE)
+    for i in range(TAILLE):
+        if cases[i] != VIDE:
+            continue
+        for couleur in (NOIR, BLANC):
+            nouveau, retournes = _jouer_ligne(cases, i, couleur)
+            instables |= retournes | (_instables_bord(nouveau, memo) & occupes)
+    memo[cases] = instables
+    return instables
+
+
+def _acces_coin(cases, coin, pas, couleur):
+    """Vrai si couleur peut prendre le coin vide en retournant le long du bord."""
+    adv = 3 - couleur
+    j = coin + pas
+    if not (0 <= j < TAILLE) or cases[j] != adv:
+        return False
+    while 0 <= j < TAILLE and cases[j] == adv:
+        j += pas
+    return 0 <= j < TAILLE and cases[j] == couleur
+
+
+def _table_bord(poids_bord):
+    """Valeur de chaque configuration d'un bord (poids_bord : les 8 poids
+    positionnels de la ligne, du coin 0 au coin 7)."""
+    table = [0] * 3 ** TAILLE
+    coin_de = {1: 0, TAILLE - 2: TAILLE - 1}  # case C → coin
+    for cases, code in CODE_LIGNE.items():
+        instables = _instables_bord(cases)
+        valeur = 0
+        for j, couleur in enumerate(cases):
+            if couleur == VIDE:
+                continue
+            poids = poids_bord[j]
+            if j in (0, TAILLE - 1):
+                poids //= 2
+            elif j in coin_de and cases[coin_de[j]] == couleur:
+                poids = abs(poids)
+            if not instables >> j & 1:
+                poids += STABILITE_BORD
+            valeur += _signe(couleur) * poids
+        for coin, pas in ((0, 1), (TAILLE - 1, -1)):
+            if cases[coin] != VIDE:
+                continue
+            for couleur in (NOIR, BLANC):
+                if _acces_coin(cases, coin, pas, couleur):
+                    valeur += _signe(couleur) * ACCES_COIN
+        table[code] = valeur
+    return table
+
+
+# ═══════════════════════════════════════════════════════════════
+# Coins 3x3 et bandes 2x5
+# ═══════════════════════════════════════════════════════════════
+
+def _table_coin(poids):
+    """Valeur de chaque configuration d'un coin 3x3, chiffre 3 * l + c pour
+    la case (l, c) relative au coin. Seules les cases hors bord comptent
+    (les bords ont leur table)."""
+    interieures = [(4, poids[1][1]), (5, poids[1][2]), (7, poids[2][1]), (8, poids[2][2])]
+    table = [0] * 3 ** 9
+    for code, inverse in enumerate(product(range(3), repeat=9)):
+        cases = inverse[::-1]
+        coin = cases[0]
+
+        # Propagation depuis le coin : un pion est stable si ses voisins
+        # côté coin (haut, gauche, diagonale) sont stables et de sa couleur
+        stable = [False] * 9
+        if coin != VIDE:
+            s = stable
+            s[0] = True
+            s[1] = cases[1] == coin
+            s[2] = s[1] and cases[2] == coin
+            s[3] = cases[3] == coin
+            s[6] = s[3] and cases[6] == coin
+            s[4] = s[1] and s[3] and cases[4] == coin
+            s[5] = s[2] and s[4] and cases[5] == coin
+            s[7] = s[6] and s[4] and cases[7] == coin
+            s[8] = s[5] and s[7] and cases[8] == coin
+
+        valeur = 0
+        for k, p in interieures:
+            couleur = cases[k]
+            if couleur == VIDE:
+                continue
+            if k == 4 and coin == couleur:
+                p = abs(p)  # case X
+            if stable[k]:
+                p += STABILITE_COIN
+            valeur += _signe(couleur) * p
+        table[code] = valeur
+    return table
+
+
+def _table_bande():
+    """Valeur de chaque configuration d'une bande 2x5 : chiffres 0 à 4 la
+    rangée du bord (coin en 0), 5 à 9 la deuxième rangée, soit le code
+    bord + 243 * deuxieme_rangee."""
+    # Pour chaque rangée du bord : cases 1 à 4 de la deuxième rangée
+    # voisines d'une case vide du bord
+    exposees = []
+    for bord in range(3 ** 5):
+        cases = _decoder(bord, 5)
+        exposees.append(tuple(any(cases[v] == VIDE for v in range(c - 1, min(c + 2, 5)))
+                              for c in range(1, 5)))
+
+    table = [0] * 3 ** 10
+    valeurs = {}
+    for bord, exposition in enumerate(exposees):
+        if exposition not in valeurs:
+            valeurs[exposition] = [
+                -EXPOSITION * sum(_signe(couleur) for couleur, e in
+                                  zip(_decoder(rangee, 5)[1:], exposition) if e)
+                for rangee in range(3 ** 5)]
+        table[bord::3 ** 5] = valeurs[exposition]
+    return table
+
+
+def construire_tables(poids):
+    """Tables (bord, coin, bande) pour la table de poids positionnels 8x8."""
+    return _table_bord(poids[0]), _table_coin(poids), _table_bande()
+
+
+# ═══════════════════════════════════════════════════════════════
+# Évaluation
+# ═══════════════════════════════════════════════════════════════
+
+def _creer_somme(poids):
+    """Retourne somme(l0, l1, l2, l7, l6, l5, c0, c1, c7, c6), somme des motifs
+    du point de vue des noirs d'après les codes ternaires des lignes 0, 1, 2,
+    7, 6, 5 et des colonnes 0, 1, 7, 6, les tables étant construites ici."""
+    bord, coin, bande = construire_tables(poids)
+    miroir = MIROIR
+
+    def somme(l0, l1, l2, l7, l6, l5, c0, c1, c7, c6):
+        m0, m1, m2 = miroir[l0], miroir[l1], miroir[l2]
+        m7, m6, m5 = miroir[l7], miroir[l6], miroir[l5]
+        n0, n1, n7, n6 = miroir[c0], miroir[c1], miroir[c7], miroir[c6]
+        return (
+            bord[l0] + bord[l7] + bord[c0] + bord[c7] +
+            # Coins (0,0), (0,7), (7,0), (7,7)
+            coin[l0 % 27 + 27 * (l1 % 27) + 729 * (l2 % 27)] +
+            coin[m0 % 27 + 27 * (m1 % 27) + 729 * (m2 % 27)] +
+            coin[l7 % 27 + 27 * (l6 % 27) + 729 * (l5 % 27)] +
+            coin[m7 % 27 + 27 * (m6 % 27) + 729 * (m5 % 27)] +
+            # Bandes horizontales puis verticales
+            bande[l0 % 243 + 243 * (l1 % 243)] + bande[m0 % 243 + 243 * (m1 % 243)] +
+            bande[l7 % 243 + 243 * (l6 % 243)] + bande[m7 % 243 + 243 * (m6 % 243)] +
+            bande[c0 % 243 + 243 * (c1 % 243)] + bande[n0 % 243 + 243 * (n1 % 243)] +
+            bande[c7 % 243 + 243 * (c6 % 243)] + bande[n7 % 243 + 243 * (n6 % 243)]
+        )
+
+    return somme
+
+
+def creer_evaluateur(poids):
+    """Retourne score(plateau), somme des motifs du point de vue des noirs,
+    les tables étant construites ici une fois pour toutes."""
+    somme = _creer_somme(poids)
+    code_ligne = CODE_LIGNE
+
+    def score(plateau):
+        l0, l1, l2 = (code_ligne[tuple(plateau[l])] for l in (0, 1, 2))
+        l7, l6, l5 = (code_ligne[tuple(plateau[l])] for l in (7, 6, 5))
+        colonnes = tuple(zip(*plateau))
+        c0, c1 = code_ligne[colonnes[0]], code_ligne[colonnes[1]]
+        c7, c6 = code_ligne[colonnes[7]], code_ligne[colonnes[6]]
+        return somme(l0, l1, l2, l7, l6, l5, c0, c1, c7, c6)
+
+    return score
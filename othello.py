@@ -42,6 +42,33 @@ def est_sur_plateau(ligne, colonne):
     return 0 <= ligne < TAILLE and 0 <= colonne < TAILLE
 
 
+def _rayon(ligne, colonne, dl, dc):
+    """Cases rencontrées depuis (ligne, colonne) dans la direction (dl, dc)."""
+    rayon = []
+    l, c = ligne + dl, colonne + dc
+    while est_sur_plateau(l, c):
+        rayon.append((l, c))
+        l += dl
+        c += dc
+    return tuple(rayon)
+
+
+def _rayons(ligne, colonne):
+    """Cases rencontrées depuis (ligne, colonne) dans chacune des 8 directions.
+    Un rayon de moins de deux cases ne peut encadrer aucun pion : il est omis."""
+    return tuple(rayon for rayon in (_rayon(ligne, colonne, dl, dc) for dl, dc in DIRECTIONS)
+                 if len(rayon) >= 2)
+
+
+# Rayons précalculés de chaque case : plus de calcul d'indices ni de test
+# de bornes dans les boucles de retournement.
+# RAYONS_CASES[ligne][colonne] : rayons en coordonnées (ligne, colonne)
+# RAYONS[ligne * TAILLE + colonne] : mêmes rayons en index de plateau plat
+RAYONS_CASES = [[_rayons(l, c) for c in range(TAILLE)] for l in range(TAILLE)]
+RAYONS = [tuple(tuple(l * TAILLE + c for l, c in rayon) for rayon in RAYONS_CASES[i // TAILLE][i % TAILLE])
+          for i in range(TAILLE * TAILLE)]
+
+
 def pions_a_retourner(plateau, ligne, colonne, joueur):
     """
     Retourne la liste des pions à retourner si le joueur pose à (ligne, colonne).
@@ -53,19 +80,19 @@ def pions_a_retourner(plateau, ligne, colonne, joueur):
     adv = adversaire(joueur)
     pions = []
 
-    for dl, dc in DIRECTIONS:
-        l, c = ligne + dl, colonne + dc
-        pions_direction = []
-
-        # Avancer dans la direction tant qu'on trouve des pions adverses
-        while est_sur_plateau(l, c) and plateau[l][c] == adv:
-            pions_direction.append((l, c))
-            l += dl
-            c += dc
-
-        # Vérifier qu'on termine sur un pion du joueur
-        if pions_direction and est_sur_plateau(l, c) and plateau[l][c] == joueur:
-            pions.extend(pions_direction)
+    for rayon in RAYONS_CASES[ligne][colonne]:
+        l, c = rayon[0]
+        if plateau[l][c] != adv:
+            continue
+        # Avancer dans la direction tant qu'on trouve des pions adverses,
+        # et vérifier qu'on termine sur un pion du joueur
+        for k in range(1, len(rayon)):
+            l, c = rayon[k]
+            case = plateau[l][c]
+            if case != adv:
+                if case == joueur:
+                    pions.extend(rayon[:k])
+                break
 
     return pions
 
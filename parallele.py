@@ -0,0 +1,278 @@
+"""
+Othello IA — Recherche parallèle
+================================
+Modes de répartition du travail entre processus.
+
+Lazy SMP : plusieurs processus cherchent la même position en même temps
+et ne communiquent que par la table de transposition, placée dans un
+segment multiprocessing.shared_memory (TableTranspositionPartagee).
+
+  - Le processus principal mène la recherche NegaMax habituelle
+  - Les processus auxiliaires pairs / impairs ont une itération d'avance
+    ou non, et mélangent l'ordre des coups de la racine : ils explorent
+    d'autres sous-arbres et y déposent des bornes et meilleurs coups
+  - À la fin de la recherche principale, un drapeau partagé arrête les
+    auxiliaires ; le coup de l'itération complète la plus profonde est
+    retenu
+
+Partage de la racine : chaque coup de la racine est une tâche d'un
+ProcessPoolExecutor (PoolRacine), cherchée avec l'alpha courant par une
+IA propre au processus. Plus léger : rien n'est partagé entre processus.
+
+MCTS (PoolMCTS) : arbres indépendants fusionnés à l'échéance, ou
+simulations de feuilles confiées aux processus sans attendre leur retour
+(perte virtuelle sur le chemin de chaque feuille en cours).
+
+Des processus plutôt que des threads, que le GIL sérialiserait. Ils sont
+démarrés une seule fois par IA puis réutilisés d'un coup à l'autre.
+"""
+
+import multiprocessing
+import queue
+import random
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from transposition import TableTranspositionPartagee
+
+# Délai accordé aux auxiliaires Lazy SMP, après l'échéance de la recherche,
+# pour rendre leur résultat ; période de vérification des processus morts
+DELAI_COLLECTE = 1.0
+INTERVALLE_COLLECTE = 0.1
+
+
+def _boucle_auxiliaire(numero, options, nom_table, taille_mo, taches, resultats, arret):
+    """Boucle d'un processus auxiliaire : une recherche par tâche reçue."""
+    from ia import IAOthello
+
+    # Table locale minimale, aussitôt remplacée par la table partagée
+    ia = IAOthello(**dict(options, taille_tt_mo=0))
+    ia.table_transposition = TableTranspositionPartagee(taille_mo, nom=nom_table)
+    ia.arret = arret
+    ia.decalage_profondeur = numero & 1
+    ia.rng_racine = random.Random(numero)
+
+    while True:
+        tache = taches.get()
+        if tache is None:
+            break
+        plateau, couleur, temps_debut, generation = tache
+        ia.couleur = couleur
+        ia.reinitialiser_stats()
+        ia._vieillir_heuristiques_tri()
+        ia.table_transposition.generation = generation
+        ia.temps_debut = temps_debut
+        coup = ia._choisir_coup_negamax(plateau)
+        resultats.put((ia.stats['profondeur_atteinte'], coup, ia.noeuds_explores))
+
+    ia.table_transposition.fermer()
+
+
+def _arreter(processus, taches):
+    """Demande aux processus auxiliaires de se terminer et les attend."""
+    for file in taches:
+        file.put(None)
+    for proc in processus:
+        proc.join(timeout=1.0)
+        if proc.is_alive():
+            proc.terminate()
+
+
+class GroupeLazySMP:
+    """Processus auxiliaires Lazy SMP d'une IAOthello."""
+
+    def __init__(self, options, table, nb_auxiliaires):
+        """
+        Args:
+            options: paramètres IAOthello des auxiliaires (dont 'couleur')
+            table: TableTranspositionPartagee de la recherche principale
+            nb_auxiliaires: nombre de processus à démarrer
+        """
+        ctx = multiprocessing.get_context()
+        self.arret = ctx.RawValue('b', 0)
+        # Une file de résultats par auxiliaire : un processus terminé en
+        # pleine écriture ne peut bloquer que la sienne
+        self.taches = []
+        self.resultats = []
+        self.processus = []
+        for numero in range(1, nb_auxiliaires + 1):
+            file = ctx.Queue()
+            retour = ctx.Queue()
+            proc = ctx.Process(target=_boucle_auxiliaire,
+                               args=(numero, dict(options), table.nom, table.taille_mo,
+                                     file, retour, self.arret),
+                               daemon=True)
+            proc.start()
+            self.taches.append(file)
+            self.resultats.append(retour)
+            self.processus.append(proc)
+        self._finaliseur = weakref.finalize(self, _arreter, self.processus, self.taches)
+
+    def lancer(self, plateau, couleur, temps_debut, generation):
+        """Démarre la recherche de la position sur tous les auxiliaires."""
+        self.arret.value = 0
+        for file in self.taches:
+            file.put((plateau, couleur, temps_debut, generation))
+
+    def collecter(self, echeance):
+        """Arrête les auxiliaires et retourne leurs résultats
+        [(profondeur_atteinte, coup, noeuds)].
+
+        Les résultats sont attendus au plus jusqu'à echeance + DELAI_COLLECTE.
+        Un auxiliaire mort, ou sans réponse à cette limite, est terminé et
+        retiré du groupe : il ne bloque ni ce coup ni les suivants."""
+        self.arret.value = 1
+        limite = max(echeance, time.time()) + DELAI_COLLECTE
+        resultats = []
+        for i in reversed(range(len(self.processus))):
+            resultat = self._attendre(i, limite)
+            if resultat is None:
+                self._retirer(i)
+            else:
+                resultats.append(resultat)
+        return resultats
+
+    def _attendre(self, i, limite):
+        """Résultat de l'auxiliaire i, ou None s'il meurt ou ne répond pas
+        avant l'instant limite."""
+        while True:
+            attente = limite - time.time()
+            if attente <= 0:
+                return None
+            try:
+                return self.resultats[i].get(timeout=min(attente, INTERVALLE_COLLECTE))
+            except queue.Empty:
+                if not self.processus[i].is_alive():
+                    return None
+
+    def _retirer(self, i):
+        """Termine l'auxiliaire i et le retire du groupe."""
+        proc = self.processus.pop(i)
+        if proc.is_alive():
+            proc.terminate()
+        proc.join(timeout=1.0)
+        del self.taches[i]
+        del self.resultats[i]
+
+    def fermer(self):
+        """Termine les processus auxiliaires."""
+        self._finaliseur()
+
+
+# ═══════════════════════════════════════════════════════════════
+# Partage de la racine
+# ═══════════════════════════════════════════════════════════════
+
+# IA de chaque processus du pool, par jeu d'options : leurs tables de
+# transposition et heuristiques de tri servent d'une tâche à l'autre
+_IA_PROCESSUS = {}
+
+
+def _chercher_coup_racine(options, plateau, couleur, coup, profondeur, alpha, beta, temps_debut):
+    """Tâche du pool : cherche un coup de la racine.
+    Retourne (score, timeout, noeuds, coupes)."""
+    from ia import IAOthello
+
+    cle = tuple(sorted(options.items()))
+    ia = _IA_PROCESSUS.get(cle)
+    if ia is None:
+        ia = _IA_PROCESSUS[cle] = IAOthello(**options)
+    if ia.temps_debut != temps_debut:
+        # Première tâche d'une nouvelle recherche
+        ia.table_transposition.nouvelle_recherche()
+        ia._vieillir_heuristiques_tri()
+        ia.temps_debut = temps_debut
+    ia.couleur = couleur
+    ia.reinitialiser_stats()
+    score = ia.score_coup_racine(plateau, coup, profondeur, alpha, beta)
+    return score, ia.timeout, ia.noeuds_explores, ia.stats['coupes']
+
+
+class PoolRacine:
+    """Processus du partage de la racine, réutilisés d'un coup à l'autre."""
+
+    def __init__(self, nb_workers):
+        """
+        Args:
+            nb_workers: nombre de processus du pool
+        """
+        self.executeur = ProcessPoolExecutor(max_workers=nb_workers)
+
+    def soumettre(self, options, plateau, couleur, coup, profondeur, alpha, beta, temps_debut):
+        """Lance la recherche d'un coup de la racine ; retourne un Future
+        dont le résultat est (score, timeout, noeuds, coupes)."""
+        return self.executeur.submit(_chercher_coup_racine, options, plateau, couleur,
+                                     coup, profondeur, alpha, beta, temps_debut)
+
+    def fermer(self):
+        """Termine les processus du pool."""
+        self.executeur.shutdown(wait=False, cancel_futures=True)
+
+
+# ═══════════════════════════════════════════════════════════════
+# MCTS : arbres indépendants (racine) et simulations groupées (feuilles)
+# ═══════════════════════════════════════════════════════════════
+
+def _arbre_mcts(options, plateau, couleur, temps_debut):
+    """Tâche du pool : fait croître un arbre MCTS jusqu'à l'échéance de la
+    recherche principale. Retourne ({coup: visites}, itérations)."""
+    from ia import IAOthello
+
+    # Chaque tâche repart d'une graine propre : les processus issus d'un
+    # fork hériteraient sinon du même générateur
+    random.seed()
+    cle = tuple(sorted(options.items()))
+    ia = _IA_PROCESSUS.get(cle)
+    if ia is None:
+        ia = _IA_PROCESSUS[cle] = IAOthello(**options)
+    ia.couleur = couleur
+    ia.reinitialiser_stats()
+    ia.temps_debut = temps_debut
+    racine = ia._mcts_arbre(plateau)
+    return {enfant.coup: enfant.visites for enfant in racine.enfants}, ia.stats['mcts_iterations']
+
+
+def _simulations_mcts(noirs, blancs, joueur, couleur, nb, amaf=False):
+    """Tâche du pool : nb simulations depuis la même position.
+    Retourne la somme des résultats du point de vue de couleur ou, avec
+    amaf, le (résultat, cases jouées par Noir, cases jouées par Blanc) de
+    chaque simulation, pour les statistiques AMAF (RAVE)."""
+    from ia import simuler_partie, simuler_parties
+
+    random.seed()
+    if amaf:
+        return [simuler_partie(noirs, blancs, joueur, couleur, amaf=True) for _ in range(nb)]
+    return simuler_parties(noirs, blancs, joueur, couleur, nb)
+
+
+class PoolMCTS:
+    """Processus auxiliaires du MCTS parallèle, réutilisés d'un coup à l'autre.
+
+    Parallélisme à la racine : chaque processus fait croître son propre
+    arbre depuis la même position ; les visites des coups de la racine
+    sont additionnées à l'échéance. Parallélisme aux feuilles : un seul
+    arbre, dont chaque processus simule une feuille à la fois pendant que
+    le processus principal poursuit ses itérations."""
+
+    def __init__(self, nb_workers):
+        """
+        Args:
+            nb_workers: nombre de processus du pool
+        """
+        self.nb_workers = nb_workers
+        self.executeur = ProcessPoolExecutor(max_workers=nb_workers)
+
+    def lancer_arbres(self, options, plateau, couleur, temps_debut):
+        """Lance un arbre par processus ; retourne les Futures dont le
+        résultat est ({coup: visites}, itérations)."""
+        return [self.executeur.submit(_arbre_mcts, options, plateau, couleur, temps_debut)
+                for _ in range(self.nb_workers)]
+
+    def simuler(self, noirs, blancs, joueur, couleur, nb, amaf=False):
+        """Lance nb simulations de la position sur un processus ; retourne
+        le Future du résultat de _simulations_mcts."""
+        return self.executeur.submit(_simulations_mcts, noirs, blancs, joueur, couleur, nb, amaf)
+
+    def fermer(self):
+        """Termine les processus du pool."""
+        self.executeur.shutdown(wait=False, cancel_futures=True)
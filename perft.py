@@ -0,0 +1,128 @@
+"""
+Perft — Vérification et vitesse de la génération des coups
+==========================================================
+perft(plateau, joueur, n) compte les positions atteintes après exactement
+n demi-coups. Conventions (celles des valeurs de référence publiées) :
+  - un joueur sans coup passe, et le passe compte comme un demi-coup
+  - une partie terminée (aucun des deux joueurs ne peut jouer) avant la
+    profondeur n compte pour une seule feuille
+
+Les valeurs de référence depuis la position initiale permettent de
+vérifier chaque implémentation de la génération des coups :
+  - « reference » : othello.coups_valides / othello.jouer_coup (copies)
+  - chaque moteur de recherche de ia.py (coups_valides_rapide,
+    jouer_coup_rapide / annuler_coup)
+
+    python perft.py               # vérifie tous les moteurs jusqu'à 7
+    python perft.py -p 9 --moteur bitboard
+"""
+import argparse
+import sys
+import time
+from othello import creer_plateau, coups_valides, jouer_coup, adversaire, BLANC
+from ia import MOTEURS, _PRIMITIVES_MOTEUR
+
+# Implémentation de référence (règles de othello.py, sans faire / défaire)
+MOTEUR_REFERENCE = "reference"
+
+# Valeurs connues depuis la position initiale de creer_plateau (les blancs
+# commencent ; les couleurs inversées de la position standard ne changent
+# pas les comptes)
+PERFT_DEPART = {
+    1: 4,
+    2: 12,
+    3: 56,
+    4: 244,
+    5: 1396,
+    6: 8200,
+    7: 55092,
+    8: 390216,
+    9: 3005288,
+    10: 24571284,
+}
+
+
+def _perft_reference(plateau, joueur, profondeur, passe=False):
+    """Perft sur les fonctions de othello.py (nouveau plateau à chaque coup)."""
+    if profondeur == 0:
+        return 1
+    coups = coups_valides(plateau, joueur)
+    if not coups:
+        if passe:
+            return 1  # Partie terminée
+        return _perft_reference(plateau, adversaire(joueur), profondeur - 1, True)
+    if profondeur == 1:
+        return len(coups)
+    total = 0
+    for l, c in coups:
+        nouveau, _ = jouer_coup(plateau, l, c, joueur)
+        total += _perft_reference(nouveau, adversaire(joueur), profondeur - 1)
+    return total
+
+
+def _perft_rapide(p, plateau, joueur, profondeur, passe=False):
+    """Perft sur les primitives faire / défaire d'un moteur de ia.py."""
+    if profondeur == 0:
+        return 1
+    coups = p.coups_valides_rapide(plateau, joueur)
+    if not coups:
+        if passe:
+            return 1  # Partie terminée
+        return _perft_rapide(p, plateau, 3 - joueur, profondeur - 1, True)
+    if profondeur == 1:
+        return len(coups)
+    total = 0
+    adv = 3 - joueur
+    for l, c in coups:
+        pions = p.jouer_coup_rapide(plateau, l, c, joueur)
+        total += _perft_rapide(p, plateau, adv, profondeur - 1)
+        p.annuler_coup(plateau, l, c, joueur, pions)
+    return total
+
+
+def perft(plateau, joueur, profondeur, moteur=MOTEUR_REFERENCE):
+    """Nombre de positions atteintes après profondeur demi-coups.
+
+    Args:
+        plateau: plateau 8x8 (listes), non modifié
+        joueur: joueur au trait
+        profondeur: nombre de demi-coups
+        moteur: MOTEUR_REFERENCE ou une clé de ia.MOTEURS
+    """
+    if moteur == MOTEUR_REFERENCE:
+        return _perft_reference(plateau, joueur, profondeur)
+    p = _PRIMITIVES_MOTEUR[moteur]
+    return _perft_rapide(p, p.depuis_plateau(plateau), joueur, profondeur)
+
+
+def verifier(profondeur_max=7, moteurs=None, verbose=True):
+    """Compare perft depuis la position initiale aux valeurs connues, pour
+    chaque moteur. Affiche les feuilles par seconde ; retourne True si
+    toutes les valeurs sont exactes."""
+    if moteurs is None:
+        moteurs = [MOTEUR_REFERENCE] + list(MOTEURS)
+    ok = True
+    for moteur in moteurs:
+        for n in range(1, profondeur_max + 1):
+            t0 = time.perf_counter()
+            feuilles = perft(creer_plateau(), BLANC, n, moteur)
+            dt = time.perf_counter() - t0
+            attendu = PERFT_DEPART.get(n)
+            correct = attendu is None or feuilles == attendu
+            ok = ok and correct
+            if verbose:
+                etat = "?" if attendu is None else ("ok" if correct else f"ÉCHEC (attendu {attendu})")
+                print(f"{moteur:>10s} perft({n}) = {feuilles:>10,d}  {dt:7.2f}s  "
+                      f"{feuilles / max(dt, 1e-9):>12,.0f} feuilles/s  {etat}")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-p", "--profondeur", type=int, default=7)
+    parser.add_argument("--moteur", action="append",
+                        choices=[MOTEUR_REFERENCE] + list(MOTEURS),
+                        help="moteur à vérifier (répétable ; défaut : tous)")
+    args = parser.parse_args()
+    sys.exit(0 if verifier(args.profondeur, args.moteur) else 1)
@@ -0,0 +1,129 @@
+"""
+Othello — Moteur à plateau plat
+===============================
+Représentation du plateau par une seule liste de 64 cases : la case
+(ligne, colonne) est à l'index ``ligne * 8 + colonne``.
+
+Avec les rayons précalculés de othello.RAYONS (index plats), les boucles
+de génération des coups et de retournement n'ont plus ni calcul de
+coordonnées ni test de bornes : une seule indexation par case visitée.
+
+Les fonctions exposent la même interface que leurs homologues de ia.py
+et bitboard.py (``coups_valides_rapide``, ``jouer_coup_rapide``,
+``annuler_coup``) ; les pions retournés sont des index plats.
+"""
+
+from othello import TAILLE, VIDE, NOIR, BLANC, RAYONS
+from bitboard import _zobrist_table, _zobrist_joueur, _zobrist_retournement
+
+# Coup (ligne, colonne) associé à chaque index
+COUPS = [(i // TAILLE, i % TAILLE) for i in range(TAILLE * TAILLE)]
+
+
+# ═══════════════════════════════════════════════════════════════
+# Conversions depuis / vers le plateau en listes
+# ═══════════════════════════════════════════════════════════════
+
+def depuis_plateau(plateau):
+    """Convertit un plateau 8x8 (listes) en plateau plat de 64 cases."""
+    return [case for ligne in plateau for case in ligne]
+
+
+def vers_plateau(plat):
+    """Convertit un plateau plat en plateau 8x8 (listes)."""
+    return [plat[l * TAILLE:(l + 1) * TAILLE] for l in range(TAILLE)]
+
+
+def copier_plateau(plat):
+    """Retourne une copie du plateau plat."""
+    return plat[:]
+
+
+# ═══════════════════════════════════════════════════════════════
+# Génération des coups et retournements
+# ═══════════════════════════════════════════════════════════════
+
+def coups_valides_rapide(plat, joueur):
+    """Équivalent plat de ia.coups_valides_rapide (même ordre de coups)."""
+    adv = 3 - joueur
+    coups = []
+    for i in range(TAILLE * TAILLE):
+        if plat[i] != VIDE:
+            continue
+        for rayon in RAYONS[i]:
+            if plat[rayon[0]] != adv:
+                continue
+            for j in rayon:
+                case = plat[j]
+                if case != adv:
+                    break
+            if case == joueur:
+                coups.append(COUPS[i])
+                break
+    return coups
+
+
+def jouer_coup_rapide(plat, ligne, col, joueur):
+    """Joue un coup en place sur le plateau plat.
+    Retourne la liste des index retournés (pour annuler le coup),
+    ou None si le coup est invalide."""
+    i = ligne * TAILLE + col
+    adv = 3 - joueur
+    pions = []
+    for rayon in RAYONS[i]:
+        if plat[rayon[0]] != adv:
+            continue
+        for k in range(1, len(rayon)):
+            case = plat[rayon[k]]
+            if case != adv:
+                if case == joueur:
+                    pions.extend(rayon[:k])
+                break
+
+    if not pions:
+        return None
+
+    plat[i] = joueur
+    for j in pions:
+        plat[j] = joueur
+    return pions
+
+
+def annuler_coup(plat, ligne, col, joueur, pions_retournes):
+    """Annule un coup joué avec jouer_coup_rapide."""
+    plat[ligne * TAILLE + col] = VIDE
+    adv = 3 - joueur
+    for j in pions_retournes:
+        plat[j] = adv
+
+
+def compter_cases_vides(plat):
+    """Compte le nombre de cases vides."""
+    return plat.count(VIDE)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Hachage de Zobrist
+# ═══════════════════════════════════════════════════════════════
+
+# Tables de bitboard.py (même tirage que ia.py) : un plateau plat et son
+# équivalent en listes ont exactement le même hash.
+
+def zobrist_hash(plat, joueur):
+    """Calcule le hash Zobrist du plateau plat."""
+    h = 0
+    for i, case in enumerate(plat):
+        if case != VIDE:
+            h ^= _zobrist_table[i][case]
+    if joueur == BLANC:
+        h ^= _zobrist_joueur
+    return h
+
+
+def delta_zobrist(ligne, col, joueur, pions_retournes):
+    """Différence de hash (XOR) produite par un coup joué avec jouer_coup_rapide.
+    Le changement de joueur au trait n'est pas inclus."""
+    h = _zobrist_table[ligne * TAILLE + col][joueur]
+    for j in pions_retournes:
+        h ^= _zobrist_retournement[j]
+    return h
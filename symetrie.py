@@ -0,0 +1,185 @@
+"""
+Othello — Symétries du plateau
+==============================
+Le plateau carré a 8 symétries (rotations et miroirs). Deux positions
+symétriques ont la même valeur et des meilleurs coups symétriques : on
+peut donc ne les stocker qu'une fois, sous une forme canonique, celle
+dont le hash Zobrist est le plus petit des 8 transformées.
+
+La transformée s d'un plateau place en T_s(l, c) le contenu de la case
+(l, c) ; un coup (l, c) du plateau d'origine devient le coup T_s(l, c)
+de la transformée, et inversement par T_inverse(s).
+
+Les hashs sont ceux de bitboard.py. Pour la table de transposition, la
+recherche tient à jour les 8 hashs à la fois, empaquetés dans un entier
+de 512 bits (hash_symetrique, delta_symetrique, cle_canonique).
+"""
+
+from othello import TAILLE, VIDE, BLANC
+from bitboard import _zobrist_table, _zobrist_joueur
+
+_N = TAILLE - 1
+
+# Image de la case (l, c) par chaque symétrie
+SYMETRIES = (
+    lambda l, c: (l, c),            # identité
+    lambda l, c: (c, _N - l),       # rotation d'un quart de tour
+    lambda l, c: (_N - l, _N - c),  # demi-tour
+    lambda l, c: (_N - c, l),       # rotation de trois quarts de tour
+    lambda l, c: (l, _N - c),       # miroir gauche / droite
+    lambda l, c: (_N - l, c),       # miroir haut / bas
+    lambda l, c: (c, l),            # diagonale principale
+    lambda l, c: (_N - c, _N - l),  # anti-diagonale
+)
+NB_SYMETRIES = len(SYMETRIES)
+IDENTITE = 0
+
+# PERMUTATIONS[s][i] : index plat de l'image de la case d'index plat i
+PERMUTATIONS = tuple(
+    tuple(l2 * TAILLE + c2 for l2, c2 in (f(i // TAILLE, i % TAILLE) for i in range(TAILLE * TAILLE)))
+    for f in SYMETRIES
+)
+
+# INVERSES[s] : symétrie qui annule s
+INVERSES = tuple(
+    next(t for t in range(NB_SYMETRIES)
+         if all(PERMUTATIONS[t][PERMUTATIONS[s][i]] == i for i in range(TAILLE * TAILLE)))
+    for s in range(NB_SYMETRIES)
+)
+
+# Tables de Zobrist de chaque transformée : _ZOBRIST_SYMETRIE[s][i][couleur]
+# est la clé de la case image de i
+_ZOBRIST_SYMETRIE = tuple(
+    tuple(_zobrist_table[PERMUTATIONS[s][i]] for i in range(TAILLE * TAILLE))
+    for s in range(NB_SYMETRIES)
+)
+
+
+def transformer_case(ligne, col, s):
+    """Image de la case (ligne, col) par la symétrie s."""
+    return SYMETRIES[s](ligne, col)
+
+
+def transformer_coup(coup, s):
+    """Image d'un coup (ligne, col) par la symétrie s ; None reste None."""
+    if coup is None:
+        return None
+    return SYMETRIES[s](coup[0], coup[1])
+
+
+def transformer_plateau(plateau, s):
+    """Transformée du plateau 8x8 (listes) par la symétrie s (nouveau plateau)."""
+    nouveau = [[VIDE] * TAILLE for _ in range(TAILLE)]
+    f = SYMETRIES[s]
+    for l in range(TAILLE):
+        for c in range(TAILLE):
+            l2, c2 = f(l, c)
+            nouveau[l2][c2] = plateau[l][c]
+    return nouveau
+
+
+def hashs_symetriques(plateau, joueur):
+    """Hash Zobrist de chacune des 8 transformées du plateau."""
+    hashs = [0] * NB_SYMETRIES
+    i = 0
+    for ligne in plateau:
+        for case in ligne:
+            if case != VIDE:
+                for s in range(NB_SYMETRIES):
+                    hashs[s] ^= _ZOBRIST_SYMETRIE[s][i][case]
+            i += 1
+    if joueur == BLANC:
+        hashs = [h ^ _zobrist_joueur for h in hashs]
+    return hashs
+
+
+def forme_canonique(plateau, joueur):
+    """Retourne (hash canonique, s) : le plus petit hash des 8 transformées
+    et la symétrie s qui y mène (à la plus petite s en cas d'égalité)."""
+    hashs = hashs_symetriques(plateau, joueur)
+    h = min(hashs)
+    return h, hashs.index(h)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Hashs des 8 transformées empaquetés dans un seul entier
+# ═══════════════════════════════════════════════════════════════
+# Le hash de la transformée s occupe les bits 64 s à 64 s + 63. Un XOR
+# sur l'entier de 512 bits met à jour les 8 hashs à la fois : la
+# recherche le tient à jour exactement comme un hash Zobrist ordinaire
+# (delta par coup, CLE_JOUEUR_8 par changement de trait).
+
+_MASQUE_64 = (1 << 64) - 1
+_DECALAGES = tuple(64 * s for s in range(NB_SYMETRIES))
+
+
+def _empaqueter(cles):
+    """Entier de 512 bits des 8 clés de 64 bits (cles[s] aux bits 64 s)."""
+    h = 0
+    for s in range(NB_SYMETRIES):
+        h |= cles[s] << _DECALAGES[s]
+    return h
+
+
+# _ZOBRIST_8[i][couleur] : clés empaquetées d'un pion de cette couleur en i
+_ZOBRIST_8 = tuple(
+    tuple(_empaqueter([_ZOBRIST_SYMETRIE[s][i][couleur] for s in range(NB_SYMETRIES)])
+          for couleur in range(3))
+    for i in range(TAILLE * TAILLE)
+)
+_RETOURNEMENT_8 = tuple(z[1] ^ z[2] for z in _ZOBRIST_8)
+CLE_JOUEUR_8 = _empaqueter([_zobrist_joueur] * NB_SYMETRIES)
+
+
+def hash_symetrique(plateau, joueur):
+    """Hashs empaquetés des 8 transformées du plateau 8x8 (listes) ;
+    les 64 bits de poids faible sont le hash de bitboard.zobrist_hash."""
+    h = 0
+    i = 0
+    for ligne in plateau:
+        for case in ligne:
+            if case != VIDE:
+                h ^= _ZOBRIST_8[i][case]
+            i += 1
+    if joueur == BLANC:
+        h ^= CLE_JOUEUR_8
+    return h
+
+
+def delta_symetrique(ligne, col, joueur, pions_retournes):
+    """delta_zobrist empaqueté, pions retournés en liste de (ligne, col)."""
+    h = _ZOBRIST_8[ligne * TAILLE + col][joueur]
+    for l, c in pions_retournes:
+        h ^= _RETOURNEMENT_8[l * TAILLE + c]
+    return h
+
+
+def delta_symetrique_bitboard(ligne, col, joueur, retournes):
+    """delta_zobrist empaqueté, pions retournés en masque de bits."""
+    h = _ZOBRIST_8[ligne * TAILLE + col][joueur]
+    while retournes:
+        b = retournes & -retournes
+        h ^= _RETOURNEMENT_8[b.bit_length() - 1]
+        retournes ^= b
+    return h
+
+
+def delta_symetrique_plat(ligne, col, joueur, pions_retournes):
+    """delta_zobrist empaqueté, pions retournés en index plats."""
+    h = _ZOBRIST_8[ligne * TAILLE + col][joueur]
+    for j in pions_retournes:
+        h ^= _RETOURNEMENT_8[j]
+    return h
+
+
+def cle_canonique(h8):
+    """Retourne (hash canonique, s) d'un hash empaqueté : comme
+    forme_canonique, sans reparcourir le plateau."""
+    meilleur = h8 & _MASQUE_64
+    s_min = IDENTITE
+    for s in range(1, NB_SYMETRIES):
+        h = (h8 >> _DECALAGES[s]) & _MASQUE_64
+        if h < meilleur:
+            meilleur = h
+            s_min = s
+    return meilleur, s_min
@@ -0,0 +1,36 @@
+"""Configuration pytest : les modules du jeu sont à la racine du dépôt."""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from othello import creer_plateau, coups_valides, jouer_coup, adversaire, BLANC  # noqa: E402
+
+
+def partie_aleatoire(graine, nb_vides):
+    """Joue des coups au hasard depuis la position initiale jusqu'à ce
+    qu'il reste nb_vides cases vides. Retourne (plateau, joueur au trait),
+    le joueur au trait ayant au moins un coup, ou None si la partie se
+    termine avant."""
+    rng = random.Random(graine)
+    plateau = creer_plateau()
+    joueur = BLANC
+    vides = 60
+    while vides > nb_vides:
+        coups = coups_valides(plateau, joueur)
+        if not coups:
+            joueur = adversaire(joueur)
+            if not coups_valides(plateau, joueur):
+                return None
+            continue
+        l, c = rng.choice(coups)
+        plateau, _ = jouer_coup(plateau, l, c, joueur)
+        joueur = adversaire(joueur)
+        vides -= 1
+    if not coups_valides(plateau, joueur):
+        joueur = adversaire(joueur)
+        if not coups_valides(plateau, joueur):
+            return None
+    return plateau, joueur
@@ -0,0 +1,76 @@
+"""Évaluation : chaque moteur donne les mêmes scores que les listes."""
+
+import random
+
+import pytest
+
+from othello import TAILLE, VIDE, NOIR, BLANC, creer_plateau, adversaire
+from ia import (
+    INF, MOTEURS, FONCTIONS_EVALUATION, COMPOSANTES_LISTE, COMPOSANTES_BITBOARD,
+    COMPOSANTES_INCREMENTALES, MOTEUR_BITBOARD, MOTEUR_INCREMENTAL, _PRIMITIVES_MOTEUR
+)
+
+COMPOSANTES_MOTEUR = {
+    MOTEUR_BITBOARD: COMPOSANTES_BITBOARD,
+    MOTEUR_INCREMENTAL: COMPOSANTES_INCREMENTALES,
+}
+COMPOSANTES = ("positionnelle", "mobilite", "coins", "stabilite", "frontieres", "parite")
+
+
+@pytest.mark.parametrize("moteur", MOTEURS)
+@pytest.mark.parametrize("graine", range(4))
+def test_evaluations_moteur(moteur, graine):
+    p = _PRIMITIVES_MOTEUR[moteur]
+    composantes = COMPOSANTES_MOTEUR.get(moteur)
+    rng = random.Random(graine)
+    etat = p.depuis_plateau(creer_plateau())
+    joueur = BLANC
+    passes = 0
+    while passes < 2:
+        plateau = [ligne[:] for ligne in p.vers_plateau(etat)]
+        assert p.compter_cases_vides(etat) == sum(ligne.count(0) for ligne in plateau)
+        if composantes is not None:
+            for nom in ("compter_pions", "partie_bloquee", "motifs"):
+                assert getattr(composantes, nom)(etat) == getattr(COMPOSANTES_LISTE, nom)(plateau)
+            for nom in COMPOSANTES:
+                assert getattr(composantes, nom)(etat, joueur) == \
+                    getattr(COMPOSANTES_LISTE, nom)(plateau, joueur)
+        for strategie, fn in FONCTIONS_EVALUATION.items():
+            assert p.fonctions_evaluation[strategie](etat, joueur) == fn(plateau, joueur)
+
+        coups = p.coups_valides_rapide(etat, joueur)
+        if coups:
+            passes = 0
+            l, c = rng.choice(coups)
+            p.jouer_coup_rapide(etat, l, c, joueur)
+        else:
+            passes += 1
+        joueur = adversaire(joueur)
+
+
+def _plateau(noirs=(), blancs=()):
+    plateau = [[VIDE] * TAILLE for _ in range(TAILLE)]
+    for l, c in noirs:
+        plateau[l][c] = NOIR
+    for l, c in blancs:
+        plateau[l][c] = BLANC
+    return plateau
+
+
+# Parties terminées avant que le plateau soit plein : (plateau, gagnant)
+PARTIES_FINIES = [
+    (_plateau(noirs=[(3, 3), (3, 4)]), NOIR),                   # Blancs éliminés
+    (_plateau(blancs=[(0, c) for c in range(TAILLE)]), BLANC),  # Noirs éliminés
+    (_plateau(noirs=[(0, 0), (0, 1)], blancs=[(7, 7)]), NOIR),  # Aucun coup possible
+]
+
+
+@pytest.mark.parametrize("moteur", MOTEURS)
+@pytest.mark.parametrize("strategie", FONCTIONS_EVALUATION)
+def test_parties_finies(moteur, strategie):
+    p = _PRIMITIVES_MOTEUR[moteur]
+    evaluer = p.fonctions_evaluation[strategie]
+    for plateau, gagnant in PARTIES_FINIES:
+        etat = p.depuis_plateau(plateau)
+        assert evaluer(etat, gagnant) >= INF - 200
+        assert evaluer(etat, adversaire(gagnant)) <= -INF + 200
@@ -0,0 +1,103 @@
+"""Solveur de fin de partie contre une recherche exhaustive."""
+
+import pytest
+
+from othello import adversaire, coups_valides
+from bitboard import BITS, depuis_plateau, masque_coups, masque_retournements
+from finale import SolveurFinale, FINALE_EXACTE, FINALE_GAIN
+from ia import IAOthello, MOTEURS
+from conftest import partie_aleatoire
+
+
+def _exhaustif(j, a, passe=False):
+    """Différence de pions finale pour le joueur au trait, par minimax
+    sans élagage ni table (référence lente mais évidente)."""
+    coups = masque_coups(j, a)
+    if not coups:
+        if passe:
+            return j.bit_count() - a.bit_count()  # Personne ne peut jouer
+        return -_exhaustif(a, j, True)
+    meilleur = None
+    while coups:
+        bit = coups & -coups
+        coups ^= bit
+        f = masque_retournements(bit, j, a)
+        score = -_exhaustif(a ^ f, j | f | bit)
+        if meilleur is None or score > meilleur:
+            meilleur = score
+    return meilleur
+
+
+def _positions(nb_vides, nb=4):
+    positions = []
+    graine = 0
+    while len(positions) < nb:
+        position = partie_aleatoire(graine, nb_vides)
+        graine += 1
+        if position is not None:
+            positions.append(position)
+    return positions
+
+
+@pytest.mark.parametrize("nb_vides", [4, 7, 10])
+def test_score_exact(nb_vides):
+    for plateau, joueur in _positions(nb_vides):
+        bb = depuis_plateau(plateau)
+        j, a = bb[joueur], bb[adversaire(joueur)]
+        attendu = _exhaustif(j, a)
+        score, coup = SolveurFinale(FINALE_EXACTE).resoudre(j, a)
+        assert score == attendu
+        assert coup in coups_valides(plateau, joueur)
+        # Le coup retenu atteint bien ce score
+        bit = BITS[coup[0] * 8 + coup[1]]
+        f = masque_retournements(bit, j, a)
+        assert -_exhaustif(a ^ f, j | f | bit) == attendu
+
+
+@pytest.mark.parametrize("nb_vides", [6, 9])
+def test_gain_nul_perte(nb_vides):
+    for plateau, joueur in _positions(nb_vides):
+        bb = depuis_plateau(plateau)
+        j, a = bb[joueur], bb[adversaire(joueur)]
+        attendu = _exhaustif(j, a)
+        score, _ = SolveurFinale(FINALE_GAIN).resoudre(j, a)
+        assert score == (attendu > 0) - (attendu < 0)
+
+
+def test_table_reutilisee():
+    """Le même solveur, table de transposition déjà remplie, donne les
+    mêmes scores."""
+    solveur = SolveurFinale(FINALE_EXACTE)
+    positions = _positions(8)
+    premiers = [solveur.resoudre(depuis_plateau(p)[j], depuis_plateau(p)[adversaire(j)])[0]
+                for p, j in positions]
+    seconds = [solveur.resoudre(depuis_plateau(p)[j], depuis_plateau(p)[adversaire(j)])[0]
+               for p, j in positions]
+    assert premiers == seconds
+
+
+@pytest.mark.parametrize("moteur", list(MOTEURS))
+def test_seuils_de_l_ia(moteur):
+    """Sous seuil_finale, l'IA résout la position ; au-dessus, la recherche
+    heuristique s'arrête à profondeur_max, même près de la fin."""
+    plateau, joueur = _positions(8, nb=1)[0]
+    ia = IAOthello(joueur, profondeur_max=3, temps_max=float('inf'), moteur=moteur,
+                   seuil_finale=0, seuil_gain=0)
+    ia.choisir_coup([ligne[:] for ligne in plateau])
+    assert ia.stats['profondeur_atteinte'] == 3
+    assert 'score_finale' not in ia.stats
+
+    ia = IAOthello(joueur, profondeur_max=3, temps_max=float('inf'), moteur=moteur,
+                   seuil_finale=8, seuil_gain=8)
+    coup = ia.choisir_coup([ligne[:] for ligne in plateau])
+    bb = depuis_plateau(plateau)
+    assert ia.stats['score_finale'] == _exhaustif(bb[joueur], bb[adversaire(joueur)])
+    assert coup in coups_valides(plateau, joueur)
+
+
+def test_solveur_sans_temps():
+    plateau, joueur = _positions(10, nb=1)[0]
+    bb = depuis_plateau(plateau)
+    solveur = SolveurFinale(FINALE_EXACTE)
+    assert solveur.resoudre(bb[joueur], bb[adversaire(joueur)], echeance=0) is None
+    assert solveur.meilleur_partiel is None
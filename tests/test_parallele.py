@@ -0,0 +1,156 @@
+"""Recherche parallèle : processus auxiliaires et partage de la racine."""
+
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from conftest import partie_aleatoire
+from othello import creer_plateau, coups_valides, BLANC
+from ia import (
+    IAOthello, ALGO_NEGAMAX, ALGO_MINMAX, ALGO_MCTS, PARALLELE_RACINE, PARALLELE_FEUILLES, INF
+)
+from parallele import DELAI_COLLECTE, _chercher_coup_racine
+
+
+def test_auxiliaire_mort_ne_bloque_pas():
+    ia = IAOthello(BLANC, profondeur_max=20, temps_max=0.3, nb_workers=3,
+                   taille_tt_mo=4)
+    try:
+        plateau = creer_plateau()
+        assert ia.choisir_coup(plateau) is not None
+        assert len(ia.groupe_smp.processus) == 2
+
+        mort = ia.groupe_smp.processus[0]
+        mort.terminate()
+        mort.join()
+
+        debut = time.time()
+        assert ia.choisir_coup(plateau) is not None
+        assert time.time() - debut < ia.temps_max + DELAI_COLLECTE + 0.5
+        assert len(ia.groupe_smp.processus) == 1
+        assert mort not in ia.groupe_smp.processus
+    finally:
+        ia.fermer()
+
+
+def _meilleur_score(plateau, joueur, options):
+    """Meilleur score de la racine, chaque coup cherché en fenêtre complète.
+    Retourne (meilleur score, {coup: score})."""
+    serie = IAOthello(joueur, **options)
+    serie.temps_debut = time.time()
+    scores = {coup: serie.score_coup_racine(plateau, coup, options['profondeur_max'], -INF, INF)
+              for coup in coups_valides(plateau, joueur)}
+    return max(scores.values()), scores
+
+
+class PoolPile:
+    """Pool de partage de la racine qui exécute les tâches une à une, la
+    dernière soumise d'abord : une re-recherche peut ainsi faire monter
+    alpha avant le retour des fenêtres nulles lancées plus tôt."""
+
+    def __init__(self):
+        self.pile = []
+        self.condition = threading.Condition()
+        threading.Thread(target=self._boucle, daemon=True).start()
+
+    def soumettre(self, *tache):
+        future = Future()
+        with self.condition:
+            self.pile.append((future, tache))
+            self.condition.notify()
+        return future
+
+    def _boucle(self):
+        while True:
+            with self.condition:
+                while not self.pile:
+                    self.condition.wait()
+            # Laisse le processus principal soumettre tous les frères
+            time.sleep(0.01)
+            with self.condition:
+                future, tache = self.pile.pop()
+            future.set_result(_chercher_coup_racine(*tache))
+
+    def fermer(self):
+        pass
+
+
+@pytest.mark.parametrize("algorithme", [ALGO_NEGAMAX, ALGO_MINMAX])
+def test_partage_racine_egal_recherche_serie(algorithme):
+    options = dict(profondeur_max=4, temps_max=60.0, algorithme=algorithme,
+                   seuil_finale=0, seuil_gain=0, taille_tt_mo=4)
+    parallele = IAOthello(BLANC, nb_workers=3, parallelisme=PARALLELE_RACINE, **options)
+    try:
+        for graine in range(6):
+            plateau, joueur = partie_aleatoire(graine, 40)
+            if len(coups_valides(plateau, joueur)) < 2:
+                continue
+            meilleur, scores = _meilleur_score(plateau, joueur, options)
+            if algorithme == ALGO_NEGAMAX:
+                serie = IAOthello(joueur, **options)
+                assert scores[serie.choisir_coup(plateau)] == meilleur
+                assert serie.score_racine == meilleur
+
+            parallele.couleur = joueur
+            coup = parallele.choisir_coup(plateau)
+            assert parallele.stats['profondeur_atteinte'] == 4
+            assert parallele.score_racine == meilleur
+            assert scores[coup] == meilleur
+    finally:
+        parallele.fermer()
+
+
+@pytest.mark.parametrize("algorithme", [ALGO_NEGAMAX, ALGO_MINMAX])
+def test_echec_haut_sous_alpha_courant(algorithme):
+    # Graine 10 : un frère échoue haut sur sa fenêtre nulle alors qu'alpha a
+    # déjà dépassé son score ; il doit tout de même être re-cherché
+    options = dict(profondeur_max=4, temps_max=60.0, algorithme=algorithme,
+                   seuil_finale=0, seuil_gain=0, taille_tt_mo=4)
+    plateau, joueur = partie_aleatoire(10, 40)
+    meilleur, scores = _meilleur_score(plateau, joueur, options)
+
+    parallele = IAOthello(joueur, nb_workers=2, parallelisme=PARALLELE_RACINE, **options)
+    parallele.pool_racine = PoolPile()
+    coup = parallele.choisir_coup(plateau)
+    assert parallele.score_racine == meilleur
+    assert scores[coup] == meilleur
+
+
+def test_feuilles_sans_perte_virtuelle_residuelle():
+    ia = IAOthello(BLANC, algorithme=ALGO_MCTS, temps_max=0.5, nb_workers=3,
+                   parallelisme=PARALLELE_FEUILLES)
+    try:
+        plateau, joueur = partie_aleatoire(0, 44)
+        ia.couleur = joueur
+        assert ia.choisir_coup(plateau) in coups_valides(plateau, joueur)
+        racine = ia.arbre_mcts
+        # Seules les simulations revenues sont comptées, une fois chacune
+        assert racine.visites == ia.stats['mcts_simulations'] > 0
+        pile = [racine]
+        while pile:
+            noeud = pile.pop()
+            assert 0 <= noeud.victoires <= noeud.visites
+            assert sum(enfant.visites for enfant in noeud.enfants) <= noeud.visites
+            pile.extend(noeud.enfants)
+    finally:
+        ia.fermer()
+
+
+def test_feuilles_rave_toutes_simulations():
+    ia = IAOthello(BLANC, algorithme=ALGO_MCTS, temps_max=0.5, nb_workers=3,
+                   parallelisme=PARALLELE_FEUILLES, mcts_rave=True)
+    mises_a_jour = []
+    amaf = ia._mcts_amaf
+    ia._mcts_amaf = lambda *args: mises_a_jour.append(amaf(*args))
+    try:
+        plateau, joueur = partie_aleatoire(0, 44)
+        ia.couleur = joueur
+        ia.choisir_coup(plateau)
+        # Toutes les simulations, y compris celles des processus
+        # auxiliaires, mettent à jour les statistiques AMAF
+        assert ia.stats['mcts_simulations'] > ia.stats['mcts_iterations']
+        assert len(mises_a_jour) == ia.stats['mcts_simulations']
+    finally:
+        ia.fermer()
@@ -0,0 +1,20 @@
+"""Génération des coups de chaque moteur contre les valeurs perft connues."""
+
+import pytest
+
+from othello import creer_plateau, BLANC
+from ia import MOTEURS
+from perft import perft, PERFT_DEPART, MOTEUR_REFERENCE
+
+
+@pytest.mark.parametrize("moteur", [MOTEUR_REFERENCE] + list(MOTEURS))
+@pytest.mark.parametrize("profondeur", range(1, 6))
+def test_perft_depart(moteur, profondeur):
+    assert perft(creer_plateau(), BLANC, profondeur, moteur) == PERFT_DEPART[profondeur]
+
+
+@pytest.mark.parametrize("moteur", list(MOTEURS))
+def test_perft_ne_modifie_pas_le_plateau(moteur):
+    plateau = creer_plateau()
+    perft(plateau, BLANC, 3, moteur)
+    assert plateau == creer_plateau()
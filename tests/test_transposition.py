@@ -0,0 +1,70 @@
+"""Lecture / écriture des entrées des tables de transposition."""
+
+import pytest
+
+from transposition import (
+    TableTransposition, TableTranspositionCompacte, TableTranspositionPartagee,
+    TT_EXACT, TT_ALPHA, TT_BETA
+)
+
+# (hash, profondeur, score, type, meilleur coup) ; les scores sont des
+# multiples de 1/256, exactement représentables dans la table compacte
+ENTREES = [
+    (0x0123456789ABCDEF, 7, 12.5, TT_EXACT, (3, 4)),
+    (0xFEDCBA9876543210, 0, -250.0, TT_ALPHA, None),
+    (0x8000000000000001, 255, 999_999.0, TT_BETA, (7, 7)),
+    (0x0000000000000002, 1, -999_999.0, TT_EXACT, (0, 0)),
+    (0x7FFFFFFFFFFFFFFF, 12, 0.00390625, TT_BETA, (0, 7)),
+]
+
+
+@pytest.fixture(params=[TableTransposition, TableTranspositionCompacte,
+                        TableTranspositionPartagee])
+def table(request):
+    t = request.param(1)
+    yield t
+    if hasattr(t, "fermer"):
+        t.fermer()
+
+
+def test_aller_retour(table):
+    for h, profondeur, score, type_borne, coup in ENTREES:
+        table.ecrire(h, profondeur, score, type_borne, coup)
+    for h, profondeur, score, type_borne, coup in ENTREES:
+        assert table.lire(h) == (profondeur, score, type_borne, coup)
+    assert len(table) == len(ENTREES)
+
+
+def test_hash_absent(table):
+    h = ENTREES[0][0]
+    table.ecrire(h, 3, 1.0, TT_EXACT, (2, 3))
+    # Même seau, autre clé
+    assert table.lire(h ^ (1 << 63)) is None
+    assert table.lire(h) is not None
+
+
+def test_remplacement_profondeur(table):
+    """Dans un seau, l'entrée la plus profonde reste ; la plus récente va
+    dans l'emplacement « récent »."""
+    h1 = 5
+    h2 = h1 + table.nb_seaux  # Même seau
+    table.ecrire(h1, 8, 1.0, TT_EXACT, (1, 1))
+    table.ecrire(h2, 2, 2.0, TT_BETA, (2, 2))
+    assert table.lire(h1) == (8, 1.0, TT_EXACT, (1, 1))
+    assert table.lire(h2) == (2, 2.0, TT_BETA, (2, 2))
+
+
+def test_compacte_rejette_entree_corrompue():
+    t = TableTranspositionCompacte(1)
+    h = ENTREES[0][0]
+    t.ecrire(*ENTREES[0])
+    i = (h & t.masque) << 2
+    t.table[i] ^= 1  # Mot de contrôle à moitié écrit
+    assert t.lire(h) is None
+
+
+def test_vider(table):
+    table.ecrire(*ENTREES[0])
+    table.vider()
+    assert table.lire(ENTREES[0][0]) is None
+    assert len(table) == 0
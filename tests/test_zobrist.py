@@ -0,0 +1,62 @@
+"""Hash Zobrist tenu à jour par XOR contre le hash recalculé."""
+
+import random
+
+import pytest
+
+from othello import creer_plateau, adversaire, BLANC
+from ia import MOTEURS, _PRIMITIVES_MOTEUR, _PRIMITIVES_SYMETRIQUES
+
+
+def _verifier_partie(p, graine):
+    """Joue une partie au hasard en mettant le hash à jour coup par coup ;
+    le compare au hash recalculé après chaque coup et après annulation."""
+    rng = random.Random(graine)
+    plateau = p.depuis_plateau(creer_plateau())
+    joueur = BLANC
+    h = p.zobrist_hash(plateau, joueur)
+    passes = 0
+    while passes < 2:
+        coups = p.coups_valides_rapide(plateau, joueur)
+        if not coups:
+            passes += 1
+            h ^= p.cle_joueur
+            joueur = adversaire(joueur)
+            assert h == p.zobrist_hash(plateau, joueur)
+            continue
+        passes = 0
+        # Faire / défaire un coup quelconque redonne le même hash
+        l, c = rng.choice(coups)
+        pions = p.jouer_coup_rapide(plateau, l, c, joueur)
+        h2 = h ^ p.delta_zobrist(l, c, joueur, pions) ^ p.cle_joueur
+        assert h2 == p.zobrist_hash(plateau, adversaire(joueur))
+        p.annuler_coup(plateau, l, c, joueur, pions)
+        assert h == p.zobrist_hash(plateau, joueur)
+
+        l, c = rng.choice(coups)
+        pions = p.jouer_coup_rapide(plateau, l, c, joueur)
+        h ^= p.delta_zobrist(l, c, joueur, pions) ^ p.cle_joueur
+        joueur = adversaire(joueur)
+        assert h == p.zobrist_hash(plateau, joueur)
+
+
+@pytest.mark.parametrize("moteur", list(MOTEURS))
+@pytest.mark.parametrize("graine", range(3))
+def test_hash_incremental(moteur, graine):
+    _verifier_partie(_PRIMITIVES_MOTEUR[moteur], graine)
+
+
+@pytest.mark.parametrize("moteur", list(MOTEURS))
+def test_hash_symetrique_incremental(moteur):
+    _verifier_partie(_PRIMITIVES_SYMETRIQUES[moteur], 0)
+
+
+def test_moteurs_meme_hash():
+    """Les moteurs listes et incrémental partagent leurs clés, bitboard et
+    plat aussi : leurs hashs de la même position sont égaux deux à deux."""
+    plateau = creer_plateau()
+    hashs = {m: _PRIMITIVES_MOTEUR[m].zobrist_hash(_PRIMITIVES_MOTEUR[m].depuis_plateau(plateau),
+                                                    BLANC)
+             for m in MOTEURS}
+    assert hashs["liste"] == hashs["incremental"]
+    assert hashs["bitboard"] == hashs["plat"]
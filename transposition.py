@@ -0,0 +1,231 @@
+"""
+Othello IA — Table de transposition de taille fixe
+==================================================
+Remplace le dictionnaire non borné utilisé auparavant par IAOthello :
+  - Tableau de 2^n seaux, indexé par les bits de poids faible du hash
+  - Deux emplacements par seau :
+      * « profondeur » : conserve l'entrée la plus profonde
+      * « récent »     : toujours remplacé
+  - Compteur de génération : les entrées laissées par les coups
+    précédents restent lisibles mais peuvent être écrasées librement
+  - Taille configurable en mégaoctets
+
+Trois stockages sont disponibles :
+  - TableTransposition : entrées en tuples Python (~256 octets par entrée)
+  - TableTranspositionCompacte : entrées empaquetées dans deux mots de
+    64 bits d'un array('Q') (16 octets par entrée)
+  - TableTranspositionPartagee : même format, dans un segment de mémoire
+    partagée entre processus (recherche parallèle)
+"""
+
+from array import array
+import weakref
+from multiprocessing import shared_memory
+
+# Types d'entrées dans la table de transposition
+TT_EXACT = 0
+TT_ALPHA = 1  # Borne supérieure
+TT_BETA = 2   # Borne inférieure
+
+# Encombrement approximatif d'une entrée en mémoire (tuples Python, clé,
+# score flottant et pointeurs des deux listes de seaux)
+OCTETS_PAR_ENTREE = 256
+
+# Taille par défaut de la table (Mo)
+TAILLE_TT_DEFAUT = 64
+
+# Coup (ligne, colonne) associé à chaque index de case, pour le stockage compact
+_COUPS = [(i >> 3, i & 7) for i in range(64)]
+_AUCUN_COUP = 64
+
+
+class TableTransposition:
+    """Table de transposition bornée à remplacement profondeur / toujours."""
+
+    octets_par_entree = OCTETS_PAR_ENTREE
+
+    def __init__(self, taille_mo=TAILLE_TT_DEFAUT):
+        """
+        Args:
+            taille_mo: mémoire allouée à la table, en mégaoctets
+        """
+        nb_seaux = max(1, int(taille_mo * 1024 * 1024) // (2 * self.octets_par_entree))
+        # Arrondi à la puissance de deux inférieure : l'index est un simple masque
+        nb_seaux = 1 << (nb_seaux.bit_length() - 1)
+        self.taille_mo = taille_mo
+        self.nb_seaux = nb_seaux
+        self.masque = nb_seaux - 1
+        self.generation = 0
+        # Sondes réussies / ratées depuis le début de la recherche courante
+        self.trouves = 0
+        self.manques = 0
+        self.vider()
+
+    def vider(self):
+        """Efface toutes les entrées."""
+        # Entrée : (clé, génération, (profondeur, score, type, meilleur_coup))
+        self.seaux_profondeur = [None] * self.nb_seaux
+        self.seaux_recents = [None] * self.nb_seaux
+
+    def nouvelle_recherche(self):
+        """Passe à la génération suivante (appelé à chaque nouveau coup)."""
+        self.generation = (self.generation + 1) & 0xFF
+        self.trouves = 0
+        self.manques = 0
+
+    def lire(self, h):
+        """Retourne (profondeur, score, type, meilleur_coup) ou None."""
+        i = h & self.masque
+        e = self.seaux_profondeur[i]
+        if e is not None and e[0] == h:
+            self.trouves += 1
+            return e[2]
+        e = self.seaux_recents[i]
+        if e is not None and e[0] == h:
+            self.trouves += 1
+            return e[2]
+        self.manques += 1
+        return None
+
+    def ecrire(self, h, profondeur, score, type_borne, meilleur_coup):
+        """Enregistre une entrée en respectant la politique de remplacement."""
+        i = h & self.masque
+        entree = (h, self.generation, (profondeur, score, type_borne, meilleur_coup))
+        e = self.seaux_profondeur[i]
+        if (e is None or e[0] == h or e[1] != self.generation
+                or profondeur >= e[2][0]):
+            self.seaux_profondeur[i] = entree
+        else:
+            self.seaux_recents[i] = entree
+
+    def __len__(self):
+        """Nombre d'entrées occupées."""
+        return (sum(1 for e in self.seaux_profondeur if e is not None) +
+                sum(1 for e in self.seaux_recents if e is not None))
+
+
+class TableTranspositionCompacte(TableTransposition):
+    """Table de transposition à entrées empaquetées dans un array('Q').
+
+    Chaque emplacement occupe deux mots de 64 bits : ``cle ^ donnees`` puis
+    ``donnees``. La clé n'est donc jamais stockée en clair ; une entrée n'est
+    acceptée que si le XOR des deux mots redonne le hash cherché, ce qui
+    rejette aussi une entrée à moitié écrite.
+
+    Disposition du mot ``donnees`` :
+      - bits  0-31 : score en virgule fixe (1/256) décalé de 2^31
+      - bits 32-39 : profondeur
+      - bits 40-41 : type de borne
+      - bits 42-48 : index du meilleur coup (64 = aucun)
+      - bits 49-56 : génération
+      - bit  57    : emplacement occupé
+    """
+
+    octets_par_entree = 16
+
+    ECHELLE_SCORE = 256
+    _DECALAGE_SCORE = 1 << 31
+    _SCORE_MAX = (1 << 32) - 1
+    _OCCUPE = 1 << 57
+
+    def vider(self):
+        """Efface toutes les entrées."""
+        # Seau i : mots 4i, 4i+1 (emplacement profondeur), 4i+2, 4i+3 (récent)
+        self.table = array('Q', bytes(32 * self.nb_seaux))
+
+    def _decoder(self, d):
+        """Décode un mot de données en (profondeur, score, type, meilleur_coup)."""
+        coup = (d >> 42) & 0x7F
+        return ((d >> 32) & 0xFF,
+                ((d & 0xFFFFFFFF) - self._DECALAGE_SCORE) / self.ECHELLE_SCORE,
+                (d >> 40) & 0x3,
+                _COUPS[coup] if coup != _AUCUN_COUP else None)
+
+    def lire(self, h):
+        """Retourne (profondeur, score, type, meilleur_coup) ou None."""
+        t = self.table
+        i = (h & self.masque) << 2
+        d = t[i + 1]
+        if d and t[i] ^ d == h:
+            self.trouves += 1
+            return self._decoder(d)
+        d = t[i + 3]
+        if d and t[i + 2] ^ d == h:
+            self.trouves += 1
+            return self._decoder(d)
+        self.manques += 1
+        return None
+
+    def ecrire(self, h, profondeur, score, type_borne, meilleur_coup):
+        """Enregistre une entrée en respectant la politique de remplacement."""
+        s = int(round(score * self.ECHELLE_SCORE)) + self._DECALAGE_SCORE
+        s = min(max(s, 0), self._SCORE_MAX)
+        coup = (_AUCUN_COUP if meilleur_coup is None
+                else meilleur_coup[0] * 8 + meilleur_coup[1])
+        d = (self._OCCUPE | (self.generation << 49) | (coup << 42) |
+             (type_borne << 40) | (min(profondeur, 0xFF) << 32) | s)
+
+        t = self.table
+        i = (h & self.masque) << 2
+        d0 = t[i + 1]
+        if (not d0 or t[i] ^ d0 == h or (d0 >> 49) & 0xFF != self.generation
+                or profondeur >= (d0 >> 32) & 0xFF):
+            t[i] = h ^ d
+            t[i + 1] = d
+        else:
+            t[i + 2] = h ^ d
+            t[i + 3] = d
+
+    def __len__(self):
+        """Nombre d'entrées occupées."""
+        t = self.table
+        return sum(1 for k in range(1, len(t), 2) if t[k])
+
+
+def _liberer_segment(segment, vue, proprietaire):
+    """Détache un segment de mémoire partagée (et le détruit s'il a été créé ici)."""
+    vue.release()
+    segment.close()
+    if proprietaire:
+        segment.unlink()
+
+
+class TableTranspositionPartagee(TableTranspositionCompacte):
+    """Table compacte stockée dans un segment multiprocessing.shared_memory.
+
+    Utilisée par la recherche parallèle (Lazy SMP) : tous les processus
+    lisent et écrivent le même tableau sans verrou. Une entrée écrite à
+    moitié par un autre processus est rejetée par le contrôle XOR de
+    TableTranspositionCompacte.lire, comme une entrée absente.
+    """
+
+    def __init__(self, taille_mo=TAILLE_TT_DEFAUT, nom=None):
+        """
+        Args:
+            taille_mo: mémoire allouée à la table, en mégaoctets
+            nom: nom d'un segment existant à rattacher (None : le segment
+                 est créé, et détruit par fermer())
+        """
+        self.nom = nom
+        self.segment = None
+        super().__init__(taille_mo)
+
+    def vider(self):
+        """Efface toutes les entrées."""
+        if self.segment is not None:
+            self.segment.buf[:] = bytes(len(self.segment.buf))
+            return
+        proprietaire = self.nom is None
+        if proprietaire:
+            self.segment = shared_memory.SharedMemory(create=True, size=32 * self.nb_seaux)
+        else:
+            self.segment = shared_memory.SharedMemory(name=self.nom)
+        self.nom = self.segment.name
+        self.table = self.segment.buf.cast('Q')
+        # Libération garantie même si fermer() n'est jamais appelé
+        self._finaliseur = weakref.finalize(self, _liberer_segment, self.segment,
+                                            self.table, proprietaire)
+
+    def fermer(self):
+        """Détache le segment (et le détruit si cette table l'a créé)."""
+        self._finaliseur()
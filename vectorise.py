@@ -0,0 +1,379 @@
+"""
+Othello IA — Évaluation vectorisée par lots (NumPy)
+===================================================
+Évalue N plateaux en un appel : les plateaux forment un tableau int8 de
+forme (N, 8, 8) (VIDE = 0, NOIR = 1, BLANC = 2) et chaque composante de
+l'évaluation est calculée pour tout le lot par opérations de tableaux :
+  - Poids positionnels : produit terme à terme avec POIDS_POSITION, puis
+    correction des cases X / C dont le coin appartient au même joueur
+  - Mobilité : propagation par décalages de masques dans les 8 directions
+    (comme les bitboards, sans débordement d'un bord à l'autre)
+  - Frontières : voisinage des cases vides par décalages (convolution 3x3)
+  - Stabilité : algorithme de bitboard.pions_stables sur des tableaux de
+    bitboards uint64 (tables de bord indexées, propagation par décalages)
+
+simuler_lot joue de même N simulations MCTS (ia.simuler_partie) en
+parallèle, un demi-coup de toutes les parties par passage.
+
+Les scores sont identiques à ceux des fonctions de FONCTIONS_EVALUATION
+appelées plateau par plateau. Utile pour noter des milliers de positions
+(simulations MCTS, analyses du benchmark) ; la recherche alpha-bêta, qui
+évalue une feuille à la fois, garde les fonctions de ia.py.
+
+NumPy est une dépendance optionnelle : sans lui, ce module s'importe mais
+evaluer_lot et simuler_lot lèvent ImportError.
+"""
+
+from ia import (
+    INF, POIDS_POSITION, COINS, COIN_ADJACENTES, FONCTIONS_EVALUATION,
+    STRAT_POSITIONNEL, STRAT_ABSOLU, STRAT_MOBILITE, STRAT_MIXTE,
+    _COINS_SIMULATION, _SURES_SIMULATION
+)
+from othello import TAILLE, VIDE, NOIR, BLANC, DIRECTIONS
+import random
+import bitboard
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel
+    np = None
+
+NUMPY_DISPONIBLE = np is not None
+
+if NUMPY_DISPONIBLE:
+    _POIDS = np.array(POIDS_POSITION, dtype=np.float64)
+
+    # Cases X / C, poids d'origine et coin associé (ajustement positionnel)
+    _ADJ = [(case, coin) for coin in COINS for case in COIN_ADJACENTES[coin]]
+    _ADJ_L = np.array([case[0] for case, _ in _ADJ])
+    _ADJ_C = np.array([case[1] for case, _ in _ADJ])
+    _COIN_L = np.array([coin[0] for _, coin in _ADJ])
+    _COIN_C = np.array([coin[1] for _, coin in _ADJ])
+    _CORRECTION_ADJ = np.array([abs(POIDS_POSITION[l][c]) - POIDS_POSITION[l][c]
+                                for (l, c), _ in _ADJ], dtype=np.float64)
+
+    # Stabilité : tables et masques de bitboard.py en uint64
+    _ZERO = np.uint64(0)
+    _POIDS_BITS = np.uint64(1) << np.arange(TAILLE * TAILLE, dtype=np.uint64)
+    _STABLES_BORD = np.array(bitboard._STABLES_BORD, dtype=np.uint64)
+    _OCTET_VERS_COLONNE = np.array(bitboard._OCTET_VERS_COLONNE, dtype=np.uint64)
+    _COLONNE_0 = np.uint64(bitboard._COLONNE_0)
+    _MAGIQUE_COLONNE = np.uint64(bitboard._MAGIQUE_COLONNE)
+    _LIGNES_H, _LIGNES_V, _LIGNES_D7, _LIGNES_D9 = (
+        [np.uint64(m) for m in lignes] for lignes in
+        (bitboard._LIGNES_H, bitboard._LIGNES_V, bitboard._LIGNES_D7, bitboard._LIGNES_D9))
+
+    # Simulations : (sens du décalage, décalage, masque des cases d'arrivée)
+    # pour les 8 directions, et classes de cases de la politique de ia.py
+    _DIRECTIONS_BITS = [
+        (gauche, np.uint64(d), np.uint64(m)) for gauche, d, m in (
+            (True, 1, bitboard._SANS_COL0), (False, 1, bitboard._SANS_COL7),
+            (True, 8, bitboard.PLEIN), (False, 8, bitboard.PLEIN),
+            (True, 9, bitboard._SANS_COL0), (False, 9, bitboard._SANS_COL7),
+            (True, 7, bitboard._SANS_COL7), (False, 7, bitboard._SANS_COL0))
+    ]
+    _COINS_SIM = np.uint64(_COINS_SIMULATION)
+    _SURES_SIM = np.uint64(_SURES_SIMULATION)
+
+
+def depuis_plateaux(plateaux):
+    """Empile des plateaux 8x8 (listes) en un tableau int8 (N, 8, 8)."""
+    _verifier_numpy()
+    return np.array(plateaux, dtype=np.int8).reshape(-1, TAILLE, TAILLE)
+
+
+def _verifier_numpy():
+    """Lève ImportError si NumPy n'est pas installé."""
+    if not NUMPY_DISPONIBLE:
+        raise ImportError("l'évaluation par lots nécessite NumPy (pip install numpy)")
+
+
+# ═══════════════════════════════════════════════════════════════
+# Composantes
+# ═══════════════════════════════════════════════════════════════
+
+def _decaler(m, dl, dc):
+    """Décale les masques (N, 8, 8) de (dl, dc) : r[l, c] = m[l - dl, c - dc],
+    les cases venant de l'extérieur du plateau valant False."""
+    r = np.zeros_like(m)
+    l0, l1 = max(dl, 0), TAILLE + min(dl, 0)
+    c0, c1 = max(dc, 0), TAILLE + min(dc, 0)
+    r[:, l0:l1, c0:c1] = m[:, l0 - dl:l1 - dl, c0 - dc:c1 - dc]
+    return r
+
+
+def _nb_coups(mien, adv, vides):
+    """Nombre de coups valides de chaque plateau du lot."""
+    coups = np.zeros_like(mien)
+    for dl, dc in DIRECTIONS:
+        # Pions adverses encadrables depuis un pion du joueur dans cette
+        # direction (au plus 6 entre deux cases du plateau)
+        t = _decaler(mien, dl, dc) & adv
+        for _ in range(5):
+            t |= _decaler(t, dl, dc) & adv
+        coups |= _decaler(t, dl, dc) & vides
+    return coups.sum(axis=(1, 2))
+
+
+def _positionnel(plateaux, mien, adv):
+    """eval_positionnelle pour tout le lot."""
+    signe = mien.astype(np.int8) - adv.astype(np.int8)
+    score = (signe * _POIDS).sum(axis=(1, 2))
+    # Case X / C dont le coin appartient au même joueur : poids positif
+    cases = plateaux[:, _ADJ_L, _ADJ_C]
+    meme_coin = (cases != VIDE) & (cases == plateaux[:, _COIN_L, _COIN_C])
+    return score + (signe[:, _ADJ_L, _ADJ_C] * meme_coin * _CORRECTION_ADJ).sum(axis=1)
+
+
+def _rapport(a, b, facteur):
+    """facteur * (a - b) / (a + b), 0 si a + b == 0."""
+    total = a + b
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = facteur * (a - b) / total
+    return np.where(total == 0, 0.0, r)
+
+
+def _coins(mien, adv):
+    """eval_coins pour tout le lot."""
+    score = np.zeros(len(mien), dtype=np.int64)
+    for l, c in COINS:
+        score += mien[:, l, c].astype(np.int64) - adv[:, l, c]
+    return score * 250
+
+
+def _frontieres(mien, adv, vides):
+    """eval_frontieres pour tout le lot."""
+    pres_du_vide = np.zeros_like(vides)
+    for dl, dc in DIRECTIONS:
+        pres_du_vide |= _decaler(vides, dl, dc)
+    front_j = (mien & pres_du_vide).sum(axis=(1, 2))
+    front_a = (adv & pres_du_vide).sum(axis=(1, 2))
+    return _rapport(front_j, front_a, -100)
+
+
+def _bits(m):
+    """Masques (N, 8, 8) → bitboards uint64 (bit l * 8 + c = case (l, c))."""
+    return (m.reshape(len(m), TAILLE * TAILLE) * _POIDS_BITS).sum(axis=1, dtype=np.uint64)
+
+
+def _nb_bits(x):
+    """Nombre de bits à 1 de chaque bitboard uint64."""
+    return np.unpackbits(x.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1, dtype=np.int64)
+
+
+def _lignes_pleines(occupes, lignes):
+    """bitboard._lignes_pleines pour tout le lot."""
+    pleines = np.zeros_like(occupes)
+    for m in lignes:
+        pleines |= np.where(occupes & m == m, m, _ZERO)
+    return pleines
+
+
+def _colonne(bits, c):
+    """bitboard._colonne pour tout le lot (produit modulo 2^64)."""
+    return (((bits >> np.uint64(c)) & _COLONNE_0) * _MAGIQUE_COLONNE) >> np.uint64(56)
+
+
+def _pions_stables(joueur, adv):
+    """bitboard.pions_stables pour tout le lot (bitboards uint64) : mêmes
+    tables de bord et même propagation, menée jusqu'à ce qu'aucun plateau
+    du lot ne gagne de pion stable."""
+    u = np.uint64
+    occupes = joueur | adv
+    sur_h = _lignes_pleines(occupes, _LIGNES_H) | u(bitboard._BORD_H)
+    sur_v = _lignes_pleines(occupes, _LIGNES_V) | u(bitboard._BORD_V)
+    sur_d7 = _lignes_pleines(occupes, _LIGNES_D7) | u(bitboard._BORDS)
+    sur_d9 = _lignes_pleines(occupes, _LIGNES_D9) | u(bitboard._BORDS)
+
+    def bord(j, a):
+        return _STABLES_BORD[((j << u(8)) | a).astype(np.intp)]
+
+    octet = u(0xFF)
+    stable = (
+        bord(joueur & octet, adv & octet) |
+        bord(joueur >> u(56), adv >> u(56)) << u(56) |
+        _OCTET_VERS_COLONNE[bord(_colonne(joueur, 0), _colonne(adv, 0)).astype(np.intp)] |
+        _OCTET_VERS_COLONNE[bord(_colonne(joueur, 7), _colonne(adv, 7)).astype(np.intp)] << u(7)
+    ) & joueur
+
+    sans_col0, sans_col7 = u(bitboard._SANS_COL0), u(bitboard._SANS_COL7)
+    candidats = joueur & ~u(bitboard._BORDS)
+    stable |= candidats & sur_h & sur_v & sur_d7 & sur_d9
+    while True:
+        nouveaux = candidats & ~stable
+        nouveaux &= sur_h | (stable << u(1) & sans_col0) | (stable >> u(1) & sans_col7)
+        nouveaux &= sur_v | stable << u(8) | stable >> u(8)
+        nouveaux &= sur_d9 | (stable << u(9) & sans_col0) | (stable >> u(9) & sans_col7)
+        nouveaux &= sur_d7 | (stable << u(7) & sans_col7) | (stable >> u(7) & sans_col0)
+        if not nouveaux.any():
+            return _nb_bits(stable)
+        stable |= nouveaux
+
+
+def _stabilite(mien, adv):
+    """eval_stabilite pour tout le lot."""
+    mien, adv = _bits(mien), _bits(adv)
+    return _rapport(_pions_stables(mien, adv), _pions_stables(adv, mien), 100)
+
+
+# ═══════════════════════════════════════════════════════════════
+# Stratégies
+# ═══════════════════════════════════════════════════════════════
+
+def _par_phase(total, ouverture, milieu, fin):
+    """Choisit le score de chaque plateau selon la phase (nombre de pions)."""
+    return np.where(total <= 20, ouverture, np.where(total <= 50, milieu, fin))
+
+
+def evaluer_lot(plateaux, joueur, strategie=STRAT_MIXTE):
+    """Évalue un lot de plateaux pour la stratégie donnée.
+
+    Args:
+        plateaux: tableau (N, 8, 8) d'entiers (voir depuis_plateaux)
+        joueur: joueur du point de vue duquel on évalue, commun à tout le
+                lot ou tableau de N joueurs
+        strategie: clé de FONCTIONS_EVALUATION
+
+    Retourne un tableau de N scores (float64), égaux à ceux de
+    FONCTIONS_EVALUATION[strategie](plateau, joueur).
+    """
+    _verifier_numpy()
+    plateaux = np.asarray(plateaux, dtype=np.int8).reshape(-1, TAILLE, TAILLE)
+    joueur = np.broadcast_to(np.asarray(joueur, dtype=np.int8), (len(plateaux),))
+    j = joueur[:, None, None]
+    mien = plateaux == j
+    adv = plateaux == (NOIR + BLANC - j)
+    vides = plateaux == VIDE
+
+    nb_mien = mien.sum(axis=(1, 2))
+    nb_adv = adv.sum(axis=(1, 2))
+    total = nb_mien + nb_adv
+    diff = nb_mien - nb_adv
+
+    # Partie terminée : plus de case vide ou aucun coup pour les deux joueurs
+    nb_coups_j = _nb_coups(mien, adv, vides)
+    nb_coups_a = _nb_coups(adv, mien, vides)
+    terminee = (total == 64) | ((nb_coups_j == 0) & (nb_coups_a == 0))
+    score_final = np.where(diff > 0, INF - 100 + diff,
+                           np.where(diff < 0, -INF + 100 - diff, 0)).astype(np.float64)
+
+    parite = np.where((64 - total) % 2 == 0, 10, -10)
+    mobilite = _rapport(nb_coups_j, nb_coups_a, 100)
+    coins = _coins(mien, adv)
+
+    if strategie == STRAT_ABSOLU:
+        score = diff * 10.0 + coins * 5.0
+    elif strategie == STRAT_POSITIONNEL:
+        positionnel = _positionnel(plateaux, mien, adv)
+        score = _par_phase(
+            total,
+            positionnel * 5.0 + coins * 10.0,
+            positionnel * 3.0 + coins * 15.0 + _stabilite(mien, adv) * 2.0,
+            positionnel * 1.0 + coins * 20.0 + diff * 5.0,
+        )
+    elif strategie == STRAT_MOBILITE:
+        frontieres = _frontieres(mien, adv, vides)
+        score = _par_phase(
+            total,
+            mobilite * 8.0 + frontieres * 3.0 + coins * 5.0,
+            mobilite * 6.0 + coins * 8.0 + frontieres * 2.0,
+            mobilite * 2.0 + diff * 8.0 + coins * 10.0,
+        )
+    elif strategie == STRAT_MIXTE:
+        positionnel = _positionnel(plateaux, mien, adv)
+        frontieres = _frontieres(mien, adv, vides)
+        stabilite = _stabilite(mien, adv)
+        score = _par_phase(
+            total,
+            positionnel * 1.0 + mobilite * 5.0 + coins * 10.0 + frontieres * 2.0,
+            (positionnel * 0.5 + mobilite * 4.0 + coins * 15.0 + stabilite * 3.0 +
+             frontieres * 1.5 + parite * 1.0),
+            diff * 10.0 + coins * 20.0 + stabilite * 5.0 + parite * 3.0,
+        )
+    else:
+        # Stratégie sans version vectorisée : évaluation plateau par plateau
+        fn = FONCTIONS_EVALUATION[strategie]
+        return np.array([fn(p.tolist(), int(jj)) for p, jj in zip(plateaux, joueur)],
+                        dtype=np.float64)
+
+    return np.where(terminee, score_final, score)
+
+
+def evaluer_lot_toutes(plateaux, joueur):
+    """Évalue le lot pour chaque stratégie de FONCTIONS_EVALUATION :
+    {strategie: scores}."""
+    return {strategie: evaluer_lot(plateaux, joueur, strategie)
+            for strategie in FONCTIONS_EVALUATION}
+
+
+# ═══════════════════════════════════════════════════════════════
+# Simulations MCTS par lots
+# ═══════════════════════════════════════════════════════════════
+
+def _decaler_bits(x, gauche, d, m):
+    """Décale les bitboards d'une case dans une direction (sans débordement)."""
+    return ((x << d) if gauche else (x >> d)) & m
+
+
+def _masque_coups(joueur, adv):
+    """bitboard.masque_coups pour tout le lot."""
+    coups = np.zeros_like(joueur)
+    for sens in _DIRECTIONS_BITS:
+        t = _decaler_bits(joueur, *sens) & adv
+        for _ in range(5):
+            t |= _decaler_bits(t, *sens) & adv
+        coups |= _decaler_bits(t, *sens)
+    return coups & ~(joueur | adv)
+
+
+def _retournements(bit, joueur, adv):
+    """bitboard.masque_retournements pour tout le lot (un coup par plateau)."""
+    retournes = np.zeros_like(joueur)
+    for sens in _DIRECTIONS_BITS:
+        x = _decaler_bits(bit, *sens) & adv
+        for _ in range(5):
+            x |= _decaler_bits(x, *sens) & adv
+        retournes |= np.where(_decaler_bits(x, *sens) & joueur != _ZERO, x, _ZERO)
+    return retournes
+
+
+def simuler_lot(noirs, blancs, joueur, couleur, nb):
+    """nb simulations depuis la même position (bitboards noirs / blancs,
+    joueur au trait), avec la politique de ia.simuler_partie : coin jouable,
+    sinon coup hors cases X / C, sinon n'importe quel coup, le premier à
+    partir d'une case tirée au hasard. Retourne la somme des résultats du
+    point de vue de couleur (1 par victoire, 0.5 par nul)."""
+    _verifier_numpy()
+    u = np.uint64
+    # Graine tirée du générateur de random : random.seed() suffit à rendre
+    # les processus auxiliaires indépendants
+    rng = np.random.default_rng(random.getrandbits(64))
+    mien = np.full(nb, noirs if joueur == NOIR else blancs, dtype=np.uint64)
+    adv = np.full(nb, blancs if joueur == NOIR else noirs, dtype=np.uint64)
+    noir_au_trait = np.full(nb, joueur == NOIR)
+    passes = np.zeros(nb, dtype=np.int8)
+
+    while True:
+        coups = _masque_coups(mien, adv)
+        joue = coups != _ZERO
+        passes = np.where(joue, 0, passes + 1)
+        if (passes >= 2).all():
+            break
+        m = coups & _COINS_SIM
+        m = np.where(m != _ZERO, m, coups & _SURES_SIM)
+        m = np.where(m != _ZERO, m, coups)
+        # Premier coup après une rotation de r bits, puis rotation inverse
+        r = rng.integers(0, 64, nb, dtype=np.uint64)
+        t = (m >> r) | (m << ((u(64) - r) & u(63)))
+        t &= ~t + u(1)
+        bit = (t << r) | (t >> ((u(64) - r) & u(63)))
+        retournes = _retournements(bit, mien, adv)
+        # Le joueur suivant devient « mien » (aussi en cas de passe)
+        mien, adv = (np.where(joue, adv ^ retournes, adv),
+                     np.where(joue, mien | retournes | bit, mien))
+        noir_au_trait = ~noir_au_trait
+
+    nb_noirs = _nb_bits(np.where(noir_au_trait, mien, adv))
+    nb_blancs = _nb_bits(np.where(noir_au_trait, adv, mien))
+    ecart = nb_noirs - nb_blancs if couleur == NOIR else nb_blancs - nb_noirs
+    return float((ecart > 0).sum() + 0.5 * (ecart == 0).sum())